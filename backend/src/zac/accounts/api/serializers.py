@@ -23,6 +23,7 @@ from zac.core.services import (
 )
 from zgw.models.zrc import Zaak
 
+from ..cache import bump_permissions_version
 from ..constants import (
     AccessRequestResult,
     PermissionObjectTypeChoices,
@@ -461,6 +462,8 @@ class HandleAccessRequestSerializer(serializers.HyperlinkedModelSerializer):
                     )
                 )
             UserAtomicPermission.objects.bulk_create(user_atomic_permissions)
+            # bulk_create doesn't send the signals
+            bump_permissions_version()
 
         # send email
         request = self.context.get("request")
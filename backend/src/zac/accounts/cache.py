@@ -0,0 +1,38 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+PERMISSIONS_VERSION_KEY = "permissions_version"
+
+
+def _initial_version() -> int:
+    # a version that was not used before, in case the counter was evicted
+    return int(time.time() * 1000)
+
+
+def get_permissions_version() -> int:
+    """
+    Return the version of the permissions, which changes with every permission change.
+
+    Use it in the keys of cached values that are derived from the permissions.
+    """
+    return cache.get_or_set(PERMISSIONS_VERSION_KEY, _initial_version, None)
+
+
+def _bump_permissions_version() -> None:
+    try:
+        cache.incr(PERMISSIONS_VERSION_KEY)
+    except ValueError:
+        cache.set(PERMISSIONS_VERSION_KEY, _initial_version(), None)
+
+
+def bump_permissions_version() -> None:
+    """
+    Invalidate the values cached for the current permissions.
+
+    The version is bumped again when the transaction is committed, so values cached
+    by other requests before the commit are invalidated as well.
+    """
+    _bump_permissions_version()
+    transaction.on_commit(_bump_permissions_version)
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional, Type
+from typing import List, Optional, Type
 
 from django.core.exceptions import ImproperlyConfigured
 from django.utils.html import format_html
@@ -39,6 +39,21 @@ class Blueprint(Serializer):
     def search_query(self, on_nested_field: Optional[str] = "") -> Query:
         raise NotImplementedError("This method must be implemented by a subclass")
 
+    @classmethod
+    def search_queries(
+        cls, policies: List[dict], on_nested_field: Optional[str] = ""
+    ) -> list:
+        """
+        Return the search queries of the blueprints with these policies.
+
+        Access is granted if any of the queries matches. Subclasses can combine the
+        policies into fewer queries.
+        """
+        return [
+            cls(policy).search_query(on_nested_field=on_nested_field)
+            for policy in policies
+        ]
+
     def short_display(self) -> str:
         return "-"
 
@@ -0,0 +1,52 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import bump_permissions_version
+from .models import (
+    ApplicationToken,
+    ApplicationTokenAuthorizationProfile,
+    AtomicPermission,
+    AuthorizationProfile,
+    BlueprintPermission,
+    Role,
+    User,
+    UserAtomicPermission,
+    UserAuthorizationProfile,
+)
+
+PERMISSION_MODELS = (
+    ApplicationToken,
+    ApplicationTokenAuthorizationProfile,
+    AtomicPermission,
+    AuthorizationProfile,
+    BlueprintPermission,
+    Role,
+    UserAtomicPermission,
+    UserAuthorizationProfile,
+)
+
+
+def bump_permissions_version_on_change(sender, **kwargs):
+    bump_permissions_version()
+
+
+for model in PERMISSION_MODELS:
+    post_save.connect(
+        bump_permissions_version_on_change,
+        sender=model,
+        dispatch_uid=f"permissions_version_post_save_{model._meta.label_lower}",
+    )
+    post_delete.connect(
+        bump_permissions_version_on_change,
+        sender=model,
+        dispatch_uid=f"permissions_version_post_delete_{model._meta.label_lower}",
+    )
+
+
+@receiver(m2m_changed, sender=AuthorizationProfile.blueprint_permissions.through)
+@receiver(m2m_changed, sender=User.auth_profiles.through)
+@receiver(m2m_changed, sender=User.atomic_permissions.through)
+@receiver(m2m_changed, sender=ApplicationToken.auth_profiles.through)
+def bump_permissions_version_on_m2m_change(sender, action: str, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        bump_permissions_version()
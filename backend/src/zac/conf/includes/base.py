@@ -561,6 +561,35 @@ ELASTICSEARCH_DSL = {
 ES_INDEX_ZAKEN = "zaken"
 ES_INDEX_DOCUMENTEN = "documenten"
 ES_INDEX_OBJECTEN = "objecten"
+ES_INDEX_PERMISSIONS = "permissions"
+# Refresh policy for the writes to ES: "none", "wait_for" or "batched" - see
+# zac.elasticsearch.refresh. The batched refresh runs every ES_REFRESH_INTERVAL ms.
+ES_REFRESH_POLICY = config("ES_REFRESH_POLICY", default="none")
+ES_REFRESH_INTERVAL = config("ES_REFRESH_INTERVAL", default=1000)
+# Read zaken from the zaken index instead of the ZRC - see zac.elasticsearch.read_model
+ES_READ_MODEL = config("ES_READ_MODEL", default=False)
+# Seconds the zaken that ZAC changed are read from the ZRC, until the notifications
+# about the change have updated their documents
+ES_READ_MODEL_WRITE_TIMEOUT = config("ES_READ_MODEL_WRITE_TIMEOUT", default=60)
+# Number of hits that are counted exactly for the paginated searches, larger totals
+# are reported as this number. Counting every hit is slower for large results.
+ES_TRACK_TOTAL_HITS = config("ES_TRACK_TOTAL_HITS", default=10000)
+# Seconds the compiled permission filters of the searches are cached, permission
+# changes invalidate them immediately.
+ES_PERMISSION_QUERY_CACHE_TIMEOUT = config(
+    "ES_PERMISSION_QUERY_CACHE_TIMEOUT", default=60 * 60
+)
+# Atomic permissions for more objects than this are looked up from the permissions
+# index by the permission filters, instead of being listed in the query.
+ES_PERMISSION_TERMS_LOOKUP_THRESHOLD = config(
+    "ES_PERMISSION_TERMS_LOOKUP_THRESHOLD", default=1000
+)
+# Pages beyond the max result window of the indices are retrieved with search_after
+ES_MAX_RESULT_WINDOW = config("ES_MAX_RESULT_WINDOW", default=10000)
+# Number of zaken that are retrieved at once for the exports of the searches
+ES_EXPORT_BATCH_SIZE = config("ES_EXPORT_BATCH_SIZE", default=1000)
+# Max number of values that are counted per facet of the searches
+ES_FACET_SIZE = config("ES_FACET_SIZE", default=100)
 # USED FOR INDEXING EDGE NGRAM ANALYZER
 MAX_GRAM = config("MAX_GRAM", 16)
 MIN_GRAM = config("MIN_GRAM", 3)
@@ -590,3 +619,11 @@ UI_ROOT_URL = config("UI_ROOT_URL", default="/ui")
 CREATE_ZAAK_PROCESS_DEFINITION_KEY = config(
     "CREATE_ZAAK_PROCESS_DEFINITION_KEY", default="zaak_aanmaken"
 )
+
+# Accept notifications into the notification queue instead of handling them in the
+# webhook request. The queue is processed by the ``process_notifications`` command.
+NOTIFICATIONS_QUEUE = config("NOTIFICATIONS_QUEUE", default=False)
+
+# Append the received notifications to this file, to replay them with the
+# ``replay_notifications`` command.
+NOTIFICATIONS_CAPTURE_FILE = config("NOTIFICATIONS_CAPTURE_FILE", default="")
@@ -0,0 +1,32 @@
+from typing import List
+
+from rest_framework.response import Response
+
+from zac.core.api.pagination import BffPagination
+
+
+class BoardItemPagination(BffPagination):
+    """
+    Paginate the board items before they're checked for permissions.
+
+    Only the items of the page are checked, so a page can hold fewer items than the
+    page size. The number of items the requester is allowed to see isn't known, so
+    no ``count`` is returned.
+    """
+
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def get_paginated_response(self, data: List[dict]) -> Response:
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        schema = super().get_paginated_response_schema(schema)
+        del schema["properties"]["count"]
+        return schema
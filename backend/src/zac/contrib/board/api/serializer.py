@@ -1,3 +1,4 @@
+from django.db.models import Manager
 from django.utils.translation import ugettext_lazy as _
 
 from rest_framework import serializers
@@ -25,6 +26,13 @@ class BoardSerializer(serializers.HyperlinkedModelSerializer):
         }
 
 
+class BoardItemListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        items = list(data.all() if isinstance(data, Manager) else data)
+        BoardItem.prefetch_zaak_documents(items)
+        return super().to_representation(items)
+
+
 class BoardItemSerializer(serializers.HyperlinkedModelSerializer):
     board = BoardSerializer(
         source="column.board", read_only=True, help_text=_("Board of the item")
@@ -43,6 +51,7 @@ class BoardItemSerializer(serializers.HyperlinkedModelSerializer):
 
     class Meta:
         model = BoardItem
+        list_serializer_class = BoardItemListSerializer
         fields = (
             "url",
             "uuid",
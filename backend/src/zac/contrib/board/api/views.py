@@ -7,6 +7,7 @@ from rest_framework.viewsets import ModelViewSet, ReadOnlyModelViewSet
 
 from ..models import Board, BoardItem
 from .filters import BoardItemFilter
+from .pagination import BoardItemPagination
 from .permissions import CanForceUseBoardItem, CanUseBoardItem
 from .serializer import BoardItemSerializer, BoardSerializer
 
@@ -39,12 +40,15 @@ class BoardItemViewSet(ModelViewSet):
     )
     serializer_class = BoardItemSerializer
     filterset_class = BoardItemFilter
+    pagination_class = BoardItemPagination
     lookup_field = "uuid"
 
-    def get_queryset(self):
-        base = super().get_queryset()
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
 
-        if self.action != "list":
-            return base
+        # check the permissions for the requested page only
+        page = self.paginate_queryset(queryset)
+        items = BoardItem.filter_allowed(page, request)
 
-        return base.for_user(self.request)
+        serializer = self.get_serializer(items, many=True)
+        return self.get_paginated_response(serializer.data)
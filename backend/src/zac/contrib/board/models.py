@@ -1,12 +1,17 @@
 import uuid
+from typing import Iterable, List
 
 from django.db import models
 from django.utils.translation import ugettext_lazy as _
 
-from zac.elasticsearch.api import get_zaak_document
+from zac.elasticsearch.api import (
+    _get_uuid_from_url,
+    get_zaak_document,
+    get_zaak_documents,
+)
+from zac.elasticsearch.searches import get_zaken_search
 
 from .constants import BoardObjectTypes
-from .query import BoardItemQuerySet
 
 
 class Board(models.Model):
@@ -93,8 +98,6 @@ class BoardItem(models.Model):
         ),
     )
 
-    objects = BoardItemQuerySet.as_manager()
-
     class Meta:
         verbose_name = _("board item")
         verbose_name_plural = _("board items")
@@ -103,4 +106,48 @@ class BoardItem(models.Model):
         if self.object_type != BoardObjectTypes.zaak:
             return None
 
+        if hasattr(self, "_zaak_document"):
+            return self._zaak_document
         return get_zaak_document(self.object)
+
+    @staticmethod
+    def prefetch_zaak_documents(items: Iterable["BoardItem"]) -> None:
+        """
+        Retrieve the zaak documents of the board items with a single ES request.
+        """
+        items = [
+            item
+            for item in items
+            if item.object_type == BoardObjectTypes.zaak
+            and not hasattr(item, "_zaak_document")
+        ]
+        if not items:
+            return
+
+        zaak_documents = get_zaak_documents([item.object for item in items])
+        for item in items:
+            item._zaak_document = zaak_documents.get(item.object)
+
+    @staticmethod
+    def filter_allowed(items: Iterable["BoardItem"], request) -> List["BoardItem"]:
+        """
+        Keep the board items with zaken the requester is allowed to see.
+
+        The zaken are searched for by the URLs of these items only, without their
+        sources, so this is meant for a page of items.
+        """
+        items = list(items)
+        if request.user and request.user.is_superuser:
+            return items
+
+        urls = list({item.object for item in items})
+        if not urls:
+            return items
+
+        search = get_zaken_search(request=request, urls=urls, ordering=None)
+        response = search.source(False)[: len(urls)].execute()
+        # the documents are stored by the UUIDs of the zaken
+        allowed_ids = {hit.meta.id for hit in response.hits}
+        return [
+            item for item in items if _get_uuid_from_url(item.object) in allowed_ids
+        ]
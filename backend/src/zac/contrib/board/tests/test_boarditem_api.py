@@ -1,4 +1,5 @@
 import uuid
+from unittest.mock import patch
 
 from django.urls import reverse
 
@@ -20,10 +21,13 @@ from zac.accounts.tests.factories import (
 )
 from zac.core.permissions import zaken_geforceerd_bijwerken, zaken_inzien
 from zac.core.tests.utils import ClearCachesMixin
+from zac.elasticsearch.documents import ZaakDocument
+from zac.elasticsearch.searches import get_zaken_search
 from zac.elasticsearch.tests.utils import ESMixin
 from zac.tests.utils import mock_resource_get
 from zgw.models.zrc import Zaak
 
+from ..api.pagination import BoardItemPagination
 from ..constants import BoardObjectTypes
 from ..models import BoardItem
 from .factories import BoardColumnFactory, BoardFactory, BoardItemFactory
@@ -86,7 +90,7 @@ class BoardItemPermissionTests(ESMixin, ClearCachesMixin, APITestCase):
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.json(), [])
+        self.assertEqual(response.json()["results"], [])
 
     def test_list_only_allowed(self, m):
         item = BoardItemFactory.create(object=ZAAK_URL)
@@ -106,13 +110,49 @@ class BoardItemPermissionTests(ESMixin, ClearCachesMixin, APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        data = response.json()
+        data = response.json()["results"]
         self.assertEqual(len(data), 1)
         self.assertEqual(
             data[0]["url"],
             f"http://testserver{reverse('boarditem-detail', args=[item.uuid])}",
         )
 
+    def test_list_paginated_only_allowed(self, m):
+        allowed_item = BoardItemFactory.create(object=ZAAK_URL)
+        # the items the user isn't allowed to see come first
+        BoardItemFactory.create_batch(3)
+        BlueprintPermissionFactory.create(
+            role__permissions=[zaken_inzien.name],
+            for_user=self.user,
+            policy={
+                "catalogus": CATALOGUS_URL,
+                "zaaktype_omschrijving": "ZT1",
+                "max_va": VertrouwelijkheidsAanduidingen.zeer_geheim,
+            },
+        )
+        url = reverse("boarditem-list")
+
+        with patch(
+            "zac.contrib.board.models.get_zaken_search", wraps=get_zaken_search
+        ) as mock_get_zaken_search:
+            response = self.client.get(url, {"page_size": 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        # the page is checked after paginating, so it can be short
+        self.assertEqual(data["results"], [])
+        self.assertEqual(data["next"], f"http://testserver{url}?page=2&page_size=2")
+        self.assertEqual(len(mock_get_zaken_search.call_args[1]["urls"]), 2)
+
+        response = self.client.get(url, {"page": 2, "page_size": 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(
+            [item["uuid"] for item in data["results"]], [str(allowed_item.uuid)]
+        )
+        self.assertIsNone(data["next"])
+
     def test_retrieve_other_permission(self, m):
         self._setUpMock(m)
 
@@ -399,7 +439,7 @@ class BoardItemAPITests(ESMixin, ClearCachesMixin, APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(
-            response.json(),
+            response.json()["results"],
             [
                 {
                     "url": f"http://testserver{reverse('boarditem-detail', args=[item2.uuid])}",
@@ -472,6 +512,67 @@ class BoardItemAPITests(ESMixin, ClearCachesMixin, APITestCase):
             ],
         )
 
+    def test_list_items_retrieves_zaak_documents_at_once(self):
+        BoardItemFactory.create(column__name="wip", object=ZAAK_URL)
+        BoardItemFactory.create_batch(3, column__name="done")
+        url = reverse("boarditem-list")
+
+        with patch.object(ZaakDocument, "get") as mock_get:
+            with patch.object(
+                ZaakDocument, "mget", wraps=ZaakDocument.mget
+            ) as mock_mget:
+                with patch(
+                    "zac.contrib.board.models.get_zaken_search"
+                ) as mock_get_zaken_search:
+                    response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        mock_get.assert_not_called()
+        mock_mget.assert_called_once()
+        # superusers are allowed to see every item
+        mock_get_zaken_search.assert_not_called()
+        self.assertEqual(
+            [item["zaak"] for item in response.json()["results"]],
+            [None, None, None, self.zaak_data],
+        )
+
+    def test_list_items_paginated(self):
+        items = BoardItemFactory.create_batch(3)
+        BoardItemFactory.create(object=ZAAK_URL)
+        url = reverse("boarditem-list")
+
+        response = self.client.get(url, {"page_size": 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertNotIn("count", data)
+        self.assertEqual(data["next"], f"http://testserver{url}?page=2&page_size=2")
+        self.assertIsNone(data["previous"])
+        self.assertEqual(len(data["results"]), 2)
+
+        response = self.client.get(url, {"page": 2, "page_size": 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertIsNone(data["next"])
+        self.assertEqual(data["previous"], f"http://testserver{url}?page_size=2")
+        self.assertEqual(
+            [item["uuid"] for item in data["results"]],
+            [str(items[1].uuid), str(items[0].uuid)],
+        )
+
+    @patch.object(BoardItemPagination, "page_size", 2)
+    def test_list_items_paginated_by_default(self):
+        BoardItemFactory.create_batch(3)
+        url = reverse("boarditem-list")
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(len(data["results"]), 2)
+        self.assertEqual(data["next"], f"http://testserver{url}?page=2")
+
     def test_list_items_filter_on_board_uuid(self):
         item = BoardItemFactory.create(object=ZAAK_URL)
         url = reverse("boarditem-list")
@@ -480,7 +581,7 @@ class BoardItemAPITests(ESMixin, ClearCachesMixin, APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        data = response.json()
+        data = response.json()["results"]
 
         self.assertEqual(len(data), 1)
         self.assertEqual(
@@ -496,7 +597,7 @@ class BoardItemAPITests(ESMixin, ClearCachesMixin, APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        data = response.json()
+        data = response.json()["results"]
 
         self.assertEqual(len(data), 1)
         self.assertEqual(
@@ -512,7 +613,7 @@ class BoardItemAPITests(ESMixin, ClearCachesMixin, APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        data = response.json()
+        data = response.json()["results"]
 
         self.assertEqual(len(data), 1)
         self.assertEqual(
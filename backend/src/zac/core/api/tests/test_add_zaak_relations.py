@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from django.urls import reverse_lazy
 
 import requests_mock
@@ -17,6 +19,7 @@ from zac.core.permissions import (
     zaken_inzien,
 )
 from zac.core.tests.utils import ClearCachesMixin
+from zac.elasticsearch.constants import RefreshPolicies
 from zac.elasticsearch.tests.utils import ESMixin
 from zgw.models.zrc import Zaak
 
@@ -153,6 +156,13 @@ class GetZakenTests(ESMixin, ClearCachesMixin, APITransactionTestCase):
 class CreateZakenRelationTests(ClearCachesMixin, APITestCase):
     endpoint = reverse_lazy("add-zaak-relation")
 
+    def setUp(self):
+        super().setUp()
+
+        patcher = patch("zac.core.api.views.update_zaak_document")
+        self.mock_update_zaak_document = patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_login_required(self, m):
         response = self.client.post(self.endpoint)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -298,6 +308,18 @@ class CreateZakenRelationTests(ClearCachesMixin, APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
+        # both zaken are reloaded right away, so the index must be up to date
+        self.assertEqual(
+            [
+                (call[0][0].url, call[1])
+                for call in self.mock_update_zaak_document.call_args_list
+            ],
+            [
+                (main_zaak["url"], {"refresh": RefreshPolicies.wait_for}),
+                (relation_zaak["url"], {"refresh": RefreshPolicies.wait_for}),
+            ],
+        )
+
     def test_valid_request_with_permissions_main_zaak_is_closed(self, m):
         user = UserFactory.create()
         self.client.force_authenticate(user)
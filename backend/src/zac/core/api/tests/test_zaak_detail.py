@@ -33,6 +33,7 @@ from zac.core.permissions import (
     zaken_wijzigen,
 )
 from zac.core.tests.utils import ClearCachesMixin
+from zac.elasticsearch.constants import RefreshPolicies
 from zac.elasticsearch.tests.utils import ESMixin
 from zac.tests.utils import mock_resource_get, paginated_response
 from zgw.models.zrc import Zaak
@@ -275,7 +276,7 @@ class ZaakDetailResponseTests(ESMixin, ClearCachesMixin, APITestCase):
             json=paginated_response([self.zaak]),
         )
 
-        m.patch(self.zaak["url"], status_code=status.HTTP_200_OK)
+        m.patch(self.zaak["url"], json=self.zaak)
 
         response = self.client.patch(
             self.detail_url,
@@ -315,7 +316,7 @@ class ZaakDetailResponseTests(ESMixin, ClearCachesMixin, APITestCase):
             json=paginated_response([self.zaak]),
         )
 
-        m.patch(self.zaak["url"], status_code=status.HTTP_200_OK)
+        m.patch(self.zaak["url"], json=self.zaak)
 
         response = self.client.patch(self.detail_url, {"zaakgeometrie": None})
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
@@ -335,7 +336,7 @@ class ZaakDetailResponseTests(ESMixin, ClearCachesMixin, APITestCase):
             json=paginated_response([self.zaak]),
         )
 
-        m.patch(self.zaak["url"], status_code=status.HTTP_200_OK)
+        m.patch(self.zaak["url"], json=self.zaak)
 
         # populate cache
         get_response = self.client.get(self.detail_url)
@@ -370,7 +371,7 @@ class ZaakDetailResponseTests(ESMixin, ClearCachesMixin, APITestCase):
             f"{ZAKEN_ROOT}zaken?bronorganisatie=123456782&identificatie=ZAAK-2020-0010",
             json=paginated_response([self.zaak]),
         )
-        m.patch(self.zaak["url"], status_code=status.HTTP_200_OK)
+        m.patch(self.zaak["url"], json=self.zaak)
 
         response = self.client.patch(
             self.detail_url,
@@ -395,7 +396,7 @@ class ZaakDetailResponseTests(ESMixin, ClearCachesMixin, APITestCase):
             f"{ZAKEN_ROOT}zaken?bronorganisatie=123456782&identificatie=ZAAK-2020-0010",
             json=paginated_response([self.zaak]),
         )
-        m.patch(self.zaak["url"], status_code=status.HTTP_200_OK)
+        m.patch(self.zaak["url"], json=self.zaak)
 
         response = self.client.patch(
             self.detail_url,
@@ -425,7 +426,7 @@ class ZaakDetailResponseTests(ESMixin, ClearCachesMixin, APITestCase):
             f"{ZAKEN_ROOT}zaken?bronorganisatie=123456782&identificatie=ZAAK-2020-0010",
             json=paginated_response([self.zaak]),
         )
-        m.patch(self.zaak["url"], status_code=status.HTTP_200_OK)
+        m.patch(self.zaak["url"], json=self.zaak)
 
         response = self.client.patch(
             self.detail_url,
@@ -453,7 +454,7 @@ class ZaakDetailResponseTests(ESMixin, ClearCachesMixin, APITestCase):
             f"{ZAKEN_ROOT}zaken?bronorganisatie=123456782&identificatie=ZAAK-2020-0010",
             json=paginated_response([self.zaak]),
         )
-        m.patch(self.zaak["url"], status_code=status.HTTP_200_OK)
+        m.patch(self.zaak["url"], json=self.zaak)
 
         data = {
             "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduidingen.openbaar,
@@ -476,6 +477,31 @@ class ZaakDetailResponseTests(ESMixin, ClearCachesMixin, APITestCase):
         )
         self.assertEqual(m.last_request.headers["X-Audit-Toelichting"], "some")
 
+    def test_update_indexes_zaak_before_responding(self, m):
+        mock_service_oas_get(m, CATALOGI_ROOT, "ztc")
+        mock_service_oas_get(m, ZAKEN_ROOT, "zrc")
+
+        mock_resource_get(m, self.zaaktype)
+        m.get(
+            f"{ZAKEN_ROOT}zaken?bronorganisatie=123456782&identificatie=ZAAK-2020-0010",
+            json=paginated_response([self.zaak]),
+        )
+        m.patch(self.zaak["url"], json={**self.zaak, "omschrijving": "new desc"})
+
+        with patch("zac.core.api.views.update_zaak_document") as mock_update:
+            response = self.client.patch(
+                self.detail_url, {"omschrijving": "new desc", "reden": "some"}
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        mock_update.assert_called_once()
+        zaak = mock_update.call_args[0][0]
+        self.assertEqual(zaak.omschrijving, "new desc")
+        # the client reloads the zaak right away
+        self.assertEqual(
+            mock_update.call_args[1], {"refresh": RefreshPolicies.wait_for}
+        )
+
     @override_settings(CREATE_ZAAK_PROCESS_DEFINITION_KEY="some-start-key")
     @freeze_time("2020-12-26T12:00:00Z")
     @patch(
@@ -992,7 +1018,7 @@ class ZaakDetailPermissionTests(ESMixin, ClearCachesMixin, APITestCase):
         )
         self.client.force_authenticate(user=user)
 
-        m.patch(self.zaak.url, status_code=status.HTTP_200_OK)
+        m.patch(self.zaak.url, json=self._zaak)
         response = self.client.patch(
             self.detail_url,
             {
@@ -1040,8 +1066,8 @@ class ZaakDetailPermissionTests(ESMixin, ClearCachesMixin, APITestCase):
             vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduidingen.beperkt_openbaar,
             einddatum="2020-01-01",
         )
+        m.patch(zaak["url"], json=zaak)
         zaak = factory(Zaak, zaak)
-        m.patch(zaak.url, status_code=status.HTTP_200_OK)
         with patch("zac.core.api.views.find_zaak", return_value=zaak):
             response = self.client.patch(
                 self.detail_url,
@@ -1095,8 +1121,8 @@ class ZaakDetailPermissionTests(ESMixin, ClearCachesMixin, APITestCase):
             vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduidingen.beperkt_openbaar,
             einddatum="2020-01-01",
         )
+        m.patch(zaak["url"], json=zaak)
         zaak = factory(Zaak, zaak)
-        m.patch(zaak.url, status_code=status.HTTP_200_OK)
         with patch("zac.core.api.views.find_zaak", return_value=zaak):
             response = self.client.patch(
                 self.detail_url,
@@ -25,6 +25,7 @@ from zac.core.permissions import (
     zaken_wijzigen,
 )
 from zac.core.tests.utils import ClearCachesMixin
+from zac.elasticsearch.constants import RefreshPolicies
 from zac.tests.utils import mock_resource_get, paginated_response
 from zgw.models.zrc import Zaak
 
@@ -88,6 +89,9 @@ class ZaakStatusesResponseTests(ClearCachesMixin, APITestCase):
         zaak.zaaktype = factory(ZaakType, cls.zaaktype)
 
         cls.find_zaak_patcher = patch("zac.core.api.views.find_zaak", return_value=zaak)
+        cls.update_status_in_zaak_document_patcher = patch(
+            "zac.core.api.views.update_status_in_zaak_document"
+        )
 
         cls.endpoint = reverse(
             "zaak-statuses",
@@ -103,6 +107,11 @@ class ZaakStatusesResponseTests(ClearCachesMixin, APITestCase):
         self.find_zaak_patcher.start()
         self.addCleanup(self.find_zaak_patcher.stop)
 
+        self.mock_update_status_in_zaak_document = (
+            self.update_status_in_zaak_document_patcher.start()
+        )
+        self.addCleanup(self.update_status_in_zaak_document_patcher.stop)
+
         # ensure that we have a user with all permissions
         self.client.force_authenticate(user=self.user)
 
@@ -211,6 +220,15 @@ class ZaakStatusesResponseTests(ClearCachesMixin, APITestCase):
         response = self.client.post(self.endpoint, request_data)
         self.assertEqual(response.status_code, 201)
 
+        # the zaak is reloaded right away, so the index must be up to date
+        self.mock_update_status_in_zaak_document.assert_called_once()
+        zaak = self.mock_update_status_in_zaak_document.call_args[0][0]
+        self.assertEqual(zaak.status.url, status["url"])
+        self.assertEqual(
+            self.mock_update_status_in_zaak_document.call_args[1],
+            {"refresh": RefreshPolicies.wait_for},
+        )
+
     def test_add_status_invalid_statustype(self, m):
         mock_service_oas_get(m, ZAKEN_ROOT, "zrc")
         mock_service_oas_get(m, CATALOGI_ROOT, "ztc")
@@ -453,6 +471,9 @@ class CreateZaakStatusPermissiontests(ClearCachesMixin, APITestCase):
         cls.get_statuses_patcher = patch(
             "zac.core.api.views.get_statussen", return_value=[]
         )
+        cls.update_status_in_zaak_document_patcher = patch(
+            "zac.core.api.views.update_status_in_zaak_document"
+        )
 
         cls.endpoint = reverse(
             "zaak-statuses",
@@ -471,6 +492,9 @@ class CreateZaakStatusPermissiontests(ClearCachesMixin, APITestCase):
         self.get_statuses_patcher.start()
         self.addCleanup(self.get_statuses_patcher.stop)
 
+        self.update_status_in_zaak_document_patcher.start()
+        self.addCleanup(self.update_status_in_zaak_document_patcher.stop)
+
     def test_not_authenticated(self):
         response = self.client.post(self.endpoint, json={})
 
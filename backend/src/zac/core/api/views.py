@@ -3,7 +3,7 @@ import logging
 from copy import deepcopy
 from datetime import date, datetime
 from itertools import groupby
-from typing import Dict, List
+from typing import Callable, Dict, List
 
 from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
@@ -16,6 +16,7 @@ from django.views.decorators.csrf import csrf_protect
 from djangorestframework_camel_case.parser import CamelCaseMultiPartParser
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, extend_schema
+from elasticsearch.exceptions import TransportError
 from rest_framework import (
     authentication,
     exceptions,
@@ -52,6 +53,9 @@ from zac.core.services import (
     update_document,
     update_zaak_eigenschap,
 )
+from zac.elasticsearch.api import update_status_in_zaak_document, update_zaak_document
+from zac.elasticsearch.constants import RefreshPolicies
+from zac.elasticsearch.read_model import mark_zaak_written
 from zac.utils.exceptions import PermissionDeniedSerializer
 from zac.utils.filters import ApiFilterBackend
 from zgw.models.zrc import Zaak
@@ -161,6 +165,20 @@ from .utils import convert_eigenschap_spec_to_json_schema
 logger = logging.getLogger(__name__)
 
 
+def _index_written_zaak(update: Callable[..., None], zaak: Zaak) -> None:
+    """
+    Update the ES document of a zaak ZAC just wrote, before responding.
+
+    The client reloads the zaak after the write, so the update waits until it's
+    visible to searches. The notification of the write indexes the zaak as well, so a
+    failure is only logged.
+    """
+    try:
+        update(zaak, refresh=RefreshPolicies.wait_for)
+    except TransportError:
+        logger.warning("Indexing zaak %s failed.", zaak.url, exc_info=True)
+
+
 class GetDocumentInfoView(views.APIView):
     schema = None
 
@@ -342,13 +360,15 @@ class ZaakDetailView(GetZaakMixin, views.APIView):
         reden = data.pop("reden", None)
         request_kwargs = {"headers": {"X-Audit-Toelichting": reden}} if reden else {}
 
-        client.partial_update(
+        updated_zaak = client.partial_update(
             "zaak",
             data,
             url=zaak.url,
             request_kwargs=request_kwargs,
         )
         invalidate_zaak_cache(zaak=zaak)
+        mark_zaak_written(zaak.url)
+        _index_written_zaak(update_zaak_document, factory(Zaak, updated_zaak))
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
@@ -383,6 +403,8 @@ class ZaakStatusesView(GetZaakMixin, views.APIView):
             statustype,
             toelichting=serializer.validated_data["statustoelichting"],
         )
+        zaak.status = new_status
+        _index_written_zaak(update_status_in_zaak_document, zaak)
         serializer = self.serializer_class(
             instance=new_status, context={"zaaktype": zaak.zaaktype}
         )
@@ -568,7 +590,7 @@ class CreateZaakRelationView(views.APIView):
                 "aardRelatie": serializer.validated_data["aard_relatie"],
             }
         )
-        client.partial_update(
+        main_zaak = client.partial_update(
             "zaak",
             {"relevanteAndereZaken": main_zaak["relevanteAndereZaken"]},
             url=main_zaak_url,
@@ -583,14 +605,16 @@ class CreateZaakRelationView(views.APIView):
                 ],
             }
         )
-        client.partial_update(
+        bijdrage_zaak = client.partial_update(
             "zaak",
             {"relevanteAndereZaken": bijdrage_zaak["relevanteAndereZaken"]},
             url=bijdrage_zaak_url,
         )
 
-        invalidate_zaak_cache(factory(Zaak, main_zaak))
-        invalidate_zaak_cache(factory(Zaak, bijdrage_zaak))
+        for zaak in (factory(Zaak, main_zaak), factory(Zaak, bijdrage_zaak)):
+            invalidate_zaak_cache(zaak)
+            mark_zaak_written(zaak.url)
+            _index_written_zaak(update_zaak_document, zaak)
 
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
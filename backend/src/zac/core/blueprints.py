@@ -1,10 +1,11 @@
 import operator
+from collections import defaultdict
 from functools import reduce
-from typing import Optional
+from typing import List, Optional
 
 from django.utils.translation import ugettext_lazy as _
 
-from elasticsearch_dsl.query import Query, Range, Term
+from elasticsearch_dsl.query import Query, Range, Term, Terms
 from rest_framework import serializers
 from zgw_consumers.api_models.constants import (
     RolOmschrijving,
@@ -73,7 +74,13 @@ class ZaakTypeBlueprint(Blueprint):
             and current_va_order <= max_va_order
         )
 
-    def search_query(self, on_nested_field: Optional[str] = "") -> Query:
+    @staticmethod
+    def _get_search_query(
+        catalogus: str,
+        omschrijvingen: List[str],
+        max_va_order: int,
+        on_nested_field: Optional[str] = "",
+    ) -> Query:
         catalogus_field = "zaaktype__catalogus"
         omschrijving_field = "zaaktype__omschrijving"
         va_field = "va_order"
@@ -83,12 +90,49 @@ class ZaakTypeBlueprint(Blueprint):
             va_field = f"{on_nested_field}__va_order"
 
         query = [
-            Term(**{catalogus_field: self.data["catalogus"]}),
-            Term(**{omschrijving_field: self.data["zaaktype_omschrijving"]}),
-            Range(**{va_field: {"lte": VA_ORDER[self.data["max_va"]]}}),
+            Term(**{catalogus_field: catalogus}),
+            Term(**{omschrijving_field: omschrijvingen[0]})
+            if len(omschrijvingen) == 1
+            else Terms(**{omschrijving_field: omschrijvingen}),
+            Range(**{va_field: {"lte": max_va_order}}),
         ]
         return query if on_nested_field else reduce(operator.and_, query)
 
+    def search_query(self, on_nested_field: Optional[str] = "") -> Query:
+        return self._get_search_query(
+            self.data["catalogus"],
+            [self.data["zaaktype_omschrijving"]],
+            VA_ORDER[self.data["max_va"]],
+            on_nested_field=on_nested_field,
+        )
+
+    @classmethod
+    def search_queries(
+        cls, policies: List[dict], on_nested_field: Optional[str] = ""
+    ) -> list:
+        # only the highest max_va of a zaaktype matters
+        max_va_orders = {}
+        for policy in policies:
+            zaaktype = (policy["catalogus"], policy["zaaktype_omschrijving"])
+            max_va_orders[zaaktype] = max(
+                max_va_orders.get(zaaktype, -1), VA_ORDER[policy["max_va"]]
+            )
+
+        # the zaaktypen with the same catalogus and max_va are matched in one query
+        grouped = defaultdict(list)
+        for (catalogus, omschrijving), max_va_order in max_va_orders.items():
+            grouped[(catalogus, max_va_order)].append(omschrijving)
+
+        return [
+            cls._get_search_query(
+                catalogus,
+                sorted(omschrijvingen),
+                max_va_order,
+                on_nested_field=on_nested_field,
+            )
+            for (catalogus, max_va_order), omschrijvingen in grouped.items()
+        ]
+
     def short_display(self):
         return f"{self.data['zaaktype_omschrijving']} ({self.data['max_va']})"
 
@@ -1,9 +1,10 @@
 import logging
 import warnings
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 from urllib.parse import parse_qs, urljoin, urlparse
 from urllib.request import Request
 
+from django.conf import settings
 from django.contrib.auth.models import Group
 from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
@@ -40,6 +41,7 @@ from zac.accounts.datastructures import VA_ORDER
 from zac.accounts.models import BlueprintPermission, User
 from zac.client import Client
 from zac.contrib.brp.models import BRPConfig
+from zac.elasticsearch.read_model import get_zaken_from_index, mark_zaak_written
 from zac.elasticsearch.searches import search_zaken
 from zac.utils.decorators import cache as cache_result
 from zac.utils.exceptions import ServiceConfigError
@@ -433,14 +435,17 @@ def _find_zaken(
 def get_zaken_all_paginated(
     client: ZGWClient,
     query_params: dict = {},
-) -> Tuple[List[Zaak], dict]:
+    raw: bool = False,
+) -> Tuple[Union[List[Zaak], List[dict]], dict]:
     """
     Fetch all zaken from the ZRCs in batches.
     Used to index Zaken in ES.
     Should not be used for searches with user permissions
+
+    With ``raw`` the zaken are returned as the JSON from the ZRC.
     """
     response = client.list("zaak", query_params=query_params)
-    zaken = factory(Zaak, response["results"])
+    zaken = response["results"] if raw else factory(Zaak, response["results"])
 
     if response["next"]:
         next_url = urlparse(response["next"])
@@ -730,10 +735,13 @@ def delete_zaak_eigenschap(zaak_eigenschap_url: str):
     client.delete("zaakeigenschap", url=zaak_eigenschap_url)
 
 
-@cache_result("get_zaak:{zaak_uuid}:{zaak_url}", timeout=AN_HOUR)
 def get_zaak(zaak_uuid=None, zaak_url=None, client=None) -> Zaak:
     """
     Retrieve zaak with uuid or url
+
+    With ``ES_READ_MODEL`` the zaak is read from the zaken index if its document is
+    up to date. These zaken aren't cached, so the next read sees the document once
+    the notifications have updated it.
     """
     if zaak_uuid and (
         zaak_uuid.startswith("http://") or zaak_uuid.startswith("https://")
@@ -744,6 +752,15 @@ def get_zaak(zaak_uuid=None, zaak_url=None, client=None) -> Zaak:
         )
         zaak_url, zaak_uuid = zaak_uuid, None
 
+    if settings.ES_READ_MODEL and zaak_url is not None:
+        if zaak := get_zaken_from_index([zaak_url]).get(zaak_url):
+            return zaak
+
+    return _get_zaak_from_zrc(zaak_uuid=zaak_uuid, zaak_url=zaak_url, client=client)
+
+
+@cache_result("get_zaak:{zaak_uuid}:{zaak_url}", timeout=AN_HOUR)
+def _get_zaak_from_zrc(zaak_uuid=None, zaak_url=None, client=None) -> Zaak:
     if client is None and zaak_url is not None:
         client = _client_from_url(zaak_url)
 
@@ -773,8 +790,16 @@ def get_related_zaken(zaak: Zaak) -> List[Tuple[str, Zaak]]:
     return list of related zaken with selected zaaktypen
     """
 
+    urls = [
+        relevante_andere_zaak["url"]
+        for relevante_andere_zaak in zaak.relevante_andere_zaken
+    ]
+    indexed_zaken = get_zaken_from_index(urls) if settings.ES_READ_MODEL else {}
+
     def _fetch_zaak(relevante_andere_zaak: dict) -> Tuple[str, Zaak]:
-        zaak = get_zaak(zaak_url=relevante_andere_zaak["url"])
+        zaak = indexed_zaken.get(relevante_andere_zaak["url"]) or get_zaak(
+            zaak_url=relevante_andere_zaak["url"]
+        )
         # resolve relation(s)
         zaak.zaaktype = fetch_zaaktype(zaak.zaaktype)
 
@@ -979,6 +1004,7 @@ def zet_status(zaak: Zaak, statustype: StatusType, toelichting: str = "") -> Sta
     status.statustype = statustype
 
     invalidate_zaak_cache(zaak)
+    mark_zaak_written(zaak.url)
     return status
 
 
@@ -1424,6 +1450,29 @@ def update_object_record_data(
     return obj
 
 
+def get_objects_all_paginated(
+    client: Client,
+    query_params: dict = {},
+) -> Tuple[List[dict], dict]:
+    """
+    Fetch all objects from the OBJECTS API (v2) in batches.
+    Used to index objecten in ES.
+
+    """
+    response = client.list("object", query_params=query_params)
+    objects = response["results"]
+
+    if response["next"]:
+        next_url = urlparse(response["next"])
+        query = parse_qs(next_url.query)
+        new_page = int(query["page"][0])
+        query_params["page"] = [new_page]
+    else:
+        query_params["page"] = None
+
+    return objects, query_params
+
+
 @cache_result("objecttype:{url}", timeout=AN_HOUR)
 def fetch_objecttype(url: str, client: Optional[Client] = None) -> dict:
     if not client:
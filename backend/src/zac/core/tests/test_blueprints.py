@@ -0,0 +1,79 @@
+from django.test import SimpleTestCase
+
+from elasticsearch_dsl.query import Range, Term, Terms
+from zgw_consumers.api_models.constants import VertrouwelijkheidsAanduidingen
+
+from zac.accounts.datastructures import VA_ORDER
+
+from ..blueprints import ZaakTypeBlueprint
+
+CATALOGUS = (
+    "https://api.catalogi.nl/api/v1/catalogussen/e13e72de-56ba-42b6-be36-5c280e9b30cd"
+)
+OTHER_CATALOGUS = (
+    "https://api.catalogi.nl/api/v1/catalogussen/0c79c41d-72ef-4ea2-8c4c-03c9945da2a2"
+)
+
+
+class ZaakTypeBlueprintSearchQueriesTests(SimpleTestCase):
+    def test_policies_are_combined(self):
+        policies = [
+            {
+                "catalogus": CATALOGUS,
+                "zaaktype_omschrijving": "ZT2",
+                "max_va": VertrouwelijkheidsAanduidingen.openbaar,
+            },
+            {
+                "catalogus": CATALOGUS,
+                "zaaktype_omschrijving": "ZT1",
+                "max_va": VertrouwelijkheidsAanduidingen.openbaar,
+            },
+            # the highest max_va of a zaaktype wins
+            {
+                "catalogus": CATALOGUS,
+                "zaaktype_omschrijving": "ZT3",
+                "max_va": VertrouwelijkheidsAanduidingen.openbaar,
+            },
+            {
+                "catalogus": CATALOGUS,
+                "zaaktype_omschrijving": "ZT3",
+                "max_va": VertrouwelijkheidsAanduidingen.geheim,
+            },
+            {
+                "catalogus": OTHER_CATALOGUS,
+                "zaaktype_omschrijving": "ZT1",
+                "max_va": VertrouwelijkheidsAanduidingen.openbaar,
+            },
+        ]
+
+        queries = ZaakTypeBlueprint.search_queries(policies)
+
+        self.assertEqual(
+            queries,
+            [
+                Term(zaaktype__catalogus=CATALOGUS)
+                & Terms(zaaktype__omschrijving=["ZT1", "ZT2"])
+                & Range(va_order={"lte": VA_ORDER["openbaar"]}),
+                Term(zaaktype__catalogus=CATALOGUS)
+                & Term(zaaktype__omschrijving="ZT3")
+                & Range(va_order={"lte": VA_ORDER["geheim"]}),
+                Term(zaaktype__catalogus=OTHER_CATALOGUS)
+                & Term(zaaktype__omschrijving="ZT1")
+                & Range(va_order={"lte": VA_ORDER["openbaar"]}),
+            ],
+        )
+
+    def test_nested_field(self):
+        policy = {
+            "catalogus": CATALOGUS,
+            "zaaktype_omschrijving": "ZT1",
+            "max_va": VertrouwelijkheidsAanduidingen.openbaar,
+        }
+
+        queries = ZaakTypeBlueprint.search_queries(
+            [policy], on_nested_field="related_zaken"
+        )
+
+        self.assertEqual(
+            queries, [ZaakTypeBlueprint(policy).search_query("related_zaken")]
+        )
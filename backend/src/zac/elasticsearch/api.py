@@ -1,8 +1,15 @@
 import logging
+import threading
 from collections import defaultdict
+from contextlib import contextmanager
 from typing import Dict, List, Optional, Union
 
+from django.conf import settings
+
 from elasticsearch import exceptions
+from elasticsearch.helpers import bulk
+from elasticsearch_dsl import UpdateByQuery
+from elasticsearch_dsl.connections import connections
 from elasticsearch_dsl.query import Bool, Nested, Term
 from zgw_consumers.api_models.catalogi import StatusType, ZaakType
 from zgw_consumers.api_models.documenten import Document
@@ -39,6 +46,8 @@ from .documents import (
     ZaakObjectDocument,
     ZaakTypeDocument,
 )
+from .refresh import get_refresh
+from .utils import get_geometry_center
 
 logger = logging.getLogger(__name__)
 
@@ -67,12 +76,27 @@ def create_zaak_document(zaak: Zaak) -> ZaakDocument:
         deadline=zaak.deadline,
         toelichting=zaak.toelichting,
         zaakgeometrie=zaak.zaakgeometrie,
-        identificatie_suggest=zaak.identificatie,
+        zaakgeometrie_punt=get_geometry_center(zaak.zaakgeometrie),
+        einddatum_gepland=zaak.einddatum_gepland,
+        uiterlijke_einddatum_afdoening=zaak.uiterlijke_einddatum_afdoening,
+        publicatiedatum=zaak.publicatiedatum,
+        resultaat=zaak.resultaat,
+        relevante_andere_zaken=create_relevante_andere_zaken_documents(zaak),
     )
 
     return zaak_document
 
 
+def create_relevante_andere_zaken_documents(zaak: Zaak) -> List[dict]:
+    return [
+        {
+            "url": relevante_andere_zaak["url"],
+            "aard_relatie": relevante_andere_zaak["aard_relatie"],
+        }
+        for relevante_andere_zaak in zaak.relevante_andere_zaken
+    ]
+
+
 def _get_zaak_document(
     zaak_uuid: str, zaak_url: str, create_zaak: Optional[Zaak] = None
 ) -> Optional[ZaakDocument]:
@@ -84,7 +108,7 @@ def _get_zaak_document(
             return
         else:
             zaak_document = create_zaak_document(create_zaak)
-            zaak_document.save()
+            zaak_document.save(refresh=get_refresh(settings.ES_INDEX_ZAKEN))
 
     return zaak_document
 
@@ -94,14 +118,116 @@ def get_zaak_document(zaak_url: str):
     return _get_zaak_document(zaak_uuid, zaak_url)
 
 
-def update_zaak_document(zaak: Zaak) -> ZaakDocument:
-    zaak_document = _get_zaak_document(zaak.uuid, zaak.url, create_zaak=zaak)
+def get_zaak_documents(zaak_urls: List[str]) -> Dict[str, ZaakDocument]:
+    """
+    Retrieve the zaak documents with one ``mget`` request, mapped by URL.
+
+    Zaken that haven't been indexed are left out and logged.
+    """
+    zaak_urls = list(dict.fromkeys(zaak_urls))
+    if not zaak_urls:
+        return {}
+
+    results = ZaakDocument.mget(
+        [_get_uuid_from_url(url) for url in zaak_urls], raise_on_error=False
+    )
+    documents = {url: doc for url, doc in zip(zaak_urls, results) if doc is not None}
+    if missing := [url for url in zaak_urls if url not in documents]:
+        logger.warning("Zaak(en) %s haven't been indexed in ES", ", ".join(missing))
+    return documents
+
 
+# Replace (rather than merge) the given fields, so that removed keys of object fields
+# like ``status`` and ``eigenschappen`` are removed from the document as well.
+UPDATE_FIELDS_SCRIPT = """
+for (entry in params.fields.entrySet()) {
+    ctx._source.put(entry.getKey(), entry.getValue());
+}
+"""
+
+RETRY_ON_CONFLICT = 3
+
+_pending_updates = threading.local()
+
+
+@contextmanager
+def bulk_zaak_document_updates(refresh: Optional[str] = None):
+    """
+    Collect the partial updates of zaak documents and send them in one bulk request.
+
+    Multiple updates of the same zaak are merged into one update. The ``refresh``
+    policy of the outermost block applies to the bulk request.
+    """
+    if getattr(_pending_updates, "actions", None) is not None:
+        # already collecting - the outermost block sends the updates
+        yield
+        return
+
+    _pending_updates.actions = actions = {}
+    try:
+        yield
+    finally:
+        _pending_updates.actions = None
+
+    if actions:
+        bulk(
+            connections.get_connection(),
+            actions.values(),
+            refresh=get_refresh(settings.ES_INDEX_ZAKEN, refresh),
+        )
+
+
+def _update_zaak_document_fields(
+    zaak: Zaak, refresh: Optional[str] = None, **fields
+) -> None:
+    """
+    Set ``fields`` on the ES document of the zaak with a single partial update.
+
+    A zaak that hasn't been indexed yet is indexed with these fields.
+    """
+    zaak_document = create_zaak_document(zaak)
+    for name, value in fields.items():
+        setattr(zaak_document, name, value)
+    values = zaak_document.to_dict(skip_empty=False)
+    values = {name: values[name] for name in fields}
+    upsert = zaak_document.to_dict()
+
+    actions = getattr(_pending_updates, "actions", None)
+    if actions is None:
+        connections.get_connection().update(
+            index=settings.ES_INDEX_ZAKEN,
+            id=zaak.uuid,
+            body={
+                "script": {
+                    "source": UPDATE_FIELDS_SCRIPT,
+                    "params": {"fields": values},
+                },
+                "upsert": upsert,
+            },
+            retry_on_conflict=RETRY_ON_CONFLICT,
+            refresh=get_refresh(settings.ES_INDEX_ZAKEN, refresh),
+        )
+    elif zaak.uuid in actions:
+        actions[zaak.uuid]["script"]["params"]["fields"].update(values)
+        actions[zaak.uuid]["upsert"].update(upsert)
+    else:
+        actions[zaak.uuid] = {
+            "_op_type": "update",
+            "_index": settings.ES_INDEX_ZAKEN,
+            "_id": zaak.uuid,
+            "retry_on_conflict": RETRY_ON_CONFLICT,
+            "script": {"source": UPDATE_FIELDS_SCRIPT, "params": {"fields": values}},
+            "upsert": upsert,
+        }
+
+
+def update_zaak_document(zaak: Zaak, refresh: Optional[str] = None) -> None:
     # Don't include zaaktype and identificatie since they are immutable.
     # Don't include status or objecten as those are handled through a
     # different handler in the notifications api.
-    zaak_document.update(
-        refresh=True,
+    _update_zaak_document_fields(
+        zaak,
+        refresh=refresh,
         bronorganisatie=zaak.bronorganisatie,
         vertrouwelijkheidaanduiding=zaak.vertrouwelijkheidaanduiding,
         va_order=VA_ORDER[zaak.vertrouwelijkheidaanduiding],
@@ -111,16 +237,19 @@ def update_zaak_document(zaak: Zaak) -> ZaakDocument:
         deadline=zaak.deadline,
         toelichting=zaak.toelichting,
         zaakgeometrie=zaak.zaakgeometrie,
+        zaakgeometrie_punt=get_geometry_center(zaak.zaakgeometrie),
         omschrijving=zaak.omschrijving,
-        identificatie_suggest=zaak.identificatie,
+        einddatum_gepland=zaak.einddatum_gepland,
+        uiterlijke_einddatum_afdoening=zaak.uiterlijke_einddatum_afdoening,
+        publicatiedatum=zaak.publicatiedatum,
+        relevante_andere_zaken=create_relevante_andere_zaken_documents(zaak),
     )
-    return zaak_document
 
 
 def delete_zaak_document(zaak_url: str) -> None:
     zaak_document = get_zaak_document(zaak_url)
     if zaak_document:
-        zaak_document.delete()
+        zaak_document.delete(refresh=get_refresh(settings.ES_INDEX_ZAKEN))
 
     return
 
@@ -151,13 +280,17 @@ def create_status_document(status: Status) -> StatusDocument:
     return status_document
 
 
-def update_status_in_zaak_document(zaak: Zaak) -> None:
+def update_status_in_zaak_document(zaak: Zaak, refresh: Optional[str] = None) -> None:
     if zaak.status:
         zaak.status = get_status(zaak) if isinstance(zaak.status, str) else zaak.status
         status_document = create_status_document(zaak.status)
-        zaak_document = _get_zaak_document(zaak.uuid, zaak.url, create_zaak=zaak)
-        zaak_document.status = status_document
-        zaak_document.save()
+        _update_zaak_document_fields(zaak, refresh=refresh, status=status_document)
+
+    return
+
+
+def update_resultaat_in_zaak_document(zaak: Zaak) -> None:
+    _update_zaak_document_fields(zaak, resultaat=zaak.resultaat)
 
     return
 
@@ -175,10 +308,7 @@ def create_rol_document(rol: Rol) -> RolDocument:
 
 def update_rollen_in_zaak_document(zaak: Zaak) -> None:
     rol_documents = [create_rol_document(rol) for rol in get_rollen(zaak)]
-
-    zaak_document = _get_zaak_document(zaak.uuid, zaak.url, create_zaak=zaak)
-    zaak_document.rollen = rol_documents
-    zaak_document.save()
+    _update_zaak_document_fields(zaak, rollen=rol_documents)
 
     return
 
@@ -199,10 +329,7 @@ def create_eigenschappen_document(eigenschappen: List[ZaakEigenschap]) -> dict:
 def update_eigenschappen_in_zaak_document(zaak: Zaak) -> None:
     zaak.eigenschappen = get_zaak_eigenschappen(zaak)
     eigenschappen_doc = create_eigenschappen_document(zaak.eigenschappen)
-
-    zaak_document = _get_zaak_document(zaak.uuid, zaak.url, create_zaak=zaak)
-    zaak_document.eigenschappen = eigenschappen_doc
-    zaak_document.save()
+    _update_zaak_document_fields(zaak, eigenschappen=eigenschappen_doc)
 
     return
 
@@ -215,12 +342,10 @@ def create_zaakobject_document(
 
 def update_zaakobjecten_in_zaak_document(zaak: Zaak) -> None:
     zaak.zaakobjecten = get_zaakobjecten(zaak)
-
-    zaak_document = _get_zaak_document(zaak.uuid, zaak.url, create_zaak=zaak)
-    zaak_document.zaakobjecten = [
-        create_zaakobject_document(zo) for zo in zaak.zaakobjecten
-    ]
-    zaak_document.save()
+    _update_zaak_document_fields(
+        zaak,
+        zaakobjecten=[create_zaakobject_document(zo) for zo in zaak.zaakobjecten],
+    )
 
     return
 
@@ -233,11 +358,13 @@ def create_zaakinformatieobject_document(
 
 def update_zaakinformatieobjecten_in_zaak_document(zaak: Zaak) -> None:
     zaak.zaakinformatieobjecten = get_zaak_informatieobjecten(zaak)
-    zaak_document = _get_zaak_document(zaak.uuid, zaak.url, create_zaak=zaak)
-    zaak_document.zaakinformatieobjecten = [
-        create_zaakinformatieobject_document(zio) for zio in zaak.zaakinformatieobjecten
-    ]
-    zaak_document.save()
+    _update_zaak_document_fields(
+        zaak,
+        zaakinformatieobjecten=[
+            create_zaakinformatieobject_document(zio)
+            for zio in zaak.zaakinformatieobjecten
+        ],
+    )
 
     return
 
@@ -256,7 +383,7 @@ def _get_object_document(
         logger.warning("object %s hasn't been indexed in ES", object_url, exc_info=True)
         if create_object:
             object_document = create_object_document(create_object)
-            object_document.save()
+            object_document.save(refresh=get_refresh(settings.ES_INDEX_OBJECTEN))
         else:
             return
 
@@ -275,12 +402,14 @@ def create_object_document(object: Dict) -> ObjectDocument:
     )
 
 
-def update_object_document(object: Dict) -> ObjectDocument:
+def update_object_document(
+    object: Dict, refresh: Optional[str] = None
+) -> ObjectDocument:
     object_document = _get_object_document(
         object["uuid"], object["url"], create_object=object
     )
     object_document.update(
-        refresh=True,
+        refresh=get_refresh(settings.ES_INDEX_OBJECTEN, refresh),
         record_data=object["record"]["data"],
     )
     return object_document
@@ -288,7 +417,7 @@ def update_object_document(object: Dict) -> ObjectDocument:
 
 def delete_object_document(object_url: str) -> None:
     object_document = _get_object_document(_get_uuid_from_url(object_url), object_url)
-    object_document.delete()
+    object_document.delete(refresh=get_refresh(settings.ES_INDEX_OBJECTEN))
 
 
 def create_related_zaak_document(
@@ -332,30 +461,59 @@ def update_related_zaken_in_object_document(object_url: str) -> None:
     # Create related_zaak documenten and update object document
     related_zaken = [create_related_zaak_document(zaak) for zaak in zaken]
     object_document.related_zaken = related_zaken
-    object_document.save()
+    object_document.save(refresh=get_refresh(settings.ES_INDEX_OBJECTEN))
     return
 
 
-def update_related_zaak_in_object_documents(zaak: Zaak) -> None:
-    objects = (
-        ObjectDocument.search()
+UPDATE_RELATED_ZAAK_SCRIPT = """
+for (int i = 0; i < ctx._source.related_zaken.size(); i++) {
+    if (ctx._source.related_zaken[i].url == params.related_zaak.url) {
+        ctx._source.related_zaken[i] = params.related_zaak;
+    }
+}
+"""
+
+
+def _update_related_zaak_in_index(index: str, zaak: Zaak) -> None:
+    """
+    Update the related zaak in all the documents of the index referring to it.
+
+    This is a single update by query, regardless of the number of documents. It is
+    repeated for the documents that were modified concurrently.
+    """
+    update_by_query = (
+        UpdateByQuery(index=index)
         .query(
             Nested(
                 path="related_zaken",
                 query=Bool(filter=[Term(related_zaken__url=zaak.url)]),
             )
         )
-        .execute()
+        .script(
+            source=UPDATE_RELATED_ZAAK_SCRIPT,
+            params={"related_zaak": create_related_zaak_document(zaak).to_dict()},
+        )
+        # update by query doesn't support ``wait_for`` - refresh once afterwards instead
+        .params(conflicts="proceed", refresh=bool(get_refresh(index)))
     )
-    related_zaak = create_related_zaak_document(zaak)
-    for obj in objects:
-        related_zaken = [rz for rz in obj.related_zaken if rz.url != zaak.url]
-        related_zaken.append(related_zaak)
-        object_document = ObjectDocument.get(id=obj.meta.id)
-        object_document.related_zaken = related_zaken
-        object_document.save()
+    for attempt in range(RETRY_ON_CONFLICT + 1):
+        response = update_by_query.execute()
+        if response.failures:
+            raise RuntimeError(
+                "Updating related zaak %s in index %s failed: %r"
+                % (zaak.url, index, response.failures)
+            )
+        if not response.version_conflicts:
+            return
 
-    return
+    raise RuntimeError(
+        "Updating related zaak %s in index %s failed: %d version conflicts remain."
+        % (zaak.url, index, response.version_conflicts)
+    )
+
+
+def update_related_zaak_in_object_documents(zaak: Zaak) -> None:
+    _update_related_zaak_in_index(settings.ES_INDEX_OBJECTEN, zaak)
 
 
 ###################################################
@@ -380,7 +538,9 @@ def _get_informatieobject_document(
             informatieobject_document = create_informatieobject_document(
                 create_informatieobject
             )
-            informatieobject_document.save()
+            informatieobject_document.save(
+                refresh=get_refresh(settings.ES_INDEX_DOCUMENTEN)
+            )
         else:
             return
 
@@ -397,17 +557,22 @@ def create_informatieobject_document(
     )
 
 
-def update_informatieobject_document(document: Document) -> InformatieObjectDocument:
+def update_informatieobject_document(
+    document: Document, refresh: Optional[str] = None
+) -> InformatieObjectDocument:
     informatieobject_document = _get_informatieobject_document(
         document.url, create_informatieobject=document
     )
-    informatieobject_document.update(refresh=True, titel=document.titel)
+    informatieobject_document.update(
+        refresh=get_refresh(settings.ES_INDEX_DOCUMENTEN, refresh),
+        titel=document.titel,
+    )
     return informatieobject_document
 
 
 def delete_informatieobject_document(document_url: str) -> None:
     informatieobject_document = _get_informatieobject_document(document_url)
-    informatieobject_document.delete()
+    informatieobject_document.delete(refresh=get_refresh(settings.ES_INDEX_DOCUMENTEN))
 
 
 def update_related_zaken_in_informatieobject_document(
@@ -437,27 +602,9 @@ def update_related_zaken_in_informatieobject_document(
     # Create related_zaak documenten and update object document
     related_zaken = [create_related_zaak_document(zaak) for zaak in zaken]
     informatieobject_document.related_zaken = related_zaken
-    informatieobject_document.save()
+    informatieobject_document.save(refresh=get_refresh(settings.ES_INDEX_DOCUMENTEN))
     return
 
 
 def update_related_zaak_in_informatieobject_documents(zaak: Zaak) -> None:
-    ios = (
-        InformatieObjectDocument.search()
-        .query(
-            Nested(
-                path="related_zaken",
-                query=Bool(filter=[Term(related_zaken__url=zaak.url)]),
-            )
-        )
-        .execute()
-    )
-    related_zaak = create_related_zaak_document(zaak)
-    for io in ios:
-        related_zaken = [rz for rz in io.related_zaken if rz.url != zaak.url]
-        related_zaken.append(related_zaak)
-        object_document = InformatieObjectDocument.get(id=io.meta.id)
-        object_document.related_zaken = related_zaken
-        object_document.save()
-
-    return
+    _update_related_zaak_in_index(settings.ES_INDEX_DOCUMENTEN, zaak)
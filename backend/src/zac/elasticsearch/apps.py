@@ -1,13 +1,22 @@
 from django.apps import AppConfig
 from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
 from django.utils.translation import ugettext_lazy as _
 
 from elasticsearch_dsl.connections import connections
 
+from .constants import RefreshPolicies
+
 
 class EsConfig(AppConfig):
     name = "zac.elasticsearch"
     verbose_name = _("Elasticsearch configuration")
 
     def ready(self):
+        if settings.ES_REFRESH_POLICY not in RefreshPolicies.values:
+            raise ImproperlyConfigured(
+                "ES_REFRESH_POLICY must be one of %s, not %r."
+                % (", ".join(RefreshPolicies.values), settings.ES_REFRESH_POLICY)
+            )
+
         connections.configure(**settings.ELASTICSEARCH_DSL)
@@ -0,0 +1,14 @@
+from django.utils.translation import gettext_lazy as _
+
+from djchoices import ChoiceItem, DjangoChoices
+
+
+class RefreshPolicies(DjangoChoices):
+    none = ChoiceItem("none", _("none"))
+    wait_for = ChoiceItem("wait_for", _("wait for the next refresh"))
+    batched = ChoiceItem("batched", _("batched refresh"))
+
+
+class ExportFormats(DjangoChoices):
+    csv = ChoiceItem("csv", _("CSV"))
+    xlsx = ChoiceItem("xlsx", _("Excel (XLSX)"))
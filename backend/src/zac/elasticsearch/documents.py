@@ -15,7 +15,6 @@ from elasticsearch_dsl import (
 truncate_filter = token_filter(
     "truncate", type="truncate", length=f"{settings.MAX_GRAM-settings.MIN_GRAM}"
 )
-dutch_stop_filter = token_filter("dutch_stop", type="stop", stopwords="_dutch_")
 ngram_tokenizer = tokenizer(
     "zacGram",
     "ngram",
@@ -23,10 +22,11 @@ ngram_tokenizer = tokenizer(
     max_gram=settings.MAX_GRAM,
 )
 
+# stop words are kept, they have to match as substrings like any other word
 ngram_analyzer = analyzer(
     "ngram_analyzer",
     tokenizer=ngram_tokenizer,
-    filter=["lowercase", dutch_stop_filter],
+    filter=["lowercase"],
 )
 strip_leading_zeros_in_zaakidentificatie_filter = char_filter(
     "strip_leading_zeros",
@@ -43,7 +43,37 @@ strip_leading_zeros_in_zaakidentificatie_analyzer = analyzer(
 truncate_standard_analyzer = analyzer(
     "standard",
     tokenizer="standard",
-    filter=["lowercase", dutch_stop_filter, truncate_filter],
+    filter=["lowercase", truncate_filter],
+)
+
+# prefixes of the words for autocompletion
+edge_ngram_filter = token_filter(
+    "zacEdgeGram", type="edge_ngram", min_gram=1, max_gram=settings.MAX_GRAM
+)
+truncate_edge_ngram_filter = token_filter(
+    "truncate_edge_ngram", type="truncate", length=settings.MAX_GRAM
+)
+autocomplete_zaakidentificatie_analyzer = analyzer(
+    "autocomplete_zaakidentificatie",
+    tokenizer="standard",
+    filter=["lowercase", edge_ngram_filter],
+    char_filter=[strip_leading_zeros_in_zaakidentificatie_filter],
+)
+autocomplete_zaakidentificatie_search_analyzer = analyzer(
+    "autocomplete_zaakidentificatie_search",
+    tokenizer="standard",
+    filter=["lowercase", truncate_edge_ngram_filter],
+    char_filter=[strip_leading_zeros_in_zaakidentificatie_filter],
+)
+autocomplete_analyzer = analyzer(
+    "autocomplete",
+    tokenizer="standard",
+    filter=["lowercase", edge_ngram_filter],
+)
+autocomplete_search_analyzer = analyzer(
+    "autocomplete_search",
+    tokenizer="standard",
+    filter=["lowercase", truncate_edge_ngram_filter],
 )
 
 
@@ -91,12 +121,24 @@ class ZaakDocument(Document):
     url = field.Keyword()
     zaaktype = field.Object(ZaakTypeDocument)
     identificatie = field.Text(
-        fields={"keyword": field.Keyword()},
+        fields={
+            "keyword": field.Keyword(),
+            "autocomplete": field.Text(
+                analyzer=autocomplete_zaakidentificatie_analyzer,
+                search_analyzer=autocomplete_zaakidentificatie_search_analyzer,
+            ),
+        },
         analyzer=strip_leading_zeros_in_zaakidentificatie_analyzer,
     )
     bronorganisatie = field.Keyword()
     omschrijving = field.Text(
-        fields={"keyword": field.Keyword()},
+        fields={
+            "keyword": field.Keyword(),
+            "autocomplete": field.Text(
+                analyzer=autocomplete_analyzer,
+                search_analyzer=autocomplete_search_analyzer,
+            ),
+        },
         analyzer=ngram_analyzer,
         search_analyzer=truncate_standard_analyzer,
     )
@@ -109,10 +151,28 @@ class ZaakDocument(Document):
     deadline = field.Date()
     eigenschappen = field.Object(EigenschapDocument)
     status = field.Object(StatusDocument)
-    toelichting = field.Text(fields={"keyword": field.Keyword()})
+    toelichting = field.Text(
+        fields={
+            "keyword": field.Keyword(),
+            "ngram": field.Text(
+                analyzer=ngram_analyzer,
+                search_analyzer=truncate_standard_analyzer,
+            ),
+        }
+    )
     zaakobjecten = Nested(ZaakObjectDocument)
     zaakinformatieobjecten = Nested(ZaakInformatieObjectDocument)
     zaakgeometrie = field.GeoShape()
+    # Only aggregated to cluster the zaken on a map, see get_zaken_clusters
+    zaakgeometrie_punt = field.GeoPoint(index=False)
+
+    # Only stored to serve zaken from the index, see zac.elasticsearch.read_model
+    einddatum_gepland = field.Date(index=False)
+    uiterlijke_einddatum_afdoening = field.Date(index=False)
+    publicatiedatum = field.Date(index=False)
+    resultaat = field.Keyword(index=False)
+    relevante_andere_zaken = field.Object(enabled=False, multi=True)
+    read_model_version = field.Integer(index=False)
 
     class Index:
         name = settings.ES_INDEX_ZAKEN
@@ -127,7 +187,11 @@ class ZaakDocument(Document):
                 {
                     "eigenschap_string": {
                         "path_match": "eigenschappen.tekst.*",
-                        "mapping": {"type": "keyword"},
+                        "mapping": {
+                            "type": "keyword",
+                            # for the substring searches
+                            "fields": {"wildcard": {"type": "wildcard"}},
+                        },
                     }
                 },
                 {
@@ -223,3 +287,17 @@ class InformatieObjectDocument(Document):
             "index.mapping.ignore_malformed": True,
             "max_ngram_diff": settings.MAX_GRAM - settings.MIN_GRAM,
         }
+
+
+class PermissionsDocument(Document):
+    """
+    The objects a user has atomic permissions for.
+
+    Large sets of object URLs are looked up from these documents by the permission
+    filters of the searches instead of being part of the query itself.
+    """
+
+    object_urls = field.Keyword(index=False)
+
+    class Index:
+        name = settings.ES_INDEX_PERMISSIONS
@@ -1,20 +1,105 @@
-from typing import List
+import logging
+from typing import List, Optional
 
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+
+from elasticsearch_dsl import Search
+from elasticsearch_dsl.response import Response as ESResponse
+from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 from zac.core.api.pagination import BffPagination
 
+from ..utils import iter_search_after
 from .serializers import DEFAULT_ES_FIELDS
 
+logger = logging.getLogger(__name__)
+perf_logger = logging.getLogger("performance")
+
+
+def get_search_after_page(search: Search, offset: int, size: int) -> ESResponse:
+    """
+    Retrieve a page beyond the max result window of the index with ``search_after``.
+
+    The sort values of the hits before the page are collected in batches, without
+    their sources.
+    """
+    window = settings.ES_MAX_RESULT_WINDOW
+    skip_sizes = [window] * (offset // window)
+    if offset % window:
+        skip_sizes.append(offset % window)
+
+    skip = search.source(False).extra(track_total_hits=False)
+    search_after = None
+    for response in iter_search_after(skip, skip_sizes):
+        if response.hits:
+            search_after = list(response.hits[-1].meta.sort)
+
+    return next(iter_search_after(search, [size], search_after=search_after))
+
 
 class ESPagination(BffPagination):
+    """
+    Paginate an elasticsearch search in elasticsearch itself.
+
+    Only the hits of the requested page are retrieved. Pages within the max result
+    window use ``from`` and ``size``, deeper pages ``search_after``.
+    """
+
+    def paginate_search(self, search: Search, request, view=None) -> list:
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        try:
+            self.page_number = int(request.query_params.get(self.page_query_param, 1))
+            if self.page_number < 1:
+                raise ValueError
+        except ValueError:
+            raise NotFound(_("Invalid page."))
+
+        search = search.extra(track_total_hits=settings.ES_TRACK_TOTAL_HITS)
+        offset = (self.page_number - 1) * self.page_size
+        if offset + self.page_size <= settings.ES_MAX_RESULT_WINDOW:
+            response = search[offset : offset + self.page_size].execute()
+        else:
+            response = get_search_after_page(search, offset, self.page_size)
+
+        perf_logger.info(
+            "Searching page %d of %s took %d ms",
+            self.page_number,
+            search._index,
+            response.took,
+        )
+        self.count = response.hits.total.value
+        # the total is a lower bound if there are more hits than are tracked
+        self.count_is_exact = response.hits.total.relation == "eq"
+        if self.page_number > 1 and not response.hits:
+            raise NotFound(_("Invalid page."))
+
+        return list(response.hits)
+
+    def get_next_link(self) -> Optional[str]:
+        if self.page_number * self.page_size >= self.count and self.count_is_exact:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.page_query_param, self.page_number + 1)
+
+    def get_previous_link(self) -> Optional[str]:
+        if self.page_number == 1:
+            return None
+        url = self.request.build_absolute_uri()
+        if self.page_number == 2:
+            return remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.page_query_param, self.page_number - 1)
+
     def get_paginated_response(self, data, fields: List[str]):
         return Response(
             {
                 "fields": fields,
                 "next": self.get_next_link(),
                 "previous": self.get_previous_link(),
-                "count": self.page.paginator.count,
+                "count": self.count,
                 "results": data,
             }
         )
@@ -5,6 +5,7 @@ from django.utils.translation import gettext_lazy as _
 
 from rest_framework import serializers
 
+from ..constants import ExportFormats
 from ..documents import ZaakDocument
 from ..models import SearchReport
 from .fields import OrderedMultipleChoiceField
@@ -49,6 +50,9 @@ class SearchSerializer(serializers.Serializer):
     omschrijving = serializers.CharField(
         required=False, help_text=_("Brief description of ZAAK.")
     )
+    toelichting = serializers.CharField(
+        required=False, help_text=_("Explanation of ZAAK.")
+    )
     eigenschappen = serializers.JSONField(
         required=False,
         help_text=_(
@@ -72,9 +76,35 @@ class SearchSerializer(serializers.Serializer):
         help_text=_("Include closed ZAAKen."),
         default=False,
     )
+    bbox = serializers.ListField(
+        child=serializers.FloatField(),
+        min_length=4,
+        max_length=4,
+        required=False,
+        help_text=_(
+            "Bounding box `[min longitude, min latitude, max longitude, max latitude]` "
+            "that the `zaakgeometrie` of the ZAAKen intersects."
+        ),
+    )
+    polygon = serializers.ListField(
+        child=serializers.ListField(
+            child=serializers.FloatField(), min_length=2, max_length=2
+        ),
+        min_length=3,
+        required=False,
+        help_text=_(
+            "Points `[longitude, latitude]` of a polygon that the `zaakgeometrie` of "
+            "the ZAAKen intersects."
+        ),
+    )
 
-    def validate_omschrijving(self, omschrijving):
-        return re.escape(omschrijving)
+    def validate_bbox(self, bbox):
+        min_lon, min_lat, max_lon, max_lat = bbox
+        if min_lon > max_lon or min_lat > max_lat:
+            raise serializers.ValidationError(
+                _("The minimum coordinates can't be larger than the maximum.")
+            )
+        return bbox
 
     def validate_fields(self, fields):
         if isinstance(fields, set):
@@ -207,6 +237,14 @@ class ZaakgeometrieSerializer(serializers.Serializer):
         return super().to_representation(instance)
 
 
+class ExportSerializer(serializers.Serializer):
+    export_format = serializers.ChoiceField(
+        choices=ExportFormats.choices,
+        default=ExportFormats.csv,
+        help_text=_("File format of the export."),
+    )
+
+
 class ZaakDocumentSerializer(serializers.Serializer):
     url = serializers.URLField(
         required=False,
@@ -274,6 +312,61 @@ class ZaakDocumentSerializer(serializers.Serializer):
     )
 
 
+class FacetBucketSerializer(serializers.Serializer):
+    value = serializers.CharField(help_text=_("Value of the facet."))
+    count = serializers.IntegerField(help_text=_("Number of ZAAKen with the value."))
+
+
+class SearchFacetsSerializer(serializers.Serializer):
+    count = serializers.IntegerField(
+        help_text=_(
+            "Number of ZAAKen that match the search. Large numbers are a lower bound."
+        )
+    )
+    zaaktypen = FacetBucketSerializer(
+        many=True, help_text=_("Number of ZAAKen per `omschrijving` of ZAAKTYPE.")
+    )
+    statustypen = FacetBucketSerializer(
+        many=True, help_text=_("Number of ZAAKen per STATUSTYPE of the STATUS.")
+    )
+    vertrouwelijkheidaanduidingen = FacetBucketSerializer(
+        many=True, help_text=_("Number of ZAAKen per vertrouwelijkheidaanduiding.")
+    )
+    afgesloten = FacetBucketSerializer(
+        many=True, help_text=_("Number of `open` and `closed` ZAAKen.")
+    )
+    behandelaars = FacetBucketSerializer(
+        many=True, help_text=_("Number of ZAAKen per username of the behandelaar.")
+    )
+    startdatum = FacetBucketSerializer(
+        many=True, help_text=_("Number of ZAAKen per month of the `startdatum`.")
+    )
+    deadline = FacetBucketSerializer(
+        many=True, help_text=_("Number of ZAAKen per month of the deadline.")
+    )
+
+
+class ClusterSerializer(serializers.Serializer):
+    zoom = serializers.IntegerField(
+        min_value=0,
+        max_value=29,
+        help_text=_("Zoom level of the map tiles the ZAAKen are clustered on."),
+    )
+
+
+class GeoPointSerializer(serializers.Serializer):
+    lat = serializers.FloatField(help_text=_("Latitude."))
+    lon = serializers.FloatField(help_text=_("Longitude."))
+
+
+class ZaakClusterSerializer(serializers.Serializer):
+    tile = serializers.CharField(help_text=_("Map tile as `{zoom}/{x}/{y}`."))
+    count = serializers.IntegerField(help_text=_("Number of ZAAKen on the tile."))
+    centroid = GeoPointSerializer(
+        help_text=_("Centroid of the `zaakgeometrie` of the ZAAKen on the tile.")
+    )
+
+
 class QSZaakDocumentSerializer(serializers.Serializer):
     identificatie = serializers.CharField(
         required=False, help_text=_("Unique identification of the ZAAK.")
@@ -2,7 +2,15 @@ from django.urls import include, path
 
 from rest_framework.routers import SimpleRouter
 
-from .views import GetZakenView, QuickSearchView, SearchReportViewSet, SearchView
+from .views import (
+    GetZakenView,
+    QuickSearchView,
+    SearchClustersView,
+    SearchExportView,
+    SearchFacetsView,
+    SearchReportViewSet,
+    SearchView,
+)
 
 router = SimpleRouter()
 router.register(r"reports", SearchReportViewSet)
@@ -11,5 +19,8 @@ urlpatterns = [
     path("", include(router.urls)),
     path("zaken/autocomplete", GetZakenView.as_view(), name="zaken-search"),
     path("zaken", SearchView.as_view(), name="search"),
+    path("zaken/clusters", SearchClustersView.as_view(), name="search-clusters"),
+    path("zaken/export", SearchExportView.as_view(), name="search-export"),
+    path("zaken/facets", SearchFacetsView.as_view(), name="search-facets"),
     path("quick-search", QuickSearchView.as_view(), name="quick-search"),
 ]
@@ -17,6 +17,10 @@ def get_document_fields(
     """
     fields = OrderedDict(fields)
     for field_name, field_value in fields.items():
+        # fields that are only stored can't be searched or sorted on
+        if field_value.get("index") is False or field_value.get("enabled") is False:
+            continue
+
         field_type = field_value["type"]
         if field_type in [field.Nested.name, field.Object.name]:
             properties = field_value.get("properties")
@@ -1,8 +1,11 @@
 from typing import List
 
+from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
+from elasticsearch_dsl import Search
 from rest_framework import views
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
@@ -18,16 +21,27 @@ from zac.core.api.serializers import ZaakSerializer
 from zac.core.services import get_zaaktypen
 
 from ..documents import ZaakDocument
+from ..export import export_search
 from ..models import SearchReport
-from ..searches import autocomplete_zaak_search, quick_search, search_zaken
+from ..searches import (
+    autocomplete_zaak_search,
+    get_zaken_clusters,
+    get_zaken_facets,
+    get_zaken_search,
+    quick_search,
+)
 from .filters import ESOrderingFilter
 from .pagination import ESPagination
 from .parsers import IgnoreCamelCaseJSONParser
 from .serializers import (
+    ClusterSerializer,
+    ExportSerializer,
     QuickSearchResultSerializer,
     QuickSearchSerializer,
+    SearchFacetsSerializer,
     SearchReportSerializer,
     SearchSerializer,
+    ZaakClusterSerializer,
     ZaakDocumentSerializer,
     ZaakIdentificatieSerializer,
 )
@@ -64,7 +78,7 @@ class GetZakenView(views.APIView):
 
 
 class PerformSearchMixin:
-    def perform_search(self, search_query):
+    def get_search(self, search_query) -> Search:
         if search_query.get("zaaktype"):
             zaaktype_data = search_query.pop("zaaktype")
 
@@ -92,8 +106,7 @@ class PerformSearchMixin:
 
             search_query["zaaktypen"] = [url for url in set(urls)]
 
-        results = search_zaken(**search_query, request=self.request)
-        return results
+        return get_zaken_search(**search_query, request=self.request)
 
 
 class SearchView(PerformSearchMixin, views.APIView):
@@ -119,8 +132,8 @@ class SearchView(PerformSearchMixin, views.APIView):
                 self._paginator = self.pagination_class()
         return self._paginator
 
-    def paginate_results(self, results):
-        return self.paginator.paginate_queryset(results, self.request, view=self)
+    def paginate_search(self, search: Search) -> List[ZaakDocument]:
+        return self.paginator.paginate_search(search, self.request, view=self)
 
     def get_paginated_response(self, data, fields: List[str]):
         """
@@ -160,14 +173,106 @@ class SearchView(PerformSearchMixin, views.APIView):
             "ordering": ordering,
         }
 
-        results = self.perform_search(search_query)
-        page = self.paginate_results(results)
+        search = self.get_search(search_query)
+        page = self.paginate_search(search)
         serializer = ZaakDocumentSerializer(page, many=True)
         return self.get_paginated_response(
             serializer.data, input_serializer.validated_data["fields"]
         )
 
 
+EXPORT_RESPONSES = {
+    (200, "text/csv"): OpenApiTypes.BINARY,
+    (
+        200,
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ): OpenApiTypes.BINARY,
+}
+
+
+class SearchExportView(SearchView):
+    @extend_schema(
+        summary=_("Export the ZAAKen of a search in elasticsearch."),
+        parameters=[
+            es_document_to_ordering_parameters(ZaakDocument),
+            *input_serializer_to_parameters(ExportSerializer),
+        ],
+        responses=EXPORT_RESPONSES,
+    )
+    def post(self, request, *args, **kwargs):
+        """
+        Export all the zaken that match the input data as CSV or XLSX file, with a
+        column for each of the requested fields.
+        The export contains only zaken the user has permissions to see.
+
+        """
+        export_serializer = ExportSerializer(data=request.query_params)
+        export_serializer.is_valid(raise_exception=True)
+        input_serializer = self.serializer_class(data=request.data)
+        input_serializer.is_valid(raise_exception=True)
+
+        search_query = {
+            **input_serializer.validated_data,
+            "ordering": ESOrderingFilter().get_ordering(request, self),
+        }
+        search = self.get_search(search_query)
+        return export_search(
+            search,
+            input_serializer.validated_data["fields"],
+            export_serializer.validated_data["export_format"],
+        )
+
+
+class SearchFacetsView(SearchView):
+    @extend_schema(
+        summary=_("Count the ZAAKen of a search in elasticsearch per facet."),
+        responses=SearchFacetsSerializer,
+    )
+    def post(self, request, *args, **kwargs):
+        """
+        Count the zaken that match the input data per zaaktype, status,
+        vertrouwelijkheidaanduiding, open or closed, behandelaar and month of the
+        startdatum and deadline.
+        The counts contain only zaken the user has permissions to see.
+
+        """
+        input_serializer = self.serializer_class(data=request.data)
+        input_serializer.is_valid(raise_exception=True)
+
+        search = self.get_search({**input_serializer.validated_data, "ordering": None})
+        serializer = SearchFacetsSerializer(get_zaken_facets(search))
+        return Response(serializer.data)
+
+
+class SearchClustersView(SearchView):
+    pagination_class = None
+
+    @extend_schema(
+        summary=_("Cluster the ZAAKen of a search in elasticsearch on a map."),
+        parameters=input_serializer_to_parameters(ClusterSerializer),
+        responses=ZaakClusterSerializer(many=True),
+    )
+    def post(self, request, *args, **kwargs):
+        """
+        Count the zaken that match the input data per tile of a map at the zoom
+        level, with the centroid of their `zaakgeometrie`. Zaken without a
+        `zaakgeometrie` are left out.
+        The clusters contain only zaken the user has permissions to see.
+
+        """
+        cluster_serializer = ClusterSerializer(data=request.query_params)
+        cluster_serializer.is_valid(raise_exception=True)
+        input_serializer = self.serializer_class(data=request.data)
+        input_serializer.is_valid(raise_exception=True)
+
+        search = self.get_search({**input_serializer.validated_data, "ordering": None})
+        clusters = get_zaken_clusters(
+            search, precision=cluster_serializer.validated_data["zoom"]
+        )
+        serializer = ZaakClusterSerializer(clusters, many=True)
+        return Response(serializer.data)
+
+
 class QuickSearchView(views.APIView):
     permission_classes = (IsAuthenticated,)
     serializer_class = QuickSearchSerializer
@@ -221,6 +326,14 @@ class QuickSearchView(views.APIView):
         ],
         responses=ZaakDocumentSerializer(many=True),
     ),
+    export=extend_schema(
+        summary=_("Export search report results."),
+        parameters=[
+            es_document_to_ordering_parameters(ZaakDocument),
+            *input_serializer_to_parameters(ExportSerializer),
+        ],
+        responses=EXPORT_RESPONSES,
+    ),
 )
 class SearchReportViewSet(PerformSearchMixin, ModelViewSet):
     ordering = ("-identificatie.keyword",)
@@ -243,9 +356,27 @@ class SearchReportViewSet(PerformSearchMixin, ModelViewSet):
         if ordering:
             search_report.query = {**search_report.query, "ordering": ordering}
 
-        results = self.perform_search(search_report.query)
-        page = self.paginate_queryset(results)
+        search = self.get_search(search_report.query)
+        page = self.paginator.paginate_search(search, request, view=self)
         serializer = ZaakDocumentSerializer(page, many=True)
         return self.get_paginated_response(
             serializer.data, search_report.query["fields"]
         )
+
+    @action(detail=True)
+    def export(self, request, *args, **kwargs):
+        export_serializer = ExportSerializer(data=request.query_params)
+        export_serializer.is_valid(raise_exception=True)
+
+        search_report = self.get_object()
+        ordering = ESOrderingFilter().get_ordering(self.request, self)
+        if ordering:
+            search_report.query = {**search_report.query, "ordering": ordering}
+
+        search = self.get_search(search_report.query)
+        return export_search(
+            search,
+            search_report.query["fields"],
+            export_serializer.validated_data["export_format"],
+            filename=slugify(search_report.name) or "zaken",
+        )
@@ -0,0 +1,128 @@
+"""
+Export the zaken of a search as CSV or XLSX.
+
+The hits are retrieved in batches with ``search_after``, so the memory use doesn't
+depend on the number of zaken that match.
+"""
+import csv
+import itertools
+import json
+import tempfile
+from typing import Any, Iterator, List
+
+from django.conf import settings
+from django.http import FileResponse, StreamingHttpResponse
+
+from elasticsearch_dsl import Search
+from elasticsearch_dsl.response import Hit
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+from .constants import ExportFormats
+from .utils import iter_search_after
+
+# values starting with these are evaluated as formulas by spreadsheet applications
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def iter_search_hits(search: Search, batch_size: int) -> Iterator[Hit]:
+    """
+    Yield all the hits of the search, retrieved in batches with ``search_after``.
+    """
+    search = search.extra(track_total_hits=False)
+    for response in iter_search_after(search, itertools.repeat(batch_size)):
+        yield from response.hits
+
+
+def get_field_values(source: dict, field: str) -> List[Any]:
+    """
+    Get the values of a (dotted) field, the values of nested documents are collected.
+    """
+    values = [source]
+    for key in field.split("."):
+        nested_values = []
+        for value in values:
+            if not isinstance(value, dict) or value.get(key) is None:
+                continue
+            if isinstance(value[key], list):
+                nested_values += value[key]
+            else:
+                nested_values.append(value[key])
+        values = nested_values
+    return values
+
+
+def get_row(hit: Hit, fields: List[str]) -> List[str]:
+    source = hit.to_dict()
+    return [
+        ", ".join(
+            json.dumps(value) if isinstance(value, dict) else str(value)
+            for value in get_field_values(source, field)
+        )
+        for field in fields
+    ]
+
+
+class Echo:
+    """
+    File-like object that returns what is written, to stream the CSV rows.
+    """
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def escape_formula(value: str) -> str:
+    """
+    Prevent a value from being evaluated as formula when the CSV is opened.
+    """
+    return f"'{value}" if value.startswith(FORMULA_PREFIXES) else value
+
+
+def stream_csv(hits: Iterator[Hit], fields: List[str]) -> Iterator[str]:
+    writer = csv.writer(Echo())
+    yield writer.writerow(fields)
+    for hit in hits:
+        yield writer.writerow([escape_formula(value) for value in get_row(hit, fields)])
+
+
+def get_text_cell(sheet, value: str) -> WriteOnlyCell:
+    cell = WriteOnlyCell(sheet, ILLEGAL_CHARACTERS_RE.sub("", value))
+    # openpyxl writes strings starting with "=" as formula otherwise
+    cell.data_type = "s"
+    return cell
+
+
+def write_xlsx(hits: Iterator[Hit], fields: List[str], outfile) -> None:
+    # the rows of a write-only workbook are flushed to disk as they're appended
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(fields)
+    for hit in hits:
+        sheet.append([get_text_cell(sheet, value) for value in get_row(hit, fields)])
+    workbook.save(outfile)
+
+
+def export_search(
+    search: Search, fields: List[str], export_format: str, filename: str = "zaken"
+) -> StreamingHttpResponse:
+    search = search.source(fields)
+    hits = iter_search_hits(search, settings.ES_EXPORT_BATCH_SIZE)
+
+    if export_format == ExportFormats.xlsx:
+        outfile = tempfile.TemporaryFile()
+        write_xlsx(hits, fields, outfile)
+        outfile.seek(0)
+        return FileResponse(
+            outfile,
+            as_attachment=True,
+            filename=f"{filename}.xlsx",
+            content_type=(
+                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            ),
+        )
+
+    response = StreamingHttpResponse(stream_csv(hits, fields), content_type="text/csv")
+    response["Content-Disposition"] = f'attachment; filename="{filename}.csv"'
+    return response
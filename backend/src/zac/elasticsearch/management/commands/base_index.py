@@ -1,17 +1,24 @@
 from abc import ABC, abstractmethod
+from itertools import islice
 from typing import Iterator
 
+from django.conf import settings
 from django.core.management.base import CommandParser
 
-from elasticsearch.helpers import bulk
+from elasticsearch.helpers import BulkIndexError, streaming_bulk
 from elasticsearch_dsl import Index
 from elasticsearch_dsl.connections import connections
 
+from ...documents import PermissionsDocument
 from ...utils import check_if_index_exists
+from ..metrics import IndexMetrics
 from ..utils import ProgressOutputWrapper
 
 NOTIMPLEMENTED_MSG = "Child classes must declare {field}."
 
+# the default chunk size of ``streaming_bulk``
+BULK_CHUNK_SIZE = 500
+
 
 class IndexCommand(ABC):
     help = "Create documents in ES by indexing all enkelvoudigeinformatieobjects from DRC API"
@@ -81,6 +88,15 @@ class IndexCommand(ABC):
                 "fine-grained feedback."
             ),
         )
+        parser.add_argument(
+            "--report-interval",
+            type=int,
+            help="Print the indexing metrics every REPORT_INTERVAL seconds.",
+        )
+        parser.add_argument(
+            "--metrics-report",
+            help="Write the indexing metrics as JSON to the file METRICS_REPORT.",
+        )
 
     def handle(self, **options):
         # redefine self.stdout as ProgressOutputWrapper cause logging is dependent whether
@@ -90,11 +106,17 @@ class IndexCommand(ABC):
         self.max_workers = options["max_workers"]
         self.reindex_last = options["reindex_last"]
         self.es_client = connections.get_connection()
+        self.metrics = IndexMetrics(report_interval=options["report_interval"])
+        self.create_permissions_index()
         if self.reindex_last:
             self.handle_reindexing()
         else:
             self.handle_indexing()
 
+        self.stdout.write(self.metrics.format_table())
+        if metrics_report := options["metrics_report"]:
+            self.metrics.write_report(metrics_report)
+
     def handle_reindexing(self):
         # Make sure the index exists...
         check_if_index_exists(index=self.index)
@@ -117,16 +139,52 @@ class IndexCommand(ABC):
         self.stdout.write(f"{count} {self.verbose_name_plural} are received.")
 
     def bulk_upsert(self):
-        bulk(
-            self.es_client,
-            self.batch_index(),
-        )
+        errors = []
+        actions = self.metrics.time_iterator("generate", self.batch_index())
+        # send one bulk request per chunk, so that every request is timed on its own
+        while chunk := list(islice(actions, BULK_CHUNK_SIZE)):
+            with self.metrics.stage("bulk", items=len(chunk)):
+                results = list(
+                    streaming_bulk(
+                        self.es_client,
+                        chunk,
+                        chunk_size=len(chunk),
+                        raise_on_error=False,
+                    )
+                )
+
+            for ok, result in results:
+                if ok:
+                    continue
+                errors.append(result)
+                op_result = next(iter(result.values()))
+                # 429 - the bulk request was rejected because ES is overloaded
+                if op_result.get("status") == 429:
+                    self.metrics.increment("bulk_rejected")
+                else:
+                    self.metrics.increment("bulk_failed")
+
+            if self.metrics.report_due():
+                self.stdout.write(self.metrics.format_table(), ending="\n")
+
+        if errors:
+            raise BulkIndexError(
+                "%i document(s) failed to index." % len(errors), errors
+            )
 
     def check_if_done_batching(self) -> bool:
         if self.reindex_last and self.reindex_last - self.reindexed == 0:
             return True
         return False
 
+    def create_permissions_index(self):
+        """
+        Create the index the permission filters of the searches look up large sets of
+        object URLs from, so that the searches themselves only write the documents.
+        """
+        if not Index(settings.ES_INDEX_PERMISSIONS).exists():
+            PermissionsDocument.init()
+
     def clear_index(self):
         index = Index(self.index)
         index.delete(ignore=404)
@@ -0,0 +1,154 @@
+import logging
+from abc import ABC, abstractmethod
+from typing import Iterator, List, Set, Union
+from urllib.parse import parse_qs, urlparse
+from uuid import UUID
+
+from django.core.management.base import CommandParser
+
+from elasticsearch.helpers import bulk, scan
+from elasticsearch_dsl.connections import connections
+
+from zac.client import Client
+
+from ...utils import check_if_index_exists
+from .base_index import NOTIMPLEMENTED_MSG
+
+logger = logging.getLogger(__name__)
+
+CompactID = Union[int, str]
+
+
+def compact_id(_id: str) -> CompactID:
+    """
+    Store canonical UUIDs as (much smaller) integers, anything else as is.
+    """
+    try:
+        uuid = UUID(_id)
+    except ValueError:
+        return _id
+    return uuid.int if str(uuid) == _id else _id
+
+
+def expand_id(_id: CompactID) -> str:
+    return str(UUID(int=_id)) if isinstance(_id, int) else _id
+
+
+class ReconcileCommand(ABC):
+    """
+    Remove documents from an index that no longer exist in the source API(s).
+
+    Only IDs are handled: the index is scanned without ``_source`` and the source
+    API(s) are paged through without resolving the records, so memory stays limited
+    to one compact set of IDs.
+    """
+
+    _index = None
+    _verbose_name_plural = None
+
+    @property
+    def index(self):
+        if not self._index:
+            raise NotImplementedError(NOTIMPLEMENTED_MSG.format(field="_index"))
+        return self._index
+
+    @property
+    def verbose_name_plural(self):
+        if not self._verbose_name_plural:
+            raise NotImplementedError(
+                NOTIMPLEMENTED_MSG.format(field="_verbose_name_plural")
+            )
+        return self._verbose_name_plural
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report the differences, don't delete anything from the index.",
+        )
+
+    def handle(self, **options):
+        check_if_index_exists(index=self.index)
+        self.es_client = connections.get_connection()
+
+        # Collect the indexed IDs before the source IDs - documents indexed in the
+        # meantime are then guaranteed to be seen in the source API(s) as well.
+        orphans = self.get_indexed_ids()
+        num_indexed = len(orphans)
+
+        num_source = 0
+        num_missing = 0
+        for _id in self.get_source_ids():
+            num_source += 1
+            try:
+                orphans.remove(compact_id(_id))
+            except KeyError:
+                num_missing += 1
+
+        self.stdout.write(
+            "Found %d %s in the source API(s)." % (num_source, self.verbose_name_plural)
+        )
+        self.stdout.write(
+            "Found %d %s in index %s, %d are deleted from the source API(s) and %d are not indexed yet."
+            % (
+                num_indexed,
+                self.verbose_name_plural,
+                self.index,
+                len(orphans),
+                num_missing,
+            )
+        )
+
+        if options["dry_run"] or not orphans:
+            return
+
+        deleted, errors = self.bulk_delete(orphans)
+        self.stdout.write(
+            "Deleted %d %s from index %s."
+            % (deleted, self.verbose_name_plural, self.index)
+        )
+        if errors:
+            self.stdout.write(
+                "Failed to delete %d %s." % (len(errors), self.verbose_name_plural)
+            )
+
+    def get_indexed_ids(self) -> Set[CompactID]:
+        return {
+            compact_id(hit["_id"])
+            for hit in scan(self.es_client, index=self.index, _source=False)
+        }
+
+    def bulk_delete(self, ids: Set[CompactID]) -> tuple:
+        def _actions():
+            for _id in ids:
+                logger.info(
+                    "Document %s in index %s has been deleted.",
+                    expand_id(_id),
+                    self.index,
+                )
+                yield {
+                    "_op_type": "delete",
+                    "_index": self.index,
+                    "_id": expand_id(_id),
+                }
+
+        # documents could have been deleted by notifications in the meantime
+        return bulk(self.es_client, _actions(), raise_on_error=False)
+
+    def iter_source_pages(self, client: Client, resource: str) -> Iterator[List[dict]]:
+        query_params = {}
+        while True:
+            # if this is running for 1h+, the token expires
+            client.refresh_auth()
+            response = client.list(resource, query_params=query_params)
+            yield response["results"]
+
+            if not response["next"]:
+                return
+            next_url = urlparse(response["next"])
+            query_params["page"] = [int(parse_qs(next_url.query)["page"][0])]
+
+    @abstractmethod
+    def get_source_ids(self) -> Iterator[str]:
+        pass
@@ -0,0 +1,24 @@
+from django.core.management import BaseCommand, call_command
+from django.core.management.base import CommandParser
+
+
+class Command(BaseCommand):
+    help = "Deletes ZAAKs, INFORMATIEOBJECTs and OBJECTs from ES that no longer exist in the source APIs."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report the differences, don't delete anything from the indices.",
+        )
+
+    def handle(self, **options):
+        args = ["--dry-run"] if options["dry_run"] else []
+        for command in [
+            "check_for_deleted_zaken",
+            "check_for_deleted_documenten",
+            "check_for_deleted_objecten",
+        ]:
+            self.stdout.write(f"Calling {command} {' '.join(args)}")
+            call_command(command, *args, stdout=self.stdout._out)
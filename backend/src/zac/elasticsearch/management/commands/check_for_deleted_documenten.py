@@ -0,0 +1,24 @@
+from typing import Iterator
+
+from django.conf import settings
+from django.core.management import BaseCommand
+
+from zgw_consumers.constants import APITypes
+from zgw_consumers.models import Service
+
+from ...api import _get_uuid_from_url
+from .base_reconcile import ReconcileCommand
+
+
+class Command(ReconcileCommand, BaseCommand):
+    help = "Delete documents from ES by checking if they exist in the DRC APIs"
+    _index = settings.ES_INDEX_DOCUMENTEN
+    _verbose_name_plural = "informatieobjecten"
+
+    def get_source_ids(self) -> Iterator[str]:
+        for drc in Service.objects.filter(api_type=APITypes.drc):
+            client = drc.build_client()
+            for documenten in self.iter_source_pages(
+                client, "enkelvoudiginformatieobject"
+            ):
+                yield from (_get_uuid_from_url(doc["url"]) for doc in documenten)
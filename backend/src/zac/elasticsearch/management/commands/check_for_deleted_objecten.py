@@ -0,0 +1,20 @@
+from typing import Iterator
+
+from django.conf import settings
+from django.core.management import BaseCommand
+
+from zac.core.services import get_objects_client
+
+from ...api import _get_uuid_from_url
+from .base_reconcile import ReconcileCommand
+
+
+class Command(ReconcileCommand, BaseCommand):
+    help = "Delete documents from ES by checking if they exist in the OBJECTS API"
+    _index = settings.ES_INDEX_OBJECTEN
+    _verbose_name_plural = "objecten"
+
+    def get_source_ids(self) -> Iterator[str]:
+        client = get_objects_client()
+        for objects in self.iter_source_pages(client, "object"):
+            yield from (_get_uuid_from_url(obj["url"]) for obj in objects)
@@ -1,37 +1,22 @@
-import logging
 from typing import Iterator
 
 from django.conf import settings
 from django.core.management import BaseCommand
 
-from elasticsearch.helpers import bulk, scan
-from elasticsearch_dsl.connections import connections
+from zgw_consumers.constants import APITypes
+from zgw_consumers.models import Service
 
-from zac.core.services import get_zaken_all
+from ...api import _get_uuid_from_url
+from .base_reconcile import ReconcileCommand
 
-from ...utils import check_if_index_exists
 
-
-class Command(BaseCommand):
+class Command(ReconcileCommand, BaseCommand):
     help = "Delete documents from ES by checking if they exist in the ZAKEN API"
-
-    def handle(self, **options):
-        check_if_index_exists()
-        self.zaken_uuids = [str(zaak.uuid) for zaak in get_zaken_all()]
-        self.stdout.write("Found %d zaken in Open Zaak API." % len(self.zaken_uuids))
-        self.bulk_delete_zaken()
-
-    def find_deleted_zaken(self) -> Iterator[dict]:
-        for zd in scan(
-            connections.get_connection(),
-            index=settings.ES_INDEX_ZAKEN,
-            _source=False,
-        ):
-            if zd["_id"] not in self.zaken_uuids:
-                logging.info("Zaak with uuid %s has been deleted.", zd["_id"])
-                zd["_op_type"] = "delete"
-                del zd["_type"]  # To shutup ElasticsearchDeprecation warnings
-                yield zd
-
-    def bulk_delete_zaken(self):
-        bulk(connections.get_connection(), self.find_deleted_zaken())
+    _index = settings.ES_INDEX_ZAKEN
+    _verbose_name_plural = "zaken"
+
+    def get_source_ids(self) -> Iterator[str]:
+        for zrc in Service.objects.filter(api_type=APITypes.zrc):
+            client = zrc.build_client()
+            for zaken in self.iter_source_pages(client, "zaak"):
+                yield from (_get_uuid_from_url(zaak["url"]) for zaak in zaken)
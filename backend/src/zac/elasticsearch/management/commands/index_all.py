@@ -55,6 +55,6 @@ class Command(BaseCommand):
         self.stdout.write(f"Calling index_documenten {' '.join(args)}")
         call_command("index_documenten", *args)
         self.stdout.write("Done indexing documenten.")
-        self.stdout.write(f"Calling index_objecten")
-        call_command("index_objecten")
+        self.stdout.write(f"Calling index_objecten {' '.join(args)}")
+        call_command("index_objecten", *args)
         self.stdout.write("Done indexing objecten.")
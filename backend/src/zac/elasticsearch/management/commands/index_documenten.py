@@ -1,25 +1,21 @@
-import logging
 from typing import Dict, Iterator, List
 
 from django.conf import settings
 from django.core.management import BaseCommand
 
 import click
-from elasticsearch_dsl.query import Bool, Nested, Terms
 from zgw_consumers.api_models.documenten import Document
 from zgw_consumers.constants import APITypes
 from zgw_consumers.models import Service
 
 from zac.core.services import get_documenten_all_paginated
 
-from ...api import create_informatieobject_document, create_related_zaak_document
-from ...documents import InformatieObjectDocument, RelatedZaakDocument, ZaakDocument
+from ...api import create_informatieobject_document
+from ...documents import InformatieObjectDocument
 from ...utils import check_if_index_exists
-from ..utils import get_memory_usage
+from ..utils import get_related_zaken_index
 from .base_index import IndexCommand
 
-perf_logger = logging.getLogger("performance")
-
 
 class Command(IndexCommand, BaseCommand):
     help = "Create documents in ES by indexing all informatieobjects from DRC APIs. Requires zaken to already be indexed."
@@ -33,6 +29,13 @@ class Command(IndexCommand, BaseCommand):
 
     def batch_index(self) -> Iterator[InformatieObjectDocument]:
         self.zaken_index_exists()
+        self.stdout.write("Preloading all related zaken...")
+        self.related_zaken = get_related_zaken_index(
+            "zaakinformatieobjecten", "informatieobject"
+        )
+        self.stdout.write(
+            f"Fetched related zaken for {len(self.related_zaken)} {self.verbose_name_plural}."
+        )
         self.stdout.write(
             f"Starting {self.verbose_name_plural} retrieval from the configured APIs."
         )
@@ -63,20 +66,16 @@ class Command(IndexCommand, BaseCommand):
             file=self.stdout.progress_file(),
         ) as bar:
             for client in clients:
-                perf_logger.info("Starting indexing for client %s.", client)
-                perf_logger.info("Memory usage: %s.", get_memory_usage())
                 get_more = True
                 query_params = {}
                 while get_more:
                     # if this is running for 1h+, DRC expires the token
                     client.refresh_auth()
-                    perf_logger.info(
-                        "Fetching indexable objects for client, query params: %r.",
-                        query_params,
-                    )
-                    documenten, query_params = get_documenten_all_paginated(
-                        client, query_params=query_params
-                    )
+                    with self.metrics.stage("fetch") as timer:
+                        documenten, query_params = get_documenten_all_paginated(
+                            client, query_params=query_params
+                        )
+                        timer.items = len(documenten)
                     # Make sure we're not retrieving more information than necessary on the zaken
                     if self.reindex_last and self.reindex_last - self.reindexed <= len(
                         documenten
@@ -96,40 +95,12 @@ class Command(IndexCommand, BaseCommand):
     def documenten_generator(
         self, documenten: List[Document]
     ) -> Iterator[InformatieObjectDocument]:
-
         eio_documenten = self.create_eio_documenten(documenten)
-        zaken = (
-            ZaakDocument.search()
-            .filter(
-                Nested(
-                    path="zaakinformatieobjecten",
-                    query=Bool(
-                        filter=Terms(
-                            zaakinformatieobjecten__informatieobject=[
-                                doc.url for doc in documenten
-                            ]
-                        )
-                    ),
-                )
-            )
-            .source(
-                [
-                    "identificatie",
-                    "url",
-                    "omschrijving",
-                    "bronorganisatie",
-                    "zaakinformatieobjecten.informatieobject",
-                    "zaaktype",
-                    "vertrouwelijkheidaanduiding",
-                ]
-            )
-            .execute()
-        )
-        related_zaken = self.create_related_zaken(zaken)
         for doc in documenten:
             eio_document = eio_documenten[doc.url]
-            eio_document.related_zaken = related_zaken.get(doc.url, [])
-            eiod = eio_document.to_dict(True)
+            eio_document.related_zaken = self.related_zaken.get(doc.url, [])
+            with self.metrics.stage("serialize", items=1):
+                eiod = eio_document.to_dict(True)
 
             yield eiod
             if self.reindex_last:
@@ -137,20 +108,6 @@ class Command(IndexCommand, BaseCommand):
                 if self.check_if_done_batching():
                     return
 
-    def create_related_zaken(
-        self, zaken: List[ZaakDocument]
-    ) -> Dict[str, RelatedZaakDocument]:
-        eio_to_zaken = {}
-        for zaak in zaken:
-            related_zaak = create_related_zaak_document(zaak)
-            for eio in zaak.zaakinformatieobjecten:
-                try:
-                    eio_to_zaken[eio.informatieobject].append(related_zaak)
-                except KeyError:
-                    eio_to_zaken[eio.informatieobject] = [related_zaak]
-
-        return eio_to_zaken
-
     def create_eio_documenten(
         self, documenten: List[Document]
     ) -> Dict[str, InformatieObjectDocument]:
@@ -1,161 +1,113 @@
-import logging
 from typing import Dict, Iterator, List
 
 from django.conf import settings
 from django.core.management import BaseCommand
-from django.core.management.base import CommandParser
 
-from elasticsearch.helpers import bulk
-from elasticsearch_dsl import Index
-from elasticsearch_dsl.connections import connections
-from elasticsearch_dsl.query import Bool, Nested, Terms
+import click
 
-from zac.core.models import CoreConfig
-from zac.core.services import fetch_objecttypes
-
-from ...api import (
-    create_object_document,
-    create_objecttype_document,
-    create_related_zaak_document,
-)
-from ...documents import (
-    ObjectDocument,
-    ObjectTypeDocument,
-    RelatedZaakDocument,
-    ZaakDocument,
+from zac.core.services import (
+    fetch_objecttypes,
+    get_objects_all_paginated,
+    get_objects_client,
 )
-from ...utils import check_if_index_exists
-from ..utils import ProgressOutputWrapper
 
-perf_logger = logging.getLogger("performance")
+from ...api import create_object_document, create_objecttype_document
+from ...documents import ObjectDocument, ObjectTypeDocument
+from ...utils import check_if_index_exists
+from ..utils import get_related_zaken_index
+from .base_index import IndexCommand
 
 
-class Command(BaseCommand):
+class Command(IndexCommand, BaseCommand):
     """
-    Based on the OBJECTS V1 API - TODO migrate to V2 for pagination support.
+    Based on the paginated OBJECTS V2 API.
 
     """
 
     help = "Create documents in ES by indexing all objecten from OBJECTS API. Requires zaken to be indexed already."
-    index = settings.ES_INDEX_OBJECTEN
-
-    def add_arguments(self, parser: CommandParser) -> None:
-        super().add_arguments(parser)
-        parser.add_argument(
-            "--max-workers",
-            type=int,
-            help="Indicates the max number of parallel workers (for memory management). Defaults to 4.",
-            default=4,
-        )
-        parser.add_argument(
-            "--progress",
-            "--show-progress",
-            action="store_true",
-            help=(
-                "Show a progress bar. Showing a progress bar disables other "
-                "fine-grained feedback."
-            ),
-        )
-
-    def handle(self, **options):
-        # redefine self.stdout as ProgressOutputWrapper cause logging is dependent whether
-        # we have a progress bar
-        show_progress = options["progress"]
-        self.stdout = ProgressOutputWrapper(show_progress, out=self.stdout._out)
-
-        self.max_workers = options["max_workers"]
-        self.es_client = connections.get_connection()
-        self.handle_indexing()
-
-    def handle_indexing(self):
-        # If we're indexing everything - clear the index.
-        self.clear_index()
-        ObjectDocument.init()
-        self.bulk_upsert()
-        index = Index(settings.ES_INDEX_OBJECTEN)
-        index.refresh()
-        count = index.search().count()
-        self.stdout.write(f"{count} objects are received from OBJECTS API.")
-
-    def bulk_upsert(self):
-        bulk(
-            self.es_client,
-            self.batch_index(),
-        )
+    _index = settings.ES_INDEX_OBJECTEN
+    _type = "object"
+    _document = ObjectDocument
+    _verbose_name_plural = "objecten"
 
     def zaken_index_exists(self) -> bool:
-        check_if_index_exists(index=settings.ES_INDEX_ZAKEN)
+        return check_if_index_exists(index=settings.ES_INDEX_ZAKEN)
 
     def batch_index(self) -> Iterator[ObjectDocument]:
         self.zaken_index_exists()
+        self.stdout.write("Preloading all related zaken...")
+        self.related_zaken = get_related_zaken_index("zaakobjecten", "object")
+        self.stdout.write(
+            f"Fetched related zaken for {len(self.related_zaken)} {self.verbose_name_plural}."
+        )
         self.stdout.write("Preloading all object types...")
-        ots = {ot["url"]: ot for ot in fetch_objecttypes()}
-        self.stdout.write(f"Fetched {len(ots)} object types.")
-        self.stdout.write("Starting object retrieval from the configured OBJECTs API.")
+        self.objecttypes = {ot["url"]: ot for ot in fetch_objecttypes()}
+        self.stdout.write(f"Fetched {len(self.objecttypes)} object types.")
+        self.stdout.write(
+            f"Starting {self.verbose_name_plural} retrieval from the configured OBJECTS API."
+        )
 
-        conf = CoreConfig.get_solo()
-        object_service = conf.primary_objects_api
-        client = object_service.build_client()
+        client = get_objects_client()
 
-        objects = client.list("object")
-        for obj in objects:
-            obj["type"] = ots[obj["type"]]
+        # fetch the first page so we get the total count from the backend
+        response = client.list(self.type)
+        total_expected = response["count"]
+        self.stdout.write(
+            f"Number of {self.verbose_name_plural} in {client.base_url}:\n  {total_expected}."
+        )
 
-        yield from self.documenten_generator(objects)
+        if self.reindex_last:
+            total_expected = min(total_expected, self.reindex_last)
+
+        self.stdout.write("Now the real work starts, hold on!")
+        self.stdout.start_progress()
+
+        with click.progressbar(
+            length=total_expected,
+            label="Indexing ",
+            file=self.stdout.progress_file(),
+        ) as bar:
+            get_more = True
+            query_params = {}
+            while get_more:
+                client.refresh_auth()
+                with self.metrics.stage("fetch") as timer:
+                    objects, query_params = get_objects_all_paginated(
+                        client, query_params=query_params
+                    )
+                    timer.items = len(objects)
+                # Make sure we're not retrieving more information than necessary on the objects
+                if self.reindex_last and self.reindex_last - self.reindexed <= len(
+                    objects
+                ):
+                    objects = objects[: self.reindex_last - self.reindexed]
+
+                get_more = query_params.get("page", None)
+                yield from self.documenten_generator(objects)
+                bar.update(len(objects))
+
+                if self.check_if_done_batching():
+                    break
+
+        self.stdout.end_progress()
 
     def documenten_generator(self, objects: List[Dict]) -> Iterator[ObjectDocument]:
+        for obj in objects:
+            obj["type"] = self.objecttypes[obj["type"]]
+
         object_documenten = self.create_objecten_documenten(objects)
         objecttype_documenten = self.create_objecttype_documenten(objects)
-        zaken = (
-            ZaakDocument.search()
-            .filter(
-                Nested(
-                    path="zaakobjecten",
-                    query=Bool(
-                        filter=Terms(
-                            zaakobjecten__object=[obj["url"] for obj in objects]
-                        )
-                    ),
-                )
-            )
-            .source(
-                [
-                    "identificatie",
-                    "url",
-                    "omschrijving",
-                    "bronorganisatie",
-                    "zaakobjecten.object",
-                    "zaaktype",
-                    "vertrouwelijkheidaanduiding",
-                ]
-            )
-            .execute()
-        )
-        related_zaken = self.create_related_zaken(zaken)
         for obj in objects:
             object_document = object_documenten[obj["url"]]
             object_document.type = objecttype_documenten[obj["url"]]
-            object_document.related_zaken = related_zaken.get(obj["url"], [])
-            od = object_document.to_dict(True)
+            object_document.related_zaken = self.related_zaken.get(obj["url"], [])
+            with self.metrics.stage("serialize", items=1):
+                od = object_document.to_dict(True)
             yield od
-
-    def clear_index(self):
-        index = Index(self.index)
-        index.delete(ignore=404)
-
-    def create_related_zaken(
-        self, zaken: List[ZaakDocument]
-    ) -> Dict[str, RelatedZaakDocument]:
-        obj_to_zaken = {}
-        for zaak in zaken:
-            related_zaak = create_related_zaak_document(zaak)
-            for obj in zaak.zaakobjecten:
-                try:
-                    obj_to_zaken[obj.object].append(related_zaak)
-                except KeyError:
-                    obj_to_zaken[obj.object] = [related_zaak]
-
-        return obj_to_zaken
+            if self.reindex_last:
+                self.reindexed += 1
+                if self.check_if_done_batching():
+                    return
 
     def create_objecten_documenten(
         self, objects: List[Dict]
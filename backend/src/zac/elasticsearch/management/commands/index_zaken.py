@@ -1,18 +1,22 @@
-import logging
-from typing import Dict, Iterator, List
+from typing import Dict, Iterator, List, Optional
 
 from django.conf import settings
 from django.core.management import BaseCommand
+from django.core.management.base import CommandParser
 
 import click
 from zgw_consumers.concurrent import parallel
 from zgw_consumers.constants import APITypes
 from zgw_consumers.models import Service
+from zgw_consumers.service import get_paginated_results
 
+from zac.client import Client
 from zac.core.services import (
     fetch_zaaktype,
+    get_eigenschappen,
     get_rollen,
     get_status,
+    get_statustype,
     get_zaak_eigenschappen,
     get_zaak_informatieobjecten,
     get_zaakobjecten,
@@ -22,6 +26,7 @@ from zac.core.services import (
 from zgw.models import Zaak
 
 from ...api import (
+    _get_uuid_from_url,
     create_eigenschappen_document,
     create_rol_document,
     create_status_document,
@@ -38,10 +43,16 @@ from ...documents import (
     ZaakObjectDocument,
     ZaakTypeDocument,
 )
-from ..utils import get_memory_usage
-
-perf_logger = logging.getLogger("performance")
-
+from ...raw import (
+    create_eigenschappen_source,
+    create_rol_source,
+    create_status_source,
+    create_zaak_source,
+    create_zaakinformatieobject_source,
+    create_zaakobject_source,
+    create_zaaktype_source,
+)
+from ...read_model import READ_MODEL_VERSION
 from .base_index import IndexCommand
 
 
@@ -52,9 +63,29 @@ class Command(IndexCommand, BaseCommand):
     _document = ZaakDocument
     _verbose_name_plural = "zaken"
 
+    def add_arguments(self, parser: CommandParser) -> None:
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--raw",
+            action="store_true",
+            help=(
+                "Build the documents straight from the API responses instead of "
+                "going through the zgw_consumers data classes. The documents are "
+                "identical, but a lot cheaper to produce."
+            ),
+        )
+
+    def handle(self, **options):
+        self.raw = options["raw"]
+        super().handle(**options)
+
     def batch_index(self) -> Iterator[ZaakDocument]:
         self.stdout.write("Preloading all case types...")
         zaaktypen = {zt.url: zt for zt in get_zaaktypen()}
+        self.zaaktypen = zaaktypen
+        self.zaaktype_sources = {
+            url: create_zaaktype_source(zaaktype) for url, zaaktype in zaaktypen.items()
+        }
         self.stdout.write(f"Fetched {len(zaaktypen)} case types")
 
         self.stdout.write("Starting zaken retrieval from the configured APIs")
@@ -86,8 +117,6 @@ class Command(IndexCommand, BaseCommand):
             file=self.stdout.progress_file(),
         ) as bar:
             for client in clients:
-                perf_logger.info("Starting indexing for client %s", client)
-                perf_logger.info("Memory usage: %s", get_memory_usage())
                 get_more = True
                 # Set ordering explicitely
                 # FIXME: this implicitly assumes the generated or created identification
@@ -98,15 +127,11 @@ class Command(IndexCommand, BaseCommand):
                 while get_more:
                     # if this is running for 1h+, Open Zaak expires the token
                     client.refresh_auth()
-                    perf_logger.info(
-                        "Fetching cases for client, query params: %r", query_params
-                    )
-                    perf_logger.info("Memory usage: %s", get_memory_usage())
-                    zaken, query_params = get_zaken_all_paginated(
-                        client, query_params=query_params
-                    )
-                    perf_logger.info("Fetched %d cases", len(zaken))
-                    perf_logger.info("Memory usage: %s", get_memory_usage())
+                    with self.metrics.stage("fetch") as timer:
+                        zaken, query_params = get_zaken_all_paginated(
+                            client, query_params=query_params, raw=self.raw
+                        )
+                        timer.items = len(zaken)
                     # Make sure we're not retrieving more information than necessary on the zaken
                     if self.reindex_last and self.reindex_last - self.reindexed <= len(
                         zaken
@@ -114,14 +139,12 @@ class Command(IndexCommand, BaseCommand):
                         zaken = zaken[: self.reindex_last - self.reindexed]
 
                     get_more = query_params.get("page", None)
-                    for zaak in zaken:
-                        zaak.zaaktype = zaaktypen[zaak.zaaktype]
-
-                    perf_logger.info("Entering ES documents generator")
-                    perf_logger.info("Memory usage: %s", get_memory_usage())
-                    yield from self.documenten_generator(zaken)
-                    perf_logger.info("Exited ES documents generator")
-                    perf_logger.info("Memory usage: %s", get_memory_usage())
+                    if self.raw:
+                        yield from self.raw_documenten_generator(client, zaken)
+                    else:
+                        for zaak in zaken:
+                            zaak.zaaktype = zaaktypen[zaak.zaaktype]
+                        yield from self.documenten_generator(zaken)
                     bar.update(len(zaken))
 
                 if self.check_if_done_batching():
@@ -131,32 +154,16 @@ class Command(IndexCommand, BaseCommand):
         self.stdout.end_progress()
 
     def documenten_generator(self, zaken: List[Zaak]) -> Iterator[ZaakDocument]:
-        perf_logger.info("  In ES documents generator")
-        perf_logger.info("    Create zaak documents...")
         zaak_documenten = self.create_zaak_documenten(zaken)
-        perf_logger.info("    Create zaak documents finished")
-        perf_logger.info("    Create zaaktype documents...")
         zaaktype_documenten = self.create_zaaktype_documenten(zaken)
-        perf_logger.info("    Create zaaktype documents finished")
-        perf_logger.info("    Create status documents...")
         status_documenten = self.create_status_documenten(zaken)
-        perf_logger.info("    Create status documents finished")
-        perf_logger.info("    Create rol documents...")
         rollen_documenten = self.create_rollen_documenten(zaken)
-        perf_logger.info("    Create rol documents finished")
-        perf_logger.info("    Create eigenschap documents...")
         eigenschappen_documenten = self.create_eigenschappen_documenten(zaken)
-        perf_logger.info("    Create eigenschap documents finished")
-        perf_logger.info("    Create zaakobject documents...")
         zaakobjecten_documenten = self.create_zaakobject_documenten(zaken)
-        perf_logger.info("    Create zaakobject documents finished")
-        perf_logger.info("    Create zaakinformatieobject documents...")
         zaakinformatieobjecten_documenten = self.create_zaakinformatieobject_documenten(
             zaken
         )
-        perf_logger.info("    Create zaakinformatieobject documents finished")
 
-        perf_logger.info("    Relating all results for every zaak...")
         for zaak in zaken:
             zaakdocument = zaak_documenten[zaak.url]
             zaakdocument.zaaktype = zaaktype_documenten[zaak.url]
@@ -167,13 +174,112 @@ class Command(IndexCommand, BaseCommand):
             zaakdocument.zaakinformatieobjecten = zaakinformatieobjecten_documenten.get(
                 zaak.url, []
             )
-            zd = zaakdocument.to_dict(True)
+            zaakdocument.read_model_version = READ_MODEL_VERSION
+            with self.metrics.stage("serialize", items=1):
+                zd = zaakdocument.to_dict(True)
             yield zd
             if self.reindex_last:
                 self.reindexed += 1
                 if self.check_if_done_batching():
                     return
 
+    def raw_documenten_generator(
+        self, client: Client, zaken: List[dict]
+    ) -> Iterator[dict]:
+        """
+        Generate the same documents as ``documenten_generator``, from the raw JSON.
+        """
+
+        def _get_status(zaak: dict) -> Optional[dict]:
+            if not zaak["status"]:
+                return None
+            return client.retrieve("status", url=zaak["status"])
+
+        def _get_rollen(zaak: dict) -> List[dict]:
+            return get_paginated_results(
+                client, "rol", query_params={"zaak": zaak["url"]}
+            )
+
+        def _get_zaakeigenschappen(zaak: dict) -> List[dict]:
+            return client.list(
+                "zaakeigenschap", zaak_uuid=_get_uuid_from_url(zaak["url"])
+            )
+
+        def _get_zaakobjecten(zaak: dict) -> List[dict]:
+            return get_paginated_results(
+                client, "zaakobject", query_params={"zaak": zaak["url"]}
+            )
+
+        def _get_zaakinformatieobjecten(zaak: dict) -> List[dict]:
+            return client.list(
+                "zaakinformatieobject", query_params={"zaak": zaak["url"]}
+            )
+
+        def timed(name, func):
+            return self.metrics.timed(f"enrich.{name}", func)
+
+        with parallel(max_workers=self.max_workers) as executor:
+            statussen = list(executor.map(timed("status", _get_status), zaken))
+            list_of_rollen = list(executor.map(timed("rollen", _get_rollen), zaken))
+            list_of_eigenschappen = list(
+                executor.map(timed("eigenschappen", _get_zaakeigenschappen), zaken)
+            )
+            list_of_zon = list(
+                executor.map(timed("zaakobjecten", _get_zaakobjecten), zaken)
+            )
+            list_of_zios = list(
+                executor.map(
+                    timed("zaakinformatieobjecten", _get_zaakinformatieobjecten), zaken
+                )
+            )
+
+        formaten = {
+            eigenschap.url: eigenschap.specificatie.formaat
+            for zaaktype in {zaak["zaaktype"] for zaak in zaken}
+            for eigenschap in get_eigenschappen(self.zaaktypen[zaaktype])
+        }
+
+        for zaak, status, rollen, zaakeigenschappen, zon, zios in zip(
+            zaken,
+            statussen,
+            list_of_rollen,
+            list_of_eigenschappen,
+            list_of_zon,
+            list_of_zios,
+        ):
+            with self.metrics.stage("serialize", items=1):
+                source = create_zaak_source(zaak, self.zaaktypen[zaak["zaaktype"]])
+                source["zaaktype"] = self.zaaktype_sources[zaak["zaaktype"]]
+                if status:
+                    statustype = get_statustype(status["statustype"])
+                    source["status"] = create_status_source(
+                        status, statustype.omschrijving
+                    )
+                if rollen:
+                    source["rollen"] = [create_rol_source(rol) for rol in rollen]
+                if zaakeigenschappen:
+                    source["eigenschappen"] = create_eigenschappen_source(
+                        zaakeigenschappen, formaten
+                    )
+                if zon:
+                    source["zaakobjecten"] = [
+                        create_zaakobject_source(zo) for zo in zon
+                    ]
+                if zios:
+                    source["zaakinformatieobjecten"] = [
+                        create_zaakinformatieobject_source(zio) for zio in zios
+                    ]
+
+            yield {
+                "_id": _get_uuid_from_url(zaak["url"]),
+                "_index": self.index,
+                "_source": source,
+            }
+            if self.reindex_last:
+                self.reindexed += 1
+                if self.check_if_done_batching():
+                    return
+
     def create_zaak_documenten(self, zaken: List[Zaak]) -> Dict[str, ZaakDocument]:
         # Build the zaak_documenten
         zaak_documenten = {zaak.url: create_zaak_document(zaak) for zaak in zaken}
@@ -186,7 +292,10 @@ class Command(IndexCommand, BaseCommand):
             zaak.zaaktype for zaak in zaken if isinstance(zaak.zaaktype, str)
         }
         with parallel(max_workers=self.max_workers) as executor:
-            results = executor.map(fetch_zaaktype, unfetched_zaaktypen)
+            results = executor.map(
+                self.metrics.timed("enrich.zaaktype", fetch_zaaktype),
+                unfetched_zaaktypen,
+            )
         zaaktypen = {zaaktype.url: zaaktype for zaaktype in list(results)}
 
         for zaak in zaken:
@@ -200,7 +309,9 @@ class Command(IndexCommand, BaseCommand):
 
     def create_status_documenten(self, zaken: List[Zaak]) -> Dict[str, StatusDocument]:
         with parallel(max_workers=self.max_workers) as executor:
-            results = executor.map(get_status, zaken)
+            results = executor.map(
+                self.metrics.timed("enrich.status", get_status), zaken
+            )
         status_documenten = {
             status.zaak: create_status_document(status)
             for status in list(results)
@@ -213,7 +324,9 @@ class Command(IndexCommand, BaseCommand):
 
     def create_rollen_documenten(self, zaken: List[Zaak]) -> Dict[str, RolDocument]:
         with parallel(max_workers=self.max_workers) as executor:
-            results = list(executor.map(get_rollen, zaken))
+            results = list(
+                executor.map(self.metrics.timed("enrich.rollen", get_rollen), zaken)
+            )
 
         list_of_rollen = [rollen for rollen in results if rollen]
 
@@ -233,7 +346,12 @@ class Command(IndexCommand, BaseCommand):
     ) -> Dict[str, EigenschapDocument]:
         # Prefetch zaakeigenschappen
         with parallel(max_workers=self.max_workers) as executor:
-            list_of_eigenschappen = list(executor.map(get_zaak_eigenschappen, zaken))
+            list_of_eigenschappen = list(
+                executor.map(
+                    self.metrics.timed("enrich.eigenschappen", get_zaak_eigenschappen),
+                    zaken,
+                )
+            )
 
         eigenschappen_documenten = {
             zen[0].zaak: create_eigenschappen_document(zen)
@@ -252,7 +370,11 @@ class Command(IndexCommand, BaseCommand):
     ) -> Dict[str, ZaakObjectDocument]:
         # Prefetch zaakobjecten
         with parallel(max_workers=self.max_workers) as executor:
-            list_of_zon = list(executor.map(get_zaakobjecten, zaken))
+            list_of_zon = list(
+                executor.map(
+                    self.metrics.timed("enrich.zaakobjecten", get_zaakobjecten), zaken
+                )
+            )
 
         zaakobjecten_documenten = {
             zon[0].zaak: [create_zaakobject_document(zo) for zo in zon]
@@ -271,7 +393,14 @@ class Command(IndexCommand, BaseCommand):
     ) -> Dict[str, ZaakObjectDocument]:
         # Prefetch zaakinformatieobjecten
         with parallel(max_workers=self.max_workers) as executor:
-            list_of_zios = list(executor.map(get_zaak_informatieobjecten, zaken))
+            list_of_zios = list(
+                executor.map(
+                    self.metrics.timed(
+                        "enrich.zaakinformatieobjecten", get_zaak_informatieobjecten
+                    ),
+                    zaken,
+                )
+            )
 
         zaakinformatieobject_documenten = {
             zios[0].zaak: [create_zaakinformatieobject_document(zio) for zio in zios]
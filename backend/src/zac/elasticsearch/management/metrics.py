@@ -0,0 +1,197 @@
+import json
+import random
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from types import SimpleNamespace
+from typing import Callable, Dict, Iterator, List, Optional
+
+from .utils import get_memory_usage
+
+# Maximum number of durations kept per stage to calculate the percentiles from.
+RESERVOIR_SIZE = 10000
+
+
+class Stage:
+    """
+    Collect the timings of one indexing stage.
+
+    The durations are kept in a fixed size reservoir sample so that the percentiles
+    can be estimated without keeping every single duration in memory.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.items = 0
+        self.total = 0.0
+        self.durations: List[float] = []
+
+    def record(self, duration: float, items: int = 0) -> None:
+        self.calls += 1
+        self.items += items
+        self.total += duration
+        if len(self.durations) < RESERVOIR_SIZE:
+            self.durations.append(duration)
+        else:
+            index = random.randrange(self.calls)
+            if index < RESERVOIR_SIZE:
+                self.durations[index] = duration
+
+    def percentile(self, percentage: int) -> Optional[float]:
+        if not self.durations:
+            return None
+        durations = sorted(self.durations)
+        index = min(len(durations) - 1, int(len(durations) * percentage / 100))
+        return durations[index]
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "items": self.items,
+            "seconds": round(self.total, 3),
+            "items_per_second": round(self.items / self.total, 1)
+            if self.total and self.items
+            else None,
+            "p50_ms": self._ms(self.percentile(50)),
+            "p95_ms": self._ms(self.percentile(95)),
+            "p99_ms": self._ms(self.percentile(99)),
+        }
+
+    @staticmethod
+    def _ms(seconds: Optional[float]) -> Optional[float]:
+        return round(seconds * 1000, 1) if seconds is not None else None
+
+
+class IndexMetrics:
+    """
+    Structured stage timers and counters for the index commands.
+
+    Stages are timed with :meth:`stage` (a block of work on a number of items) or
+    :meth:`timed` (every call of a function, e.g. an upstream API call run in a
+    thread pool). Counters keep track of things like bulk rejections.
+    """
+
+    def __init__(self, report_interval: Optional[int] = None):
+        self.started = time.monotonic()
+        self.report_interval = report_interval
+        self.last_report = self.started
+        self.stages: Dict[str, Stage] = {}
+        self.counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, duration: float, items: int = 0) -> None:
+        with self._lock:
+            if name not in self.stages:
+                self.stages[name] = Stage(name)
+            self.stages[name].record(duration, items=items)
+
+    def increment(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    @contextmanager
+    def stage(self, name: str, items: int = 0) -> Iterator[SimpleNamespace]:
+        """
+        Time a block of work. Set ``items`` on the yielded object if the number of
+        processed items is only known afterwards.
+        """
+        timer = SimpleNamespace(items=items)
+        start = time.monotonic()
+        try:
+            yield timer
+        finally:
+            self.record(name, time.monotonic() - start, items=timer.items)
+
+    def timed(self, name: str, func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with self.stage(name, items=1):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    def time_iterator(self, name: str, iterator: Iterator) -> Iterator:
+        """
+        Record the time spent producing the items of ``iterator``.
+        """
+        iterator = iter(iterator)
+        while True:
+            start = time.monotonic()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.record(name, time.monotonic() - start)
+                return
+            self.record(name, time.monotonic() - start, items=1)
+            yield item
+
+    def report_due(self) -> bool:
+        if not self.report_interval:
+            return False
+        now = time.monotonic()
+        if now - self.last_report < self.report_interval:
+            return False
+        self.last_report = now
+        return True
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "elapsed_seconds": round(time.monotonic() - self.started, 3),
+                "memory_usage": get_memory_usage(),
+                "stages": {
+                    name: stage.to_dict() for name, stage in self.stages.items()
+                },
+                "counters": dict(self.counters),
+            }
+
+    def format_table(self) -> str:
+        report = self.to_dict()
+        header = (
+            "stage",
+            "calls",
+            "items",
+            "seconds",
+            "items/s",
+            "p50 ms",
+            "p95 ms",
+            "p99 ms",
+        )
+        rows = [header] + [
+            (
+                name,
+                *[
+                    "-" if value is None else str(value)
+                    for value in (
+                        stage["calls"],
+                        stage["items"],
+                        stage["seconds"],
+                        stage["items_per_second"],
+                        stage["p50_ms"],
+                        stage["p95_ms"],
+                        stage["p99_ms"],
+                    )
+                ],
+            )
+            for name, stage in report["stages"].items()
+        ]
+        widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+        lines = [
+            "  ".join(
+                value.ljust(width) if i == 0 else value.rjust(width)
+                for i, (value, width) in enumerate(zip(row, widths))
+            )
+            for row in rows
+        ]
+        lines.insert(1, "  ".join("-" * width for width in widths))
+        lines += [f"{name}: {value}" for name, value in report["counters"].items()]
+        lines.append(
+            f"Elapsed: {report['elapsed_seconds']}s, memory usage: {report['memory_usage']}"
+        )
+        return "\n".join(lines)
+
+    def write_report(self, path: str) -> None:
+        with open(path, "w") as outfile:
+            json.dump(self.to_dict(), outfile, indent=2)
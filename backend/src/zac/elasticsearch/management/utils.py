@@ -1,9 +1,15 @@
 import os
+from collections import defaultdict
 from io import StringIO
+from typing import Dict, List
 
 from django.core.management.base import OutputWrapper
 
 import psutil
+from elasticsearch_dsl.query import Bool, Exists, Nested
+
+from ..api import create_related_zaak_document
+from ..documents import RelatedZaakDocument, ZaakDocument
 
 
 def get_memory_usage():
@@ -13,6 +19,41 @@ def get_memory_usage():
     return f"{mem_mbytes} MB"
 
 
+def get_related_zaken_index(
+    path: str, field: str
+) -> Dict[str, List[RelatedZaakDocument]]:
+    """
+    Build an inverted index from the URLs in the nested ``path.field`` of the zaken
+    index to the related zaken.
+
+    The zaken index is scanned once so that every related zaak is found, rather than
+    running a (size capped) search for every page of objects that are indexed.
+    """
+    related_zaken = defaultdict(list)
+    zaken = (
+        ZaakDocument.search()
+        .filter(Nested(path=path, query=Bool(filter=Exists(field=f"{path}.{field}"))))
+        .source(
+            [
+                "identificatie",
+                "url",
+                "omschrijving",
+                "bronorganisatie",
+                f"{path}.{field}",
+                "zaaktype",
+                "vertrouwelijkheidaanduiding",
+            ]
+        )
+    )
+    for zaak in zaken.scan():
+        # one related zaak document is shared by all the urls it relates to
+        related_zaak = create_related_zaak_document(zaak)
+        for nested in getattr(zaak, path):
+            related_zaken[nested[field]].append(related_zaak)
+
+    return dict(related_zaken)
+
+
 class ProgressOutputWrapper(OutputWrapper):
     """Class to manage logs with and without progress bar"""
 
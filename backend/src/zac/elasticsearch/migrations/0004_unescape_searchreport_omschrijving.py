@@ -0,0 +1,22 @@
+import re
+
+from django.db import migrations
+
+
+def unescape_omschrijving(apps, _):
+    # the omschrijving is no longer escaped for a query_string query
+    SearchReport = apps.get_model("elasticsearch", "SearchReport")
+    for search_report in SearchReport.objects.filter(query__has_key="omschrijving"):
+        search_report.query["omschrijving"] = re.sub(
+            r"\\(.)", r"\1", search_report.query["omschrijving"]
+        )
+        search_report.save(update_fields=["query"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("elasticsearch", "0003_alter_searchreport_query")]
+
+    operations = [
+        migrations.RunPython(unescape_omschrijving, migrations.RunPython.noop)
+    ]
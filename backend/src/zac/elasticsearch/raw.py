@@ -0,0 +1,176 @@
+"""
+Build ES documents straight from the JSON returned by the ZGW APIs.
+
+The functions in :mod:`zac.elasticsearch.api` take zgw_consumers data classes and
+build ``Document``/``InnerDoc`` instances, which are serialized again with
+``to_dict``. When indexing large amounts of zaken this round trip (``factory`` and
+``to_dict``) takes up most of the CPU time. The functions here produce the very same
+``_source`` dicts from the raw API responses instead.
+"""
+from collections import defaultdict
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from dateutil.parser import parse
+from djangorestframework_camel_case.util import underscoreize
+from zgw_consumers.api_models.catalogi import ZaakType
+
+from zac.accounts.datastructures import VA_ORDER
+
+from .documents import (
+    RolDocument,
+    StatusDocument,
+    ZaakDocument,
+    ZaakInformatieObjectDocument,
+    ZaakObjectDocument,
+    ZaakTypeDocument,
+)
+from .read_model import READ_MODEL_VERSION
+from .utils import get_geometry_center
+
+FieldMapping = Tuple[Tuple[str, str], ...]
+
+EMPTY_VALUES = ([], {}, None)
+
+
+def _compile(document: type, fields: Dict[str, str]) -> FieldMapping:
+    """
+    Compile the ES field -> API attribute mapping, making sure the ES fields exist.
+    """
+    mapping = document._doc_type.mapping
+    unknown = [name for name in fields if name not in mapping]
+    assert not unknown, "Fields %r are not mapped on %s" % (
+        unknown,
+        document.__name__,
+    )
+    return tuple(fields.items())
+
+
+ZAAK_FIELDS = _compile(
+    ZaakDocument,
+    {
+        "url": "url",
+        "identificatie": "identificatie",
+        "bronorganisatie": "bronorganisatie",
+        "omschrijving": "omschrijving",
+        "vertrouwelijkheidaanduiding": "vertrouwelijkheidaanduiding",
+        "startdatum": "startdatum",
+        "einddatum": "einddatum",
+        "registratiedatum": "registratiedatum",
+        "toelichting": "toelichting",
+        "zaakgeometrie": "zaakgeometrie",
+        "einddatum_gepland": "einddatumGepland",
+        "uiterlijke_einddatum_afdoening": "uiterlijkeEinddatumAfdoening",
+        "publicatiedatum": "publicatiedatum",
+        "resultaat": "resultaat",
+    },
+)
+ZAAKTYPE_FIELDS = _compile(
+    ZaakTypeDocument,
+    {"url": "url", "omschrijving": "omschrijving", "catalogus": "catalogus"},
+)
+STATUS_FIELDS = _compile(
+    StatusDocument, {"url": "url", "statustoelichting": "statustoelichting"}
+)
+ROL_FIELDS = _compile(
+    RolDocument,
+    {
+        "url": "url",
+        "betrokkene_type": "betrokkeneType",
+        "omschrijving_generiek": "omschrijvingGeneriek",
+    },
+)
+ZAAKOBJECT_FIELDS = _compile(ZaakObjectDocument, {"url": "url", "object": "object"})
+ZAAKINFORMATIEOBJECT_FIELDS = _compile(
+    ZaakInformatieObjectDocument,
+    {"url": "url", "informatieobject": "informatieobject"},
+)
+
+
+def _copy(data: dict, fields: FieldMapping) -> dict:
+    # empty values are skipped, just like ``Document.to_dict`` does
+    return {
+        name: data[key]
+        for name, key in fields
+        if data.get(key, None) not in EMPTY_VALUES
+    }
+
+
+def normalize_datetime(value: Optional[str]) -> Optional[str]:
+    """
+    Format a datetime the way the ES serializer formats a parsed ``datetime``.
+    """
+    if not value:
+        return value
+    return parse(value).isoformat()
+
+
+def create_zaaktype_source(zaaktype: ZaakType) -> dict:
+    return {
+        name: getattr(zaaktype, key)
+        for name, key in ZAAKTYPE_FIELDS
+        if getattr(zaaktype, key) not in EMPTY_VALUES
+    }
+
+
+def create_zaak_source(zaak: dict, zaaktype: ZaakType) -> dict:
+    source = _copy(zaak, ZAAK_FIELDS)
+    source["va_order"] = VA_ORDER[zaak["vertrouwelijkheidaanduiding"]]
+    if zaakgeometrie_punt := get_geometry_center(zaak.get("zaakgeometrie")):
+        source["zaakgeometrie_punt"] = zaakgeometrie_punt
+    if relevante_andere_zaken := zaak.get("relevanteAndereZaken"):
+        source["relevante_andere_zaken"] = [
+            {
+                "url": relevante_andere_zaak["url"],
+                "aard_relatie": relevante_andere_zaak["aardRelatie"],
+            }
+            for relevante_andere_zaak in relevante_andere_zaken
+        ]
+    source["read_model_version"] = READ_MODEL_VERSION
+
+    # mirrors ``zgw.models.zrc.Zaak.deadline``
+    deadline = (
+        zaak.get("uiterlijkeEinddatumAfdoening")
+        or (date.fromisoformat(zaak["startdatum"]) + zaaktype.doorlooptijd).isoformat()
+    )
+    source["deadline"] = deadline
+    return source
+
+
+def create_status_source(status: dict, statustype_omschrijving: str) -> dict:
+    source = _copy(status, STATUS_FIELDS)
+    source["statustype"] = statustype_omschrijving
+    if datum_status_gezet := normalize_datetime(status.get("datumStatusGezet")):
+        source["datum_status_gezet"] = datum_status_gezet
+    return source
+
+
+def create_rol_source(rol: dict) -> dict:
+    source = _copy(rol, ROL_FIELDS)
+    if betrokkene_identificatie := rol.get("betrokkeneIdentificatie"):
+        source["betrokkene_identificatie"] = underscoreize(betrokkene_identificatie)
+    return source
+
+
+def create_eigenschappen_source(
+    zaakeigenschappen: List[dict], formaten: Dict[str, str]
+) -> dict:
+    """
+    :param formaten: the ``specificatie.formaat`` of the eigenschappen by URL.
+    """
+    eigenschappen = defaultdict(dict)
+    for zaakeigenschap in zaakeigenschappen:
+        formaat = formaten[zaakeigenschap["eigenschap"]]
+        # replace points in the field name because ES can't process them
+        eigenschappen[formaat][
+            zaakeigenschap["naam"].replace(".", " ")
+        ] = zaakeigenschap["waarde"]
+    return dict(eigenschappen)
+
+
+def create_zaakobject_source(zaakobject: dict) -> dict:
+    return _copy(zaakobject, ZAAKOBJECT_FIELDS)
+
+
+def create_zaakinformatieobject_source(zio: dict) -> dict:
+    return _copy(zio, ZAAKINFORMATIEOBJECT_FIELDS)
@@ -0,0 +1,119 @@
+"""
+Serve zaak reads from the zaken index instead of the ZRC.
+
+The zaak documents are kept up to date by the notifications and hold all the fields
+of the ZRC zaak that ZAC uses, so (batches of) zaken can be read with a single
+``mget``. This is opt-in with the ``ES_READ_MODEL`` setting.
+
+Zaken that are missing from the index, or that were indexed before the current read
+model fields existed, are left out - the caller falls back to the ZRC for those. So
+are the zaken ZAC changed itself in the last ``ES_READ_MODEL_WRITE_TIMEOUT`` seconds,
+their documents are only updated once the notifications about the change are handled.
+"""
+import logging
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from elasticsearch import exceptions
+from elasticsearch_dsl.connections import connections
+from zgw_consumers.api_models.base import factory
+
+from zgw.models.zrc import Zaak
+
+logger = logging.getLogger(__name__)
+
+# Bump this when fields are added that the read model depends on, the documents
+# indexed before are then read from the ZRC until they're indexed again.
+READ_MODEL_VERSION = 1
+
+DATE_FIELDS = (
+    "registratiedatum",
+    "startdatum",
+    "einddatum",
+    "einddatum_gepland",
+    "uiterlijke_einddatum_afdoening",
+    "publicatiedatum",
+)
+
+
+def _get_date(value: Optional[str]) -> Optional[str]:
+    # dates of documents saved through the ``Document`` classes can carry a time
+    return value[:10] if value else None
+
+
+def create_zaak_from_source(source: dict) -> Zaak:
+    """
+    Build the zaak like :func:`zac.core.services.get_zaak` returns it: the zaaktype,
+    status and resultaat are URLs.
+    """
+    return factory(
+        Zaak,
+        {
+            "url": source["url"],
+            "identificatie": source["identificatie"],
+            "bronorganisatie": source["bronorganisatie"],
+            "omschrijving": source.get("omschrijving", ""),
+            "toelichting": source.get("toelichting", ""),
+            "zaaktype": source["zaaktype"]["url"],
+            "vertrouwelijkheidaanduiding": source["vertrouwelijkheidaanduiding"],
+            "status": source.get("status", {}).get("url"),
+            "resultaat": source.get("resultaat"),
+            "relevante_andere_zaken": source.get("relevante_andere_zaken", []),
+            "zaakgeometrie": source.get("zaakgeometrie"),
+            **{name: _get_date(source.get(name)) for name in DATE_FIELDS},
+        },
+    )
+
+
+def _get_written_key(zaak_url: str) -> str:
+    return f"read_model:written:{zaak_url}"
+
+
+def mark_zaak_written(zaak_url: str) -> None:
+    """
+    Read the zaak from the ZRC until its document has caught up with ZAC's write.
+    """
+    cache.set(
+        _get_written_key(zaak_url),
+        True,
+        timeout=settings.ES_READ_MODEL_WRITE_TIMEOUT,
+    )
+
+
+def get_zaken_from_index(urls: List[str]) -> Dict[str, Zaak]:
+    """
+    Retrieve the zaken with a single ``mget``, mapped by URL.
+    """
+    written = cache.get_many([_get_written_key(url) for url in urls])
+    urls = [url for url in urls if _get_written_key(url) not in written]
+    ids = {url.strip("/").split("/")[-1]: url for url in urls}
+    if not ids:
+        return {}
+
+    try:
+        response = connections.get_connection().mget(
+            index=settings.ES_INDEX_ZAKEN, body={"ids": list(ids)}
+        )
+    except exceptions.TransportError:
+        logger.warning("Reading zaken from the index failed.", exc_info=True)
+        return {}
+
+    zaken = {}
+    for doc in response["docs"]:
+        source = doc.get("_source")
+        if (
+            not doc.get("found")
+            or source.get("read_model_version") != READ_MODEL_VERSION
+        ):
+            continue
+        # a partial update of a zaak that wasn't indexed yet only upserts the zaak
+        # fields, read those from the ZRC until the zaak is indexed
+        if not (source.get("zaaktype") or {}).get("url"):
+            continue
+        # the same UUID could be used by another ZRC
+        if source["url"] != ids[doc["_id"]]:
+            continue
+        zaken[source["url"]] = create_zaak_from_source(source)
+    return zaken
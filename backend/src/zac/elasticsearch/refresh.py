@@ -0,0 +1,72 @@
+"""
+Control when the writes to ES become visible to searches.
+
+Forcing a refresh of the index on every write (``refresh=True``) creates a new Lucene
+segment every time, which badly hurts the indexing throughput during a burst of
+notifications. The policy is configured with ``ES_REFRESH_POLICY``:
+
+* ``none``: don't refresh, the writes become visible with the periodic refresh of ES
+  itself.
+* ``wait_for``: the write request waits until the next refresh made it visible.
+* ``batched``: the written indices are refreshed at most once every
+  ``ES_REFRESH_INTERVAL`` milliseconds.
+
+Any other value is refused at startup.
+
+Callers that need to read their own writes pass ``refresh=RefreshPolicies.wait_for``
+explicitly, like the API views of ZAC that write a zaak the client reloads right away.
+"""
+import logging
+import threading
+from typing import Dict, Optional, Union
+
+from django.conf import settings
+
+from elasticsearch import exceptions
+from elasticsearch_dsl.connections import connections
+
+from .constants import RefreshPolicies
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_scheduled: Dict[str, threading.Timer] = {}
+
+
+def _refresh_index(index: str) -> None:
+    with _lock:
+        _scheduled.pop(index, None)
+    try:
+        connections.get_connection().indices.refresh(index=index)
+    except exceptions.TransportError:
+        logger.warning("Refreshing index %s failed.", index, exc_info=True)
+
+
+def schedule_refresh(index: str) -> None:
+    """
+    Refresh ``index`` after ``ES_REFRESH_INTERVAL`` milliseconds, unless a refresh is
+    scheduled already.
+    """
+    with _lock:
+        if index in _scheduled:
+            return
+        timer = threading.Timer(
+            settings.ES_REFRESH_INTERVAL / 1000, _refresh_index, args=(index,)
+        )
+        timer.daemon = True
+        _scheduled[index] = timer
+        timer.start()
+
+
+def get_refresh(index: str, policy: Optional[str] = None) -> Union[bool, str]:
+    """
+    Return the ``refresh`` parameter for a write to ``index``.
+
+    ``policy`` defaults to the ``ES_REFRESH_POLICY`` setting.
+    """
+    policy = policy or settings.ES_REFRESH_POLICY
+    if policy == RefreshPolicies.wait_for:
+        return "wait_for"
+    if policy == RefreshPolicies.batched:
+        schedule_refresh(index)
+    return False
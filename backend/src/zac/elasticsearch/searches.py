@@ -1,45 +1,69 @@
+import hashlib
+import logging
 import operator
+from collections import defaultdict
+from datetime import datetime
 from functools import reduce
-from typing import List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Union
 from urllib.request import Request
 
-from elasticsearch_dsl import Q
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models
+from django.db.models import Min
+from django.utils import timezone
+
+from elasticsearch_dsl import MultiSearch, Q, Search
 from elasticsearch_dsl.query import (
     Bool,
     Exists,
+    GeoShape,
     Match,
     MultiMatch,
     Nested,
+    Prefix,
     Query,
-    QueryString,
     Term,
     Terms,
+    Wildcard,
 )
 
+from zac.accounts.cache import get_permissions_version
 from zac.accounts.constants import PermissionObjectTypeChoices
-from zac.accounts.models import BlueprintPermission, UserAtomicPermission
+from zac.accounts.models import (
+    ApplicationToken,
+    ApplicationTokenAuthorizationProfile,
+    BlueprintPermission,
+    UserAtomicPermission,
+    UserAuthorizationProfile,
+)
 from zac.camunda.constants import AssigneeTypeChoices
 from zac.core.permissions import zaken_inzien
 
-from .documents import InformatieObjectDocument, ObjectDocument, ZaakDocument
+from .documents import (
+    InformatieObjectDocument,
+    ObjectDocument,
+    PermissionsDocument,
+    ZaakDocument,
+)
 
+logger = logging.getLogger(__name__)
+perf_logger = logging.getLogger("performance")
 
-def query_allowed_for_requester(
+
+def _compile_queries_allowed_for_requester(
     request: Request,
-    object_type: str = PermissionObjectTypeChoices.zaak,
-    permission: str = zaken_inzien.name,
-    on_nested_field: Optional[str] = "",
-) -> Query:
+    object_type: str,
+    permission: str,
+    on_nested_fields: Iterable[str],
+) -> Dict[str, Query]:
     """
-    construct query part to display only allowed zaken
+    Compile the query for each nested field from a single load of the permissions.
     """
-    allowed = []
+    object_urls = []
     if user := request.user:
-        if user.is_superuser:
-            return Q("match_all")
-
         # atomic permissions
-        object_urls = (
+        object_urls = list(
             UserAtomicPermission.objects.filter(
                 user=user,
                 atomic_permission__object_type=object_type,
@@ -48,49 +72,207 @@ def query_allowed_for_requester(
             .actual()
             .values_list("atomic_permission__object_url", flat=True)
         )
-        if object_urls.count():
+
+    # blueprint permissions, combined per blueprint class
+    policies = defaultdict(list)
+    for blueprint_permission in BlueprintPermission.objects.for_requester(
+        request, actual=True
+    ).filter(object_type=object_type, role__permissions__contains=[permission]):
+        policies[blueprint_permission.get_blueprint_class()].append(
+            blueprint_permission.policy
+        )
+
+    queries = {}
+    for on_nested_field in on_nested_fields:
+        allowed = []
+        if object_urls:
+            url_field = f"{on_nested_field}__url" if on_nested_field else "url"
+            terms = _get_object_urls_terms(
+                url_field, object_urls, f"{user.pk}:{object_type}:{permission}"
+            )
             if on_nested_field:
-                terms = {f"{on_nested_field}__url": list(object_urls)}
                 allowed.append(
                     Nested(path=on_nested_field, query=Bool(filter=(Terms(**terms))))
                 )
             else:
-                allowed.append(Terms(url=list(object_urls)))
+                allowed.append(Terms(**terms))
 
-    if getattr(request.auth, "has_all_reading_rights", False):
-        return Q("match_all")
+        for blueprint_class, class_policies in policies.items():
+            for query in blueprint_class.search_queries(
+                class_policies, on_nested_field=on_nested_field
+            ):
+                if on_nested_field:
+                    allowed.append(Nested(path=on_nested_field, query=Bool(must=query)))
+                else:
+                    allowed.append(query)
 
-    # blueprint permissions
-    for blueprint_permission in BlueprintPermission.objects.for_requester(
-        request, actual=True
-    ).filter(object_type=object_type, role__permissions__contains=[permission]):
-        if on_nested_field:
-            allowed.append(
-                Nested(
-                    path=on_nested_field,
-                    query=Bool(
-                        must=blueprint_permission.get_search_query(
-                            on_nested_field=on_nested_field
-                        )
-                    ),
-                )
+        queries[on_nested_field] = (
+            reduce(operator.or_, allowed) if allowed else Q("match_none")
+        )
+    return queries
+
+
+def _get_object_urls_terms(field: str, object_urls: List[str], key: str) -> dict:
+    if len(object_urls) <= settings.ES_PERMISSION_TERMS_LOOKUP_THRESHOLD:
+        return {field: object_urls}
+
+    # large sets of URLs are looked up from a document instead of being in the query,
+    # the index is created by the index commands
+    PermissionsDocument(meta={"id": key}, object_urls=object_urls).save()
+    return {
+        field: {
+            "index": settings.ES_INDEX_PERMISSIONS,
+            "id": key,
+            "path": "object_urls",
+        }
+    }
+
+
+def _get_requester_key(request: Request) -> Optional[str]:
+    if user := request.user:
+        return f"user:{user.pk}" if user.pk else None
+    if isinstance(request.auth, ApplicationToken):
+        # don't put the token itself in the cache keys
+        return f"application:{hashlib.sha256(request.auth.token.encode()).hexdigest()}"
+    return None
+
+
+def _get_next_permission_change(request: Request) -> Optional[datetime]:
+    """
+    Return the first moment a permission of the requester starts or ends.
+    """
+    now = timezone.now()
+    if request.user:
+        periods = [
+            UserAtomicPermission.objects.filter(user=request.user).aggregate(
+                start=Min("start_date", filter=models.Q(start_date__gt=now)),
+                end=Min("end_date", filter=models.Q(end_date__gt=now)),
+            ),
+            UserAuthorizationProfile.objects.filter(user=request.user).aggregate(
+                start=Min("start", filter=models.Q(start__gt=now)),
+                end=Min("end", filter=models.Q(end__gt=now)),
+            ),
+        ]
+    else:
+        periods = [
+            ApplicationTokenAuthorizationProfile.objects.filter(
+                application=request.auth
+            ).aggregate(
+                start=Min("start", filter=models.Q(start__gt=now)),
+                end=Min("end", filter=models.Q(end__gt=now)),
             )
-        else:
-            allowed.append(blueprint_permission.get_search_query())
+        ]
+    moments = [moment for period in periods for moment in period.values() if moment]
+    return min(moments, default=None)
+
+
+def queries_allowed_for_requester(
+    request: Request,
+    object_type: str = PermissionObjectTypeChoices.zaak,
+    permission: str = zaken_inzien.name,
+    on_nested_fields: Iterable[str] = ("",),
+) -> Dict[str, Query]:
+    """
+    Construct the query parts to display only allowed zaken, per nested field.
+
+    The queries are cached per requester until the permissions change, see
+    :func:`zac.accounts.cache.bump_permissions_version`. The permissions are loaded
+    once for all the queries that aren't cached yet.
+    """
+    if request.user and request.user.is_superuser:
+        return {field: Q("match_all") for field in on_nested_fields}
+
+    if getattr(request.auth, "has_all_reading_rights", False):
+        return {field: Q("match_all") for field in on_nested_fields}
+
+    requester_key = _get_requester_key(request)
+    if requester_key is None:
+        return _compile_queries_allowed_for_requester(
+            request, object_type, permission, on_nested_fields
+        )
+
+    cache_keys = {
+        field: (
+            f"es_permission_query:{get_permissions_version()}:{requester_key}:"
+            f"{object_type}:{permission}:{field}"
+        )
+        for field in on_nested_fields
+    }
+    cached = cache.get_many(list(cache_keys.values()))
+    queries = {
+        field: Q(cached[key]) for field, key in cache_keys.items() if key in cached
+    }
+    missing = [field for field in cache_keys if field not in queries]
+    if not missing:
+        return queries
+
+    compiled = _compile_queries_allowed_for_requester(
+        request, object_type, permission, missing
+    )
+
+    # permissions that start or end later change the query without a signal
+    timeout = settings.ES_PERMISSION_QUERY_CACHE_TIMEOUT
+    if next_change := _get_next_permission_change(request):
+        seconds = (next_change - timezone.now()).total_seconds()
+        timeout = max(min(timeout, int(seconds)), 1)
+    for field, query in compiled.items():
+        cache.set(cache_keys[field], query.to_dict(), timeout)
+
+    queries.update(compiled)
+    return queries
+
+
+def query_allowed_for_requester(
+    request: Request,
+    object_type: str = PermissionObjectTypeChoices.zaak,
+    permission: str = zaken_inzien.name,
+    on_nested_field: Optional[str] = "",
+) -> Query:
+    """
+    construct query part to display only allowed zaken
+
+    See :func:`queries_allowed_for_requester`.
+    """
+    queries = queries_allowed_for_requester(
+        request, object_type, permission, on_nested_fields=(on_nested_field,)
+    )
+    return queries[on_nested_field]
+
+
+def get_substring_query(field: str, value: str) -> Query:
+    """
+    Match the words of the value as substrings of a field analyzed into ngrams.
+
+    Words shorter than the ngrams are matched as prefixes of the ngrams, which only
+    misses them at the very end of the field.
+    """
+    long_words, short_words = [], []
+    for word in value.split():
+        (long_words if len(word) >= settings.MIN_GRAM else short_words).append(word)
+
+    queries = []
+    if not long_words and not short_words:
+        return Q("match_all")
+    if long_words:
+        queries.append(
+            Match(**{field: {"query": " ".join(long_words), "operator": "and"}})
+        )
+    for word in short_words:
+        queries.append(Prefix(**{field: {"value": word.lower()}}))
+    return reduce(operator.and_, queries)
 
-    if not allowed:
-        return Q("match_none")
 
-    return reduce(operator.or_, allowed)
+def get_geometry_query(shape: dict) -> Query:
+    return GeoShape(zaakgeometrie={"shape": shape, "relation": "intersects"})
 
 
-def search_zaken(
+def get_zaken_search(
     request=None,
-    size=None,
     identificatie=None,
     identificatie_keyword=None,
     bronorganisatie=None,
     omschrijving=None,
+    toelichting=None,
     zaaktypen=None,
     behandelaar=None,
     eigenschappen=None,
@@ -100,10 +282,13 @@ def search_zaken(
     ordering=("-identificatie.keyword", "-startdatum", "-registratiedatum"),
     fields=None,
     object=None,
-) -> List[ZaakDocument]:
-
-    size = size or 10000
-    s = ZaakDocument.search()[:size]
+    bbox=None,
+    polygon=None,
+) -> Search:
+    """
+    Build the search for the zaken, without executing it.
+    """
+    s = ZaakDocument.search()
 
     if identificatie:
         s = s.query(Match(identificatie={"query": identificatie}))
@@ -112,9 +297,9 @@ def search_zaken(
     if bronorganisatie:
         s = s.filter(Term(bronorganisatie=bronorganisatie))
     if omschrijving:
-        s = s.query(
-            QueryString(default_field="omschrijving", query=f"*{omschrijving}*")
-        )
+        s = s.query(get_substring_query("omschrijving", omschrijving))
+    if toelichting:
+        s = s.query(get_substring_query("toelichting.ngram", toelichting))
     if zaaktypen:
         s = s.filter(Terms(zaaktype__url=zaaktypen))
     if behandelaar:
@@ -136,11 +321,16 @@ def search_zaken(
         for eigenschap_name, eigenschap_value in eigenschappen.items():
             # replace points in the field name because ES can't process them
             # see https://discuss.elastic.co/t/class-cast-exception-for-dynamic-field-with-in-its-name/158819/5
-            s = s.query(
-                QueryString(
-                    fields=[f"eigenschappen.*.{eigenschap_name.replace('.', ' ')}"],
-                    query=f"*{eigenschap_value}*",
-                ),
+            name = eigenschap_name.replace(".", " ")
+            # the value is escaped, which the wildcard query supports as well
+            s = s.filter(
+                Wildcard(
+                    **{
+                        f"eigenschappen.tekst.{name}.wildcard": {
+                            "value": f"*{eigenschap_value}*"
+                        }
+                    }
+                )
             )
     if object:
         s = s.filter(
@@ -156,6 +346,21 @@ def search_zaken(
     if urls:
         s = s.filter(Terms(url=urls))
 
+    if bbox:
+        min_lon, min_lat, max_lon, max_lat = bbox
+        s = s.filter(
+            get_geometry_query(
+                {
+                    "type": "envelope",
+                    "coordinates": [[min_lon, max_lat], [max_lon, min_lat]],
+                }
+            )
+        )
+    if polygon:
+        # the ring of a polygon is closed
+        ring = polygon if polygon[0] == polygon[-1] else [*polygon, polygon[0]]
+        s = s.filter(get_geometry_query({"type": "polygon", "coordinates": [ring]}))
+
     # display only allowed zaken
     if only_allowed:
         s = s.filter(query_allowed_for_requester(request))
@@ -166,21 +371,157 @@ def search_zaken(
     if fields:
         s = s.source(fields)
 
+    return s
+
+
+def search_zaken(request=None, size=None, **kwargs) -> List[ZaakDocument]:
+    size = size or 10000
+    s = get_zaken_search(request=request, **kwargs)[:size]
     response = s.execute()
+    perf_logger.info("Searching zaken took %d ms for %r", response.took, kwargs)
     return response.hits
 
 
+def get_zaken_facets(search: Search) -> dict:
+    """
+    Count the zaken of the search per zaaktype, status, vertrouwelijkheidaanduiding,
+    open or closed, behandelaar and month of the startdatum and deadline.
+    """
+    size = settings.ES_FACET_SIZE
+    s = search.extra(size=0, track_total_hits=settings.ES_TRACK_TOTAL_HITS)
+    s.aggs.bucket("zaaktypen", "terms", field="zaaktype.omschrijving", size=size)
+    s.aggs.bucket("statustypen", "terms", field="status.statustype", size=size)
+    s.aggs.bucket(
+        "vertrouwelijkheidaanduidingen",
+        "terms",
+        field="vertrouwelijkheidaanduiding.keyword",
+        size=size,
+    )
+    s.aggs.bucket(
+        "afgesloten",
+        "filters",
+        filters={
+            "open": ~Exists(field="einddatum"),
+            "closed": Exists(field="einddatum"),
+        },
+    )
+    s.aggs.bucket("rollen", "nested", path="rollen").bucket(
+        "behandelaars",
+        "filter",
+        Bool(
+            filter=[
+                Term(rollen__betrokkene_type="medewerker"),
+                Term(rollen__omschrijving_generiek="behandelaar"),
+            ]
+        ),
+    ).bucket(
+        "identificaties",
+        "terms",
+        field="rollen.betrokkene_identificatie.identificatie",
+        size=size,
+    ).bucket(
+        # count the zaken instead of the rollen
+        "zaken",
+        "reverse_nested",
+    )
+    for date_field in ["startdatum", "deadline"]:
+        s.aggs.bucket(
+            date_field,
+            "date_histogram",
+            field=date_field,
+            calendar_interval="month",
+            format="yyyy-MM",
+            min_doc_count=1,
+        )
+
+    response = s.execute()
+    perf_logger.info("Counting the facets of zaken took %d ms", response.took)
+    aggregations = response.aggregations
+
+    user_prefix = f"{AssigneeTypeChoices.user}:"
+    behandelaars = aggregations.rollen.behandelaars.identificaties.buckets
+    return {
+        "count": response.hits.total.value,
+        "zaaktypen": _get_facet_buckets(aggregations.zaaktypen),
+        "statustypen": _get_facet_buckets(aggregations.statustypen),
+        "vertrouwelijkheidaanduidingen": _get_facet_buckets(
+            aggregations.vertrouwelijkheidaanduidingen
+        ),
+        "afgesloten": [
+            {"value": value, "count": aggregations.afgesloten.buckets[value].doc_count}
+            for value in ["open", "closed"]
+        ],
+        "behandelaars": [
+            {"value": bucket.key[len(user_prefix) :], "count": bucket.zaken.doc_count}
+            for bucket in behandelaars
+            if bucket.key.startswith(user_prefix)
+        ],
+        "startdatum": _get_facet_buckets(aggregations.startdatum, key="key_as_string"),
+        "deadline": _get_facet_buckets(aggregations.deadline, key="key_as_string"),
+    }
+
+
+def get_zaken_clusters(search: Search, precision: int) -> List[dict]:
+    """
+    Cluster the zaken of the search on the tiles of a map at the zoom level.
+    """
+    s = search.extra(size=0, track_total_hits=False)
+    s.aggs.bucket(
+        "clusters", "geotile_grid", field="zaakgeometrie_punt", precision=precision
+    ).metric("centroid", "geo_centroid", field="zaakgeometrie_punt")
+
+    response = s.execute()
+    perf_logger.info("Clustering zaken took %d ms", response.took)
+    return [
+        {
+            "tile": bucket.key,
+            "count": bucket.doc_count,
+            "centroid": bucket.centroid.location.to_dict(),
+        }
+        for bucket in response.aggregations.clusters.buckets
+    ]
+
+
+def _get_facet_buckets(aggregation, key: str = "key") -> List[dict]:
+    return [
+        {"value": bucket[key], "count": bucket.doc_count}
+        for bucket in aggregation.buckets
+    ]
+
+
 def autocomplete_zaak_search(
     identificatie: str,
     request: Optional[Request] = None,
     only_allowed: bool = True,
+    size: int = 10,
 ) -> List[ZaakDocument]:
-    search = ZaakDocument.search().query(
-        Match(
-            identificatie={
-                "query": identificatie,
-            }
+    """
+    Suggest zaken of which the identificatie or omschrijving starts with the words.
+    """
+    search = (
+        ZaakDocument.search()
+        .source(["url", "identificatie", "bronorganisatie"])
+        .query(
+            Bool(
+                should=[
+                    Match(
+                        identificatie__autocomplete={
+                            "query": identificatie,
+                            "operator": "and",
+                            "boost": 2,
+                        }
+                    ),
+                    Match(
+                        omschrijving__autocomplete={
+                            "query": identificatie,
+                            "operator": "and",
+                        }
+                    ),
+                ],
+                minimum_should_match=1,
+            )
         )
+        .extra(size=size, track_total_hits=False)
     )
     if only_allowed:
         search = search.filter(query_allowed_for_requester(request))
@@ -233,16 +574,18 @@ def quick_search(
         if not request:
             raise RuntimeError("If only_allowed is True a request must be passed.")
 
-        allowed = query_allowed_for_requester(request)
-        s_zaken = s_zaken.filter(allowed)
-
-        allowed = query_allowed_for_requester(request, on_nested_field="related_zaken")
-        s_objecten = s_objecten.filter(allowed)
-        s_documenten = s_documenten.filter(allowed)
+        allowed = queries_allowed_for_requester(
+            request, on_nested_fields=("", "related_zaken")
+        )
+        s_zaken = s_zaken.filter(allowed[""])
+        s_objecten = s_objecten.filter(allowed["related_zaken"])
+        s_documenten = s_documenten.filter(allowed["related_zaken"])
 
-    results = {
-        "zaken": s_zaken.execute(),
-        "objecten": s_objecten.execute(),
-        "documenten": s_documenten.execute(),
+    # the searches are done in a single round trip
+    ms = MultiSearch().add(s_zaken).add(s_objecten).add(s_documenten)
+    zaken, objecten, documenten = ms.execute()
+    return {
+        "zaken": zaken,
+        "objecten": objecten,
+        "documenten": documenten,
     }
-    return results
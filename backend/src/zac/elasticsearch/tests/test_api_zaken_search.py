@@ -1,9 +1,13 @@
 import datetime
+import uuid
+from io import BytesIO
 from unittest.mock import patch
 
+from django.test import override_settings
 from django.urls import reverse
 
 import requests_mock
+from openpyxl import load_workbook
 from rest_framework import status
 from rest_framework.test import APITransactionTestCase
 from zgw_consumers.api_models.base import factory
@@ -26,8 +30,11 @@ from zac.elasticsearch.api import (
     update_eigenschappen_in_zaak_document,
     update_zaakobjecten_in_zaak_document,
 )
+from zac.elasticsearch.drf_api.pagination import ESPagination
 from zac.elasticsearch.tests.utils import ESMixin
 from zac.tests.utils import mock_resource_get, paginated_response
+from zac.tests.zrc import get_zaak_response
+from zac.tests.ztc import get_zaaktype_response
 from zgw.models.zrc import Zaak
 
 OBJECTS_ROOT = "http://objects.nl/api/v1/"
@@ -535,3 +542,154 @@ class SearchResponseTests(ClearCachesMixin, ESMixin, APITransactionTestCase):
             self.assertEqual(data["count"], 2)
             self.assertEqual(data["results"][1]["url"], zaak1["url"])
             self.assertEqual(data["results"][0]["url"], zaak3["url"])
+
+
+class SearchPaginationTests(ClearCachesMixin, ESMixin, APITransactionTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.user = SuperUserFactory.create()
+        self.client.force_authenticate(user=self.user)
+        self.endpoint = reverse("search")
+
+        zaaktype = factory(
+            ZaakType,
+            get_zaaktype_response(CATALOGUS_URL, f"{CATALOGI_ROOT}zaaktypen/1"),
+        )
+        for i in range(1, 6):
+            zaak_uuid = str(uuid.uuid4())
+            zaak = factory(
+                Zaak,
+                get_zaak_response(
+                    f"{ZAKEN_ROOT}zaken/{zaak_uuid}",
+                    zaaktype.url,
+                    uuid=zaak_uuid,
+                    identificatie=f"ZAAK-{i}",
+                ),
+            )
+            zaak.zaaktype = zaaktype
+            zaak_document = self.create_zaak_document(zaak)
+            zaak_document.zaaktype = self.create_zaaktype_document(zaaktype)
+            zaak_document.save()
+        self.refresh_index()
+
+    def _get_page(self, page: int) -> dict:
+        with patch.object(ESPagination, "page_size", 2):
+            response = self.client.post(
+                f"{self.endpoint}?page={page}", {"fields": ["identificatie"]}
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()
+
+    def test_retrieve_page(self):
+        with patch("zac.elasticsearch.drf_api.pagination.get_search_after_page") as m:
+            data = self._get_page(2)
+
+        m.assert_not_called()
+        self.assertEqual(data["count"], 5)
+        self.assertEqual(
+            [zaak["identificatie"] for zaak in data["results"]], ["ZAAK-3", "ZAAK-2"]
+        )
+        self.assertEqual(data["next"], f"http://testserver{self.endpoint}?page=3")
+        self.assertEqual(data["previous"], f"http://testserver{self.endpoint}")
+
+    @override_settings(ES_MAX_RESULT_WINDOW=3)
+    def test_retrieve_page_beyond_max_result_window(self):
+        for page, expected in [(2, ["ZAAK-3", "ZAAK-2"]), (3, ["ZAAK-1"])]:
+            with self.subTest(page=page):
+                data = self._get_page(page)
+
+                self.assertEqual(data["count"], 5)
+                self.assertEqual(
+                    [zaak["identificatie"] for zaak in data["results"]], expected
+                )
+
+        self.assertIsNone(data["next"])
+
+    @override_settings(ES_TRACK_TOTAL_HITS=3)
+    def test_count_is_lower_bound(self):
+        data = self._get_page(2)
+
+        self.assertEqual(data["count"], 3)
+        # there are more zaken than were counted
+        self.assertEqual(data["next"], f"http://testserver{self.endpoint}?page=3")
+
+    def test_invalid_page(self):
+        with patch.object(ESPagination, "page_size", 2):
+            response = self.client.post(f"{self.endpoint}?page=4", {})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class SearchExportTests(ClearCachesMixin, ESMixin, APITransactionTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.user = SuperUserFactory.create()
+        self.client.force_authenticate(user=self.user)
+        self.endpoint = reverse("search-export")
+
+        zaaktype = factory(
+            ZaakType,
+            get_zaaktype_response(CATALOGUS_URL, f"{CATALOGI_ROOT}zaaktypen/1"),
+        )
+        for i in range(1, 4):
+            zaak_uuid = str(uuid.uuid4())
+            zaak = factory(
+                Zaak,
+                get_zaak_response(
+                    f"{ZAKEN_ROOT}zaken/{zaak_uuid}",
+                    zaaktype.url,
+                    uuid=zaak_uuid,
+                    identificatie=f"ZAAK-{i}",
+                    omschrijving=f"Zaak {i}",
+                ),
+            )
+            zaak.zaaktype = zaaktype
+            zaak_document = self.create_zaak_document(zaak)
+            zaak_document.zaaktype = self.create_zaaktype_document(zaaktype)
+            zaak_document.save()
+        self.refresh_index()
+
+    @override_settings(ES_EXPORT_BATCH_SIZE=2)
+    def test_export_csv(self):
+        response = self.client.post(
+            self.endpoint, {"fields": ["identificatie", "omschrijving"]}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        content = b"".join(response.streaming_content).decode()
+        self.assertEqual(
+            content.splitlines(),
+            [
+                "bronorganisatie,identificatie,omschrijving",
+                "517439943,ZAAK-3,Zaak 3",
+                "517439943,ZAAK-2,Zaak 2",
+                "517439943,ZAAK-1,Zaak 1",
+            ],
+        )
+
+    @override_settings(ES_EXPORT_BATCH_SIZE=2)
+    def test_export_xlsx(self):
+        response = self.client.post(
+            f"{self.endpoint}?export_format=xlsx", {"fields": ["identificatie"]}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        workbook = load_workbook(BytesIO(b"".join(response.streaming_content)))
+        rows = list(workbook.active.values)
+        self.assertEqual(
+            rows,
+            [
+                ("bronorganisatie", "identificatie"),
+                ("517439943", "ZAAK-3"),
+                ("517439943", "ZAAK-2"),
+                ("517439943", "ZAAK-1"),
+            ],
+        )
+
+    def test_invalid_export_format(self):
+        response = self.client.post(f"{self.endpoint}?export_format=pdf", {})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,98 @@
+from io import StringIO
+
+from django.conf import settings
+from django.core.management import call_command
+
+import requests_mock
+from elasticsearch.exceptions import NotFoundError
+from elasticsearch_dsl import Index
+from rest_framework.test import APITransactionTestCase
+from zgw_consumers.constants import APITypes
+from zgw_consumers.models import Service
+from zgw_consumers.test import mock_service_oas_get
+
+from zac.core.models import CoreConfig
+from zac.core.tests.utils import ClearCachesMixin
+from zac.tests.utils import paginated_response
+
+from ..documents import InformatieObjectDocument, ObjectDocument
+from .utils import ESMixin
+
+DRC_ROOT = "https://api.drc.nl/api/v1/"
+OBJECTS_ROOT = "https://api.objects.nl/api/v2/"
+
+DOCUMENT_1 = (
+    f"{DRC_ROOT}enkelvoudiginformatieobjecten/a522d30c-6c10-47fe-82e3-e9f524c14ca8"
+)
+DOCUMENT_2 = (
+    f"{DRC_ROOT}enkelvoudiginformatieobjecten/b321d30c-6c10-47fe-82e3-e9f524c14ca9"
+)
+OBJECT_1 = f"{OBJECTS_ROOT}objects/f8a7573a-758f-4a19-aa22-245bb8f4712e"
+OBJECT_2 = f"{OBJECTS_ROOT}objects/3b6a2d9c-6f5e-4c47-9d1c-4d3c1e5c2f0a"
+
+
+@requests_mock.Mocker()
+class CheckForDeletedDocumentenObjectenTests(
+    ClearCachesMixin, ESMixin, APITransactionTestCase
+):
+    @staticmethod
+    def clear_index(init=False):
+        ESMixin.clear_index(init=init)
+        Index(settings.ES_INDEX_DOCUMENTEN).delete(ignore=404)
+        Index(settings.ES_INDEX_OBJECTEN).delete(ignore=404)
+
+        if init:
+            InformatieObjectDocument.init()
+            ObjectDocument.init()
+
+    @staticmethod
+    def refresh_index():
+        ESMixin.refresh_index()
+        Index(settings.ES_INDEX_DOCUMENTEN).refresh()
+        Index(settings.ES_INDEX_OBJECTEN).refresh()
+
+    def setUp(self):
+        super().setUp()
+        Service.objects.create(api_type=APITypes.drc, api_root=DRC_ROOT)
+        objects = Service.objects.create(api_type=APITypes.orc, api_root=OBJECTS_ROOT)
+        config = CoreConfig.get_solo()
+        config.primary_objects_api = objects
+        config.save()
+
+    def test_check_for_deleted_documenten_fail_no_index(self, m):
+        self.clear_index()
+
+        with self.assertRaises(NotFoundError):
+            call_command("check_for_deleted_documenten", stdout=StringIO())
+
+    def test_check_for_deleted_documenten(self, m):
+        mock_service_oas_get(m, DRC_ROOT, "drc")
+        for url in [DOCUMENT_1, DOCUMENT_2]:
+            InformatieObjectDocument(meta={"id": url.split("/")[-1]}, url=url).save()
+        self.refresh_index()
+        m.get(
+            f"{DRC_ROOT}enkelvoudiginformatieobjecten",
+            json=paginated_response([{"url": DOCUMENT_1}]),
+        )
+
+        call_command("check_for_deleted_documenten", stdout=StringIO())
+
+        self.refresh_index()
+        self.assertEqual(
+            [hit.url for hit in InformatieObjectDocument.search().execute()],
+            [DOCUMENT_1],
+        )
+
+    def test_check_for_deleted_objecten(self, m):
+        mock_service_oas_get(m, OBJECTS_ROOT, "objects")
+        for url in [OBJECT_1, OBJECT_2]:
+            ObjectDocument(meta={"id": url.split("/")[-1]}, url=url).save()
+        self.refresh_index()
+        m.get(f"{OBJECTS_ROOT}objects", json=paginated_response([{"url": OBJECT_2}]))
+
+        call_command("check_for_deleted_objecten", stdout=StringIO())
+
+        self.refresh_index()
+        self.assertEqual(
+            [hit.url for hit in ObjectDocument.search().execute()], [OBJECT_2]
+        )
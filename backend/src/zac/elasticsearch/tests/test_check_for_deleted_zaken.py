@@ -125,3 +125,35 @@ class IndexZakenTests(ClearCachesMixin, ESMixin, APITransactionTestCase):
 
         with self.assertRaises(NotFoundError):
             zaak_document2 = ZaakDocument.get(id="b321d30c-6c10-47fe-82e3-e9f524c14ca9")
+
+    def test_check_for_deleted_zaken_dry_run(self, m):
+        mock_service_oas_get(m, ZAKEN_ROOT, "zrc")
+        ZaakDocument(
+            meta={"id": "a522d30c-6c10-47fe-82e3-e9f524c14ca8"},
+            url=f"{ZAKEN_ROOT}zaken/a522d30c-6c10-47fe-82e3-e9f524c14ca8",
+        ).save()
+        ZaakDocument(
+            meta={"id": "b321d30c-6c10-47fe-82e3-e9f524c14ca9"},
+            url=f"{ZAKEN_ROOT}zaken/b321d30c-6c10-47fe-82e3-e9f524c14ca9",
+        ).save()
+        self.refresh_index()
+        m.get(
+            f"{ZAKEN_ROOT}zaken",
+            json=paginated_response(
+                [
+                    {"url": f"{ZAKEN_ROOT}zaken/a522d30c-6c10-47fe-82e3-e9f524c14ca8"},
+                    {"url": f"{ZAKEN_ROOT}zaken/c4a51e2a-1e8c-4b5d-9a34-b8f0e3c2d5f1"},
+                ]
+            ),
+        )
+        stdout = StringIO()
+
+        call_command("check_for_deleted_zaken", "--dry-run", stdout=stdout)
+
+        self.refresh_index()
+        self.assertEqual(Index(settings.ES_INDEX_ZAKEN).search().count(), 2)
+        self.assertIn(
+            "Found 2 zaken in index %s, 1 are deleted from the source API(s) and 1 are not indexed yet."
+            % settings.ES_INDEX_ZAKEN,
+            stdout.getvalue(),
+        )
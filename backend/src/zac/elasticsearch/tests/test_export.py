@@ -0,0 +1,90 @@
+import tempfile
+
+from django.test import SimpleTestCase
+
+from elasticsearch_dsl.response import Hit
+from openpyxl import load_workbook
+
+from ..export import get_field_values, get_row, stream_csv, write_xlsx
+
+SOURCE = {
+    "identificatie": "ZAAK-1",
+    "zaaktype": {"omschrijving": "zaaktype1"},
+    "rollen": [
+        {"url": "https://api.zaken.nl/api/v1/rollen/1", "omschrijving_generiek": None},
+        {"url": "https://api.zaken.nl/api/v1/rollen/2"},
+    ],
+    "zaakgeometrie": {"type": "Point", "coordinates": [4.9, 52.4]},
+}
+
+
+class ExportRowTests(SimpleTestCase):
+    def test_get_field_values(self):
+        self.assertEqual(get_field_values(SOURCE, "identificatie"), ["ZAAK-1"])
+        self.assertEqual(
+            get_field_values(SOURCE, "zaaktype.omschrijving"), ["zaaktype1"]
+        )
+        self.assertEqual(
+            get_field_values(SOURCE, "rollen.url"),
+            [
+                "https://api.zaken.nl/api/v1/rollen/1",
+                "https://api.zaken.nl/api/v1/rollen/2",
+            ],
+        )
+        self.assertEqual(get_field_values(SOURCE, "rollen.omschrijving_generiek"), [])
+        self.assertEqual(get_field_values(SOURCE, "einddatum"), [])
+
+    def test_get_row(self):
+        hit = Hit({"_id": "1", "_source": SOURCE})
+
+        row = get_row(hit, ["identificatie", "rollen.url", "zaakgeometrie", "deadline"])
+
+        self.assertEqual(
+            row,
+            [
+                "ZAAK-1",
+                "https://api.zaken.nl/api/v1/rollen/1, https://api.zaken.nl/api/v1/rollen/2",
+                '{"type": "Point", "coordinates": [4.9, 52.4]}',
+                "",
+            ],
+        )
+
+    def test_stream_csv(self):
+        hits = [Hit({"_id": "1", "_source": SOURCE})]
+
+        lines = list(stream_csv(iter(hits), ["identificatie", "zaaktype.omschrijving"]))
+
+        self.assertEqual(
+            lines,
+            ["identificatie,zaaktype.omschrijving\r\n", "ZAAK-1,zaaktype1\r\n"],
+        )
+
+    def test_formulas_are_not_exported(self):
+        values = ["=1+1", "+1", "-1", "@SUM(A1)", "\t=1", "\r=1", "some=value"]
+        hits = [
+            Hit({"_id": "1", "_source": {"omschrijving": value}}) for value in values
+        ]
+
+        lines = list(stream_csv(iter(hits), ["omschrijving"]))
+
+        self.assertEqual(
+            lines[1:],
+            [
+                "'=1+1\r\n",
+                "'+1\r\n",
+                "'-1\r\n",
+                "'@SUM(A1)\r\n",
+                "'\t=1\r\n",
+                '"\'\r=1"\r\n',
+                "some=value\r\n",
+            ],
+        )
+
+        with tempfile.TemporaryFile() as outfile:
+            write_xlsx(iter(hits), ["omschrijving"], outfile)
+            outfile.seek(0)
+            sheet = load_workbook(outfile).active
+
+        cells = [row[0] for row in sheet.iter_rows(min_row=2)]
+        self.assertEqual([cell.value for cell in cells], values)
+        self.assertEqual({cell.data_type for cell in cells}, {"s"})
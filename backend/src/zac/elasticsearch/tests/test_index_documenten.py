@@ -110,3 +110,41 @@ class IndexDocumentsTests(ClearCachesMixin, ESMixin, APITransactionTestCase):
                 }
             ],
         )
+
+    def test_index_documenten_with_many_related_zaken(self, m):
+        mock_service_oas_get(m, DRC_ROOT, "drc")
+        document = generate_oas_component(
+            "drc",
+            "schemas/EnkelvoudigInformatieObject",
+        )
+
+        m.get(
+            f"{DRC_ROOT}enkelvoudiginformatieobjecten",
+            json=paginated_response([document]),
+        )
+        index = Index(settings.ES_INDEX_DOCUMENTEN)
+        # more than the default number of hits returned by an ES search
+        for i in range(15):
+            zio = ZaakInformatieObjectDocument(
+                url=f"https://some-url.com/{i}", informatieobject=document["url"]
+            )
+            ZaakDocument(
+                url=f"https://some-zaak.com/{i}",
+                identificatie=f"some-identificatie-{i}",
+                omschrijving="some-omschrijving",
+                bronorganisatie="some-bronorganisatie",
+                zaakinformatieobjecten=[zio],
+                vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduidingen.openbaar,
+                va_order=VA_ORDER[VertrouwelijkheidsAanduidingen.openbaar],
+            ).save()
+        self.refresh_index()
+
+        call_command("index_documenten")
+        self.refresh_index()
+
+        related_zaken = index.search().execute()[0].related_zaken
+        self.assertEqual(len(related_zaken), 15)
+        self.assertEqual(
+            {rz.url for rz in related_zaken},
+            {f"https://some-zaak.com/{i}" for i in range(15)},
+        )
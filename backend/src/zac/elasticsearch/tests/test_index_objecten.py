@@ -13,11 +13,12 @@ from zgw_consumers.test import mock_service_oas_get
 from zac.accounts.datastructures import VA_ORDER
 from zac.core.models import CoreConfig
 from zac.core.tests.utils import ClearCachesMixin
+from zac.tests.utils import paginated_response
 
 from ..documents import ObjectDocument, ZaakDocument, ZaakObjectDocument
 from .utils import ESMixin
 
-OBJECTS_ROOT = "https://api.objects.nl/api/v1/"
+OBJECTS_ROOT = "https://api.objects.nl/api/v2/"
 OBJECTTYPES_ROOT = "https://api.objecttypes.nl/api/v1/"
 
 
@@ -99,7 +100,7 @@ class IndexObjectsTests(ClearCachesMixin, ESMixin, APITransactionTestCase):
             },
         }
         m.get(f"{OBJECTTYPES_ROOT}objecttypes", json=[objecttype])
-        m.get(f"{OBJECTS_ROOT}objects", json=[object])
+        m.get(f"{OBJECTS_ROOT}objects", json=paginated_response([object]))
         index = Index(settings.ES_INDEX_OBJECTEN)
         self.refresh_index()
         self.assertEqual(index.search().count(), 0)
@@ -154,7 +155,7 @@ class IndexObjectsTests(ClearCachesMixin, ESMixin, APITransactionTestCase):
             },
         }
         m.get(f"{OBJECTTYPES_ROOT}objecttypes", json=[objecttype])
-        m.get(f"{OBJECTS_ROOT}objects", json=[object])
+        m.get(f"{OBJECTS_ROOT}objects", json=paginated_response([object]))
         zaakobject = ZaakObjectDocument(
             url="https://some-url.com/", object=object["url"]
         )
@@ -184,3 +185,53 @@ class IndexObjectsTests(ClearCachesMixin, ESMixin, APITransactionTestCase):
                 }
             ],
         )
+
+    def test_index_objecten_paginated(self, m):
+        mock_service_oas_get(m, OBJECTS_ROOT, "objects")
+        mock_service_oas_get(m, OBJECTTYPES_ROOT, "objecttypes")
+        objecttype = {
+            "url": f"{OBJECTTYPES_ROOT}objecttypes/1ddc6ea4-6d7f-4573-8f2d-6473eb1ceb5e",
+            "uuid": "1ddc6ea4-6d7f-4573-8f2d-6473eb1ceb5e",
+            "name": "Pand Utrecht NG",
+        }
+        objects = [
+            {
+                "url": f"{OBJECTS_ROOT}objects/{uuid}",
+                "uuid": uuid,
+                "type": objecttype["url"],
+                "record": {"index": 1, "typeVersion": 1, "data": {"VELD": uuid}},
+            }
+            for uuid in [
+                "f8a7573a-758f-4a19-aa22-245bb8f4712e",
+                "3b6a2d9c-6f5e-4c47-9d1c-4d3c1e5c2f0a",
+            ]
+        ]
+        m.get(f"{OBJECTTYPES_ROOT}objecttypes", json=[objecttype])
+        m.get(
+            f"{OBJECTS_ROOT}objects",
+            json={
+                "count": 2,
+                "previous": None,
+                "next": f"{OBJECTS_ROOT}objects?page=2",
+                "results": objects[:1],
+            },
+        )
+        m.get(
+            f"{OBJECTS_ROOT}objects?page=2",
+            json={
+                "count": 2,
+                "previous": f"{OBJECTS_ROOT}objects?page=1",
+                "next": None,
+                "results": objects[1:],
+            },
+        )
+        index = Index(settings.ES_INDEX_OBJECTEN)
+
+        call_command("index_objecten")
+
+        self.refresh_index()
+        self.assertEqual(index.search().count(), 2)
+        self.assertEqual(
+            {hit.url for hit in index.search().execute()},
+            {obj["url"] for obj in objects},
+        )
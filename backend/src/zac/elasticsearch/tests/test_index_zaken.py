@@ -1,3 +1,5 @@
+import json
+import tempfile
 from io import StringIO
 from unittest.mock import patch
 
@@ -5,6 +7,7 @@ from django.conf import settings
 from django.core.management import call_command
 
 import requests_mock
+from elasticsearch_dsl import Index
 from rest_framework.test import APITransactionTestCase
 from zgw_consumers.constants import APITypes
 from zgw_consumers.models import Service
@@ -30,6 +33,9 @@ class IndexZakenTests(ClearCachesMixin, ESMixin, APITransactionTestCase):
         Service.objects.create(api_type=APITypes.zrc, api_root=ZAKEN_ROOT)
 
     def test_index_zaken_without_rollen(self, m):
+        Index(settings.ES_INDEX_PERMISSIONS).delete(ignore=404)
+        self.addCleanup(Index(settings.ES_INDEX_PERMISSIONS).delete, ignore=404)
+
         # mock API requests
         mock_service_oas_get(m, CATALOGI_ROOT, "ztc")
         mock_service_oas_get(m, ZAKEN_ROOT, "zrc")
@@ -85,6 +91,8 @@ class IndexZakenTests(ClearCachesMixin, ESMixin, APITransactionTestCase):
             zaak_document.va_order, VA_ORDER[zaak["vertrouwelijkheidaanduiding"]]
         )
         self.assertEqual(zaak_document.rollen, [])
+        # the searches write their permission documents to this index
+        self.assertTrue(Index(settings.ES_INDEX_PERMISSIONS).exists())
 
     def test_index_zaken_with_rollen(self, m):
         # mock API requests
@@ -725,3 +733,48 @@ class IndexZakenTests(ClearCachesMixin, ESMixin, APITransactionTestCase):
         # check zaak_document exists
         zd2 = ZaakDocument.get(id="a522d30c-6c10-47fe-82e3-e9f524c14ca9")
         self.assertEqual(zd2.identificatie, "ZAAK-002")
+
+    def test_index_zaken_metrics_report(self, m):
+        # mock API requests
+        mock_service_oas_get(m, CATALOGI_ROOT, "ztc")
+        mock_service_oas_get(m, ZAKEN_ROOT, "zrc")
+        zaaktype = generate_oas_component(
+            "ztc",
+            "schemas/ZaakType",
+            url=f"{CATALOGI_ROOT}zaaktypen/a8c8bc90-defa-4548-bacd-793874c013aa",
+        )
+        zaak = generate_oas_component(
+            "zrc",
+            "schemas/Zaak",
+            url=f"{ZAKEN_ROOT}zaken/a522d30c-6c10-47fe-82e3-e9f524c14ca8",
+            zaaktype=zaaktype["url"],
+            bronorganisatie="002220647",
+            identificatie="ZAAK1",
+            vertrouwelijkheidaanduiding="zaakvertrouwelijk",
+            status=None,
+        )
+        m.get(f"{CATALOGI_ROOT}zaaktypen", json=paginated_response([zaaktype]))
+        m.get(f"{ZAKEN_ROOT}zaken", json=paginated_response([zaak]))
+        m.get(f"{ZAKEN_ROOT}rollen", json=paginated_response([]))
+        m.get(
+            f"{ZAKEN_ROOT}zaakobjecten?zaak={zaak['url']}", json=paginated_response([])
+        )
+        m.get(f"{ZAKEN_ROOT}zaakinformatieobjecten?zaak={zaak['url']}", json=[])
+        m.get(zaaktype["url"], json=zaaktype)
+        stdout = StringIO()
+
+        with tempfile.NamedTemporaryFile(suffix=".json") as report:
+            with patch(
+                "zac.elasticsearch.management.commands.index_zaken.get_zaak_eigenschappen",
+                return_value=[],
+            ):
+                call_command("index_zaken", metrics_report=report.name, stdout=stdout)
+            metrics = json.load(report)
+
+        for stage in ("fetch", "enrich.rollen", "serialize", "generate", "bulk"):
+            with self.subTest(stage=stage):
+                self.assertIn(stage, metrics["stages"])
+        self.assertEqual(metrics["stages"]["fetch"]["items"], 1)
+        self.assertEqual(metrics["stages"]["serialize"]["items"], 1)
+        self.assertEqual(metrics["stages"]["bulk"]["items"], 1)
+        self.assertIn("p95 ms", stdout.getvalue())
@@ -0,0 +1,222 @@
+from unittest.mock import MagicMock, patch
+
+from django.conf import settings
+from django.test import TestCase, override_settings
+
+from elasticsearch.helpers import bulk
+from elasticsearch_dsl import Index
+from zgw_consumers.api_models.base import factory
+from zgw_consumers.api_models.catalogi import ZaakType
+from zgw_consumers.api_models.zaken import Status
+
+from zac.core.rollen import Rol
+from zac.core.services import get_zaak
+from zac.core.tests.utils import ClearCachesMixin
+from zac.tests.zrc import get_zaak_response
+from zac.tests.ztc import get_zaaktype_response
+from zgw.models.zrc import Zaak
+
+from ..api import (
+    bulk_zaak_document_updates,
+    create_related_zaak_document,
+    create_status_document,
+    update_related_zaak_in_informatieobject_documents,
+    update_related_zaak_in_object_documents,
+    update_rollen_in_zaak_document,
+    update_status_in_zaak_document,
+    update_zaakobjecten_in_zaak_document,
+)
+from ..documents import InformatieObjectDocument, ObjectDocument, ZaakDocument
+from .utils import ESMixin
+
+CATALOGUS = (
+    "https://api.catalogi.nl/api/v1/catalogussen/e13e72de-56ba-42b6-be36-5c280e9b30cd"
+)
+ZAAKTYPE = (
+    "https://api.catalogi.nl/api/v1/zaaktypen/a8c8bc90-defa-4548-bacd-793874c013aa"
+)
+ZAAK = "https://api.zaken.nl/api/v1/zaken/a522d30c-6c10-47fe-82e3-e9f524c14ca8"
+STATUS = "https://api.zaken.nl/api/v1/statussen/dd4573d0-4d99-4e90-a05c-e08911e8673e"
+ROL = "https://api.zaken.nl/api/v1/rollen/b80022cf-6084-4cf6-932b-799effdcdb26"
+
+
+class PartialUpdateTests(ClearCachesMixin, ESMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.zaak = factory(Zaak, get_zaak_response(ZAAK, ZAAKTYPE))
+        self.zaak.zaaktype = factory(
+            ZaakType, get_zaaktype_response(CATALOGUS, ZAAKTYPE)
+        )
+        self.status = factory(
+            Status,
+            {
+                "url": STATUS,
+                "zaak": ZAAK,
+                "statustype": "https://api.catalogi.nl/api/v1/statustypen/1",
+                "datumStatusGezet": "2020-12-25T00:00:00Z",
+                "statustoelichting": "",
+            },
+        )
+        self.rol = factory(
+            Rol,
+            {
+                "url": ROL,
+                "zaak": ZAAK,
+                "betrokkene": "",
+                "betrokkeneType": "medewerker",
+                "roltype": "https://api.catalogi.nl/api/v1/roltypen/1",
+                "omschrijving": "some-omschrijving",
+                "omschrijvingGeneriek": "behandelaar",
+                "roltoelichting": "",
+                "registratiedatum": "2020-09-01T00:00:00Z",
+                "indicatieMachtiging": "",
+                "betrokkeneIdentificatie": {"identificatie": "some-user"},
+            },
+        )
+
+    def _index_zaak(self, **fields) -> ZaakDocument:
+        zaak_document = self.create_zaak_document(self.zaak)
+        zaak_document.zaaktype = self.create_zaaktype_document(self.zaak.zaaktype)
+        for name, value in fields.items():
+            setattr(zaak_document, name, value)
+        zaak_document.save()
+        return zaak_document
+
+    @patch("zac.elasticsearch.api.get_statustype")
+    def test_update_replaces_object_field(self, mock_get_statustype):
+        mock_get_statustype.return_value.omschrijving = "new-statustype"
+        old_status = factory(
+            Status,
+            {
+                "url": STATUS,
+                "zaak": ZAAK,
+                "statustype": "https://api.catalogi.nl/api/v1/statustypen/0",
+                "datumStatusGezet": "2020-12-24T00:00:00Z",
+                "statustoelichting": "some-statustoelichting",
+            },
+        )
+        self._index_zaak(status=create_status_document(old_status))
+        self.zaak.status = self.status
+
+        update_status_in_zaak_document(self.zaak)
+
+        zaak_document = ZaakDocument.get(id=self.zaak.uuid)
+        self.assertEqual(zaak_document.status.statustype, "new-statustype")
+        self.assertEqual(zaak_document.status.statustoelichting, "")
+        # the other fields are untouched
+        self.assertEqual(zaak_document.zaaktype.url, ZAAKTYPE)
+
+    @patch("zac.elasticsearch.api.get_zaakobjecten", return_value=[])
+    def test_update_indexes_missing_zaak(self, mock_get_zaakobjecten):
+        update_zaakobjecten_in_zaak_document(self.zaak)
+
+        zaak_document = ZaakDocument.get(id=self.zaak.uuid)
+        self.assertEqual(zaak_document.identificatie, self.zaak.identificatie)
+        self.assertEqual(zaak_document.zaakobjecten, [])
+
+    @override_settings(ES_READ_MODEL=True)
+    @patch("zac.elasticsearch.api.get_statustype")
+    def test_upserted_zaak_is_read_from_zrc(self, mock_get_statustype):
+        mock_get_statustype.return_value.omschrijving = "new-statustype"
+        self.zaak.status = self.status
+        update_status_in_zaak_document(self.zaak)
+        zaak_response = get_zaak_response(ZAAK, ZAAKTYPE)
+        client = MagicMock()
+        client.retrieve.return_value = zaak_response
+
+        zaak = get_zaak(zaak_url=ZAAK, client=client)
+
+        # the upserted document has no zaaktype, so it isn't served as read model
+        self.assertNotIn("zaaktype", ZaakDocument.get(id=self.zaak.uuid).to_dict())
+        client.retrieve.assert_called_once_with("zaak", url=ZAAK, uuid=None)
+        self.assertEqual(zaak, factory(Zaak, zaak_response))
+
+    @patch("zac.elasticsearch.api.get_zaakobjecten", return_value=[])
+    @patch("zac.elasticsearch.api.get_rollen")
+    def test_bulk_zaak_document_updates(self, mock_get_rollen, mock_get_zaakobjecten):
+        mock_get_rollen.return_value = [self.rol]
+        self._index_zaak(zaakobjecten=[{"url": "some-url", "object": "some-object"}])
+
+        with patch("zac.elasticsearch.api.bulk", wraps=bulk) as mock_bulk:
+            with bulk_zaak_document_updates():
+                update_rollen_in_zaak_document(self.zaak)
+                update_zaakobjecten_in_zaak_document(self.zaak)
+
+                # nothing is sent yet
+                zaak_document = ZaakDocument.get(id=self.zaak.uuid)
+                self.assertEqual(zaak_document.rollen, [])
+
+        # one bulk request with one merged update
+        mock_bulk.assert_called_once()
+        self.assertEqual(len(list(mock_bulk.call_args[0][1])), 1)
+        zaak_document = ZaakDocument.get(id=self.zaak.uuid)
+        self.assertEqual(zaak_document.rollen[0].url, ROL)
+        self.assertEqual(zaak_document.zaakobjecten, [])
+
+
+class RelatedZaakPropagationTests(ESMixin, TestCase):
+    @staticmethod
+    def clear_index(init=False):
+        ESMixin.clear_index(init=init)
+        Index(settings.ES_INDEX_DOCUMENTEN).delete(ignore=404)
+        Index(settings.ES_INDEX_OBJECTEN).delete(ignore=404)
+
+        if init:
+            InformatieObjectDocument.init()
+            ObjectDocument.init()
+
+    @staticmethod
+    def refresh_index():
+        ESMixin.refresh_index()
+        Index(settings.ES_INDEX_DOCUMENTEN).refresh()
+        Index(settings.ES_INDEX_OBJECTEN).refresh()
+
+    def test_update_related_zaak_in_many_documents(self):
+        zaak = factory(Zaak, get_zaak_response(ZAAK, ZAAKTYPE))
+        zaak.zaaktype = factory(ZaakType, get_zaaktype_response(CATALOGUS, ZAAKTYPE))
+        other_zaak = factory(
+            Zaak,
+            get_zaak_response(
+                "https://api.zaken.nl/api/v1/zaken/0c79c41d-72ef-4ea2-8c4c-03c9945da2a2",
+                ZAAKTYPE,
+                omschrijving="other zaak",
+            ),
+        )
+        other_zaak.zaaktype = zaak.zaaktype
+        # more documents than the default search size
+        for i in range(15):
+            ObjectDocument(
+                meta={"id": str(i)},
+                url=f"https://api.objects.nl/api/v2/objects/{i}",
+                related_zaken=[
+                    create_related_zaak_document(zaak),
+                    create_related_zaak_document(other_zaak),
+                ],
+            ).save()
+            InformatieObjectDocument(
+                meta={"id": str(i)},
+                url=f"https://api.drc.nl/api/v1/enkelvoudiginformatieobjecten/{i}",
+                related_zaken=[create_related_zaak_document(zaak)],
+            ).save()
+        self.refresh_index()
+
+        zaak.omschrijving = "updated omschrijving"
+        update_related_zaak_in_object_documents(zaak)
+        update_related_zaak_in_informatieobject_documents(zaak)
+        self.refresh_index()
+
+        for document in [ObjectDocument, InformatieObjectDocument]:
+            with self.subTest(document=document):
+                search = document.search().extra(size=20)
+                hits = list(search.execute())
+                self.assertEqual(len(hits), 15)
+                for hit in hits:
+                    self.assertEqual(
+                        hit.related_zaken[0].omschrijving, "updated omschrijving"
+                    )
+
+        # the other related zaken are left alone
+        self.assertEqual(
+            ObjectDocument.get(id="0").related_zaken[1].omschrijving, "other zaak"
+        )
@@ -0,0 +1,152 @@
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+from django.conf import settings
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from elasticsearch_dsl import Index, Q
+from elasticsearch_dsl.query import Bool, Nested, Terms
+from zgw_consumers.api_models.base import factory
+from zgw_consumers.api_models.catalogi import ZaakType
+
+from zac.accounts.tests.factories import (
+    AtomicPermissionFactory,
+    UserAtomicPermissionFactory,
+    UserFactory,
+)
+from zac.core.permissions import zaken_inzien
+from zac.core.tests.utils import ClearCachesMixin
+from zac.tests.zrc import get_zaak_response
+from zac.tests.ztc import get_zaaktype_response
+from zgw.models.zrc import Zaak
+
+from ..documents import PermissionsDocument, ZaakDocument
+from ..searches import (
+    _compile_queries_allowed_for_requester,
+    queries_allowed_for_requester,
+    query_allowed_for_requester,
+)
+from .utils import ESMixin
+
+CATALOGUS = (
+    "https://api.catalogi.nl/api/v1/catalogussen/e13e72de-56ba-42b6-be36-5c280e9b30cd"
+)
+ZAAKTYPE = (
+    "https://api.catalogi.nl/api/v1/zaaktypen/a8c8bc90-defa-4548-bacd-793874c013aa"
+)
+ZAAK = "https://api.zaken.nl/api/v1/zaken/a522d30c-6c10-47fe-82e3-e9f524c14ca8"
+OTHER_ZAAK = "https://api.zaken.nl/api/v1/zaken/0c79c41d-72ef-4ea2-8c4c-03c9945da2a2"
+
+
+class PermissionQueryCacheTests(ClearCachesMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.user = UserFactory.create()
+        self.request = MagicMock(user=self.user, auth=None)
+
+    def test_query_is_cached(self):
+        AtomicPermissionFactory.create(
+            for_user=self.user, permission=zaken_inzien.name, object_url=ZAAK
+        )
+        query = query_allowed_for_requester(self.request)
+
+        with self.assertNumQueries(0):
+            cached_query = query_allowed_for_requester(self.request)
+
+        self.assertEqual(query, Terms(url=[ZAAK]))
+        self.assertEqual(cached_query, query)
+
+    def test_nested_queries_share_permission_load(self):
+        AtomicPermissionFactory.create(
+            for_user=self.user, permission=zaken_inzien.name, object_url=ZAAK
+        )
+        with patch(
+            "zac.elasticsearch.searches._compile_queries_allowed_for_requester",
+            wraps=_compile_queries_allowed_for_requester,
+        ) as mock_compile:
+            queries = queries_allowed_for_requester(
+                self.request, on_nested_fields=("", "related_zaken")
+            )
+        mock_compile.assert_called_once()
+        # both variants are cached
+        with self.assertNumQueries(0):
+            nested_query = query_allowed_for_requester(
+                self.request, on_nested_field="related_zaken"
+            )
+
+        self.assertEqual(queries[""], Terms(url=[ZAAK]))
+        self.assertEqual(
+            nested_query,
+            Nested(
+                path="related_zaken",
+                query=Bool(filter=Terms(related_zaken__url=[ZAAK])),
+            ),
+        )
+        self.assertEqual(queries["related_zaken"], nested_query)
+
+    def test_permission_change_invalidates_query(self):
+        self.assertEqual(query_allowed_for_requester(self.request), Q("match_none"))
+
+        AtomicPermissionFactory.create(
+            for_user=self.user, permission=zaken_inzien.name, object_url=ZAAK
+        )
+
+        self.assertEqual(query_allowed_for_requester(self.request), Terms(url=[ZAAK]))
+
+    def test_query_expires_when_permission_starts(self):
+        UserAtomicPermissionFactory.create(
+            user=self.user,
+            atomic_permission__permission=zaken_inzien.name,
+            atomic_permission__object_url=OTHER_ZAAK,
+            start_date=timezone.now() + timedelta(minutes=5),
+        )
+
+        with patch.object(cache, "set", wraps=cache.set) as mock_set:
+            query = query_allowed_for_requester(self.request)
+
+        self.assertEqual(query, Q("match_none"))
+        timeout = mock_set.call_args[0][2]
+        self.assertLessEqual(timeout, 5 * 60)
+
+
+class PermissionTermsLookupTests(ClearCachesMixin, ESMixin, TestCase):
+    @staticmethod
+    def clear_index(init=False):
+        ESMixin.clear_index(init=init)
+        Index(settings.ES_INDEX_PERMISSIONS).delete(ignore=404)
+        if init:
+            PermissionsDocument.init()
+
+    @override_settings(ES_PERMISSION_TERMS_LOOKUP_THRESHOLD=1)
+    def test_many_atomic_permissions_are_looked_up(self):
+        user = UserFactory.create()
+        for url in [ZAAK, OTHER_ZAAK]:
+            AtomicPermissionFactory.create(
+                for_user=user, permission=zaken_inzien.name, object_url=url
+            )
+        zaak = factory(Zaak, get_zaak_response(ZAAK, ZAAKTYPE))
+        zaak.zaaktype = factory(ZaakType, get_zaaktype_response(CATALOGUS, ZAAKTYPE))
+        self.create_zaak_document(zaak).save()
+        self.refresh_index()
+
+        query = query_allowed_for_requester(MagicMock(user=user, auth=None))
+
+        key = f"{user.pk}:zaak:{zaken_inzien.name}"
+        self.assertEqual(
+            query,
+            Terms(
+                url={
+                    "index": settings.ES_INDEX_PERMISSIONS,
+                    "id": key,
+                    "path": "object_urls",
+                }
+            ),
+        )
+        self.assertEqual(
+            sorted(PermissionsDocument.get(id=key).object_urls), [OTHER_ZAAK, ZAAK]
+        )
+        hits = ZaakDocument.search().filter(query).execute().hits
+        self.assertEqual([hit.url for hit in hits], [ZAAK])
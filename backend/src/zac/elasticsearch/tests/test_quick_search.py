@@ -1,11 +1,11 @@
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from django.conf import settings
 from django.test import TestCase
 from django.urls import reverse_lazy
 
 import requests_mock
-from elasticsearch_dsl import Index
+from elasticsearch_dsl import Index, Search
 from rest_framework import status
 from rest_framework.test import APITransactionTestCase
 from zgw_consumers.api_models.base import factory
@@ -192,6 +192,17 @@ class QuickSearchTests(ClearCachesMixin, ESMixin, APITransactionTestCase):
         self.assertEqual(results["objecten"][0].url, self.object_document_1.url)
         self.assertEqual(results["documenten"][0].url, self.eio_document_1.url)
 
+    def test_quick_search_single_request(self):
+        with patch.object(Search, "execute") as mock_execute:
+            results = quick_search("2022 omsch")
+
+        mock_execute.assert_not_called()
+        self.assertEqual(
+            results["zaken"][0].identificatie, self.zaak_document1.identificatie
+        )
+        self.assertEqual(results["objecten"][0].url, self.object_document_1.url)
+        self.assertEqual(results["documenten"][0].url, self.eio_document_1.url)
+
     def test_quick_search_blueprint_permissions(self):
         user = UserFactory.create()
         request = MagicMock()
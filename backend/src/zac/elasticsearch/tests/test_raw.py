@@ -0,0 +1,168 @@
+import json
+
+from django.test import TestCase
+
+from elasticsearch.serializer import JSONSerializer
+from zgw_consumers.api_models.base import factory
+from zgw_consumers.api_models.catalogi import Eigenschap, StatusType, ZaakType
+from zgw_consumers.api_models.zaken import Status, ZaakEigenschap
+
+from zac.core.rollen import Rol
+from zac.tests.zrc import get_zaak_response
+from zac.tests.ztc import get_zaaktype_response
+from zgw.models.zrc import Zaak
+
+from ..api import (
+    create_eigenschappen_document,
+    create_rol_document,
+    create_status_document,
+    create_zaak_document,
+    create_zaaktype_document,
+)
+from ..raw import (
+    create_eigenschappen_source,
+    create_rol_source,
+    create_status_source,
+    create_zaak_source,
+    create_zaaktype_source,
+)
+
+CATALOGUS = (
+    "https://api.catalogi.nl/api/v1/catalogussen/e13e72de-56ba-42b6-be36-5c280e9b30cd"
+)
+ZAAKTYPE = (
+    "https://api.catalogi.nl/api/v1/zaaktypen/a8c8bc90-defa-4548-bacd-793874c013aa"
+)
+ZAAK = "https://api.zaken.nl/api/v1/zaken/a522d30c-6c10-47fe-82e3-e9f524c14ca8"
+
+
+def serialize(data: dict) -> dict:
+    """
+    Return the data the way it ends up in ES.
+    """
+    return json.loads(JSONSerializer().dumps(data))
+
+
+class RawSourceTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.zaaktype = factory(ZaakType, get_zaaktype_response(CATALOGUS, ZAAKTYPE))
+
+    def test_zaak_source(self):
+        raw = get_zaak_response(
+            ZAAK,
+            ZAAKTYPE,
+            einddatum="2020-01-01",
+            zaakgeometrie={"type": "Point", "coordinates": [4.4, 51.9]},
+        )
+        zaak = factory(Zaak, raw)
+        zaak.zaaktype = self.zaaktype
+
+        self.assertEqual(
+            serialize(create_zaak_source(raw, self.zaaktype)),
+            serialize(create_zaak_document(zaak).to_dict()),
+        )
+
+    def test_zaak_source_uiterlijke_einddatum_afdoening(self):
+        raw = get_zaak_response(
+            ZAAK, ZAAKTYPE, uiterlijkeEinddatumAfdoening="2021-06-01"
+        )
+        zaak = factory(Zaak, raw)
+        zaak.zaaktype = self.zaaktype
+
+        source = create_zaak_source(raw, self.zaaktype)
+
+        self.assertEqual(source["deadline"], "2021-06-01")
+        self.assertEqual(
+            serialize(source), serialize(create_zaak_document(zaak).to_dict())
+        )
+
+    def test_zaaktype_source(self):
+        self.assertEqual(
+            create_zaaktype_source(self.zaaktype),
+            create_zaaktype_document(self.zaaktype).to_dict(),
+        )
+
+    def test_status_source(self):
+        raw = {
+            "url": "https://api.zaken.nl/api/v1/statussen/dd4573d0-4d99-4e90-a05c-e08911e8673e",
+            "zaak": ZAAK,
+            "statustype": "https://api.catalogi.nl/api/v1/statustypen/c612f300-8e16-4811-84f4-78c99fdebe74",
+            "datumStatusGezet": "2020-12-25T09:00:00Z",
+            "statustoelichting": "",
+        }
+        status = factory(Status, raw)
+        status.statustype = StatusType(
+            url=raw["statustype"],
+            zaaktype=ZAAKTYPE,
+            omschrijving="Ontvangen",
+            omschrijving_generiek="",
+            statustekst="",
+            volgnummer=1,
+            is_eindstatus=False,
+        )
+
+        self.assertEqual(
+            serialize(create_status_source(raw, "Ontvangen")),
+            serialize(create_status_document(status).to_dict()),
+        )
+
+    def test_rol_source(self):
+        raw = {
+            "url": "https://api.zaken.nl/api/v1/rollen/b80022cf-6084-4cf6-932b-799effdcdb26",
+            "zaak": ZAAK,
+            "betrokkene": None,
+            "betrokkeneType": "medewerker",
+            "roltype": "https://api.catalogi.nl/api/v1/roltypen/bfd62804-f46c-42e7-a31c-4139b4c661ac",
+            "omschrijving": "zaak behandelaar",
+            "omschrijvingGeneriek": "behandelaar",
+            "roltoelichting": "",
+            "registratiedatum": "2020-09-01T00:00:00Z",
+            "indicatieMachtiging": "",
+            "betrokkeneIdentificatie": {
+                "identificatie": "user:some-user",
+                "voorletters": "S",
+                "achternaam": "User",
+                "voorvoegselAchternaam": "",
+            },
+        }
+
+        self.assertEqual(
+            create_rol_source(raw),
+            create_rol_document(factory(Rol, raw)).to_dict(),
+        )
+
+    def test_eigenschappen_source(self):
+        eigenschap = factory(
+            Eigenschap,
+            {
+                "url": "https://api.catalogi.nl/api/v1/eigenschappen/e3af6a57-4411-4fee-a57f-9f598c3f9d49",
+                "zaaktype": ZAAKTYPE,
+                "naam": "some.prop",
+                "definitie": "",
+                "specificatie": {
+                    "groep": "dummy",
+                    "formaat": "tekst",
+                    "lengte": "3",
+                    "kardinaliteit": "1",
+                    "waardenverzameling": [],
+                },
+                "toelichting": "",
+            },
+        )
+        raw = {
+            "url": f"{ZAAK}/zaakeigenschappen/1b2b6aa8-bb41-4168-9c07-f586294f008a",
+            "zaak": ZAAK,
+            "eigenschap": eigenschap.url,
+            "naam": "some.prop",
+            "waarde": "aaa",
+        }
+        zaakeigenschap = factory(ZaakEigenschap, raw)
+        zaakeigenschap.eigenschap = eigenschap
+
+        self.assertEqual(
+            create_eigenschappen_source(
+                [raw], {eigenschap.url: eigenschap.specificatie.formaat}
+            ),
+            create_eigenschappen_document([zaakeigenschap]),
+        )
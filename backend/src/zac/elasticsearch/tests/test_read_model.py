@@ -0,0 +1,126 @@
+import json
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from elasticsearch.serializer import JSONSerializer
+from zgw_consumers.api_models.base import factory
+from zgw_consumers.api_models.catalogi import ZaakType
+
+from zac.core.services import get_zaak
+from zac.tests.zrc import get_zaak_response
+from zac.tests.ztc import get_zaaktype_response
+from zgw.models.zrc import Zaak
+
+from ..api import create_zaak_document, create_zaaktype_document
+from ..documents import StatusDocument
+from ..read_model import READ_MODEL_VERSION, get_zaken_from_index, mark_zaak_written
+
+CATALOGUS = (
+    "https://api.catalogi.nl/api/v1/catalogussen/e13e72de-56ba-42b6-be36-5c280e9b30cd"
+)
+ZAAKTYPE = (
+    "https://api.catalogi.nl/api/v1/zaaktypen/a8c8bc90-defa-4548-bacd-793874c013aa"
+)
+ZAAK = "https://api.zaken.nl/api/v1/zaken/a522d30c-6c10-47fe-82e3-e9f524c14ca8"
+OTHER_ZAAK = "https://api.zaken.nl/api/v1/zaken/0c79c41d-72ef-4ea2-8c4c-03c9945da2a2"
+
+
+@patch("zac.elasticsearch.read_model.connections")
+class ReadModelTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.zaak_response = get_zaak_response(
+            ZAAK,
+            ZAAKTYPE,
+            status="https://api.zaken.nl/api/v1/statussen/1",
+            resultaat="https://api.zaken.nl/api/v1/resultaten/1",
+            einddatumGepland="2020-01-01",
+            relevanteAndereZaken=[{"url": OTHER_ZAAK, "aardRelatie": "vervolg"}],
+        )
+        zaak = factory(Zaak, self.zaak_response)
+        zaak.zaaktype = factory(ZaakType, get_zaaktype_response(CATALOGUS, ZAAKTYPE))
+        zaak_document = create_zaak_document(zaak)
+        zaak_document.zaaktype = create_zaaktype_document(zaak.zaaktype)
+        zaak_document.status = StatusDocument(url=zaak.status, statustype="Nieuw")
+        zaak_document.read_model_version = READ_MODEL_VERSION
+        self.source = json.loads(JSONSerializer().dumps(zaak_document.to_dict()))
+
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def _mget_response(self, *sources):
+        return {
+            "docs": [
+                {"_id": source["url"].split("/")[-1], "found": True, "_source": source}
+                for source in sources
+            ]
+        }
+
+    def test_zaak_from_index(self, mock_connections):
+        mock_mget = mock_connections.get_connection.return_value.mget
+        mock_mget.return_value = self._mget_response(self.source)
+
+        zaken = get_zaken_from_index([ZAAK])
+
+        mock_mget.assert_called_once()
+        # the same zaak as retrieved from the ZRC
+        self.assertEqual(zaken, {ZAAK: factory(Zaak, self.zaak_response)})
+
+    def test_missing_and_stale_zaken_are_left_out(self, mock_connections):
+        stale_source = {**self.source, "url": OTHER_ZAAK}
+        del stale_source["read_model_version"]
+        mock_connections.get_connection.return_value.mget.return_value = {
+            "docs": [
+                *self._mget_response(stale_source)["docs"],
+                {"_id": "1", "found": False},
+            ]
+        }
+
+        zaken = get_zaken_from_index(
+            [OTHER_ZAAK, "https://api.zaken.nl/api/v1/zaken/1"]
+        )
+
+        self.assertEqual(zaken, {})
+
+    def test_zaken_without_zaaktype_are_left_out(self, mock_connections):
+        source = {**self.source}
+        del source["zaaktype"]
+        mock_connections.get_connection.return_value.mget.return_value = (
+            self._mget_response(source)
+        )
+
+        zaken = get_zaken_from_index([ZAAK])
+
+        self.assertEqual(zaken, {})
+
+    def test_zaken_written_by_zac_are_left_out(self, mock_connections):
+        mock_mget = mock_connections.get_connection.return_value.mget
+        mock_mget.return_value = self._mget_response(self.source)
+        mark_zaak_written(ZAAK)
+
+        zaken = get_zaken_from_index([ZAAK])
+
+        self.assertEqual(zaken, {})
+        mock_mget.assert_not_called()
+
+    @override_settings(ES_READ_MODEL=True)
+    def test_get_zaak_does_not_cache_zaken_from_index(self, mock_connections):
+        mock_mget = mock_connections.get_connection.return_value.mget
+        mock_mget.return_value = self._mget_response(self.source)
+        client = MagicMock()
+        client.retrieve.return_value = self.zaak_response
+
+        get_zaak(zaak_url=ZAAK, client=client)
+        get_zaak(zaak_url=ZAAK, client=client)
+
+        self.assertEqual(mock_mget.call_count, 2)
+        client.retrieve.assert_not_called()
+
+        mark_zaak_written(ZAAK)
+        zaak = get_zaak(zaak_url=ZAAK, client=client)
+
+        client.retrieve.assert_called_once_with("zaak", url=ZAAK, uuid=None)
+        self.assertEqual(zaak, factory(Zaak, self.zaak_response))
@@ -0,0 +1,63 @@
+from unittest.mock import patch
+
+from django.apps import apps
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase, override_settings
+
+from ..constants import RefreshPolicies
+from ..refresh import get_refresh
+
+
+class RefreshPolicyTests(SimpleTestCase):
+    @override_settings(ES_REFRESH_POLICY=RefreshPolicies.none)
+    def test_no_refresh(self):
+        self.assertIs(get_refresh("zaken"), False)
+
+    @override_settings(ES_REFRESH_POLICY=RefreshPolicies.none)
+    def test_explicit_wait_for(self):
+        self.assertEqual(get_refresh("zaken", RefreshPolicies.wait_for), "wait_for")
+
+    @override_settings(ES_REFRESH_POLICY=RefreshPolicies.wait_for)
+    def test_wait_for(self):
+        self.assertEqual(get_refresh("zaken"), "wait_for")
+
+    @override_settings(
+        ES_REFRESH_POLICY=RefreshPolicies.batched, ES_REFRESH_INTERVAL=100
+    )
+    @patch.dict("zac.elasticsearch.refresh._scheduled", clear=True)
+    @patch("zac.elasticsearch.refresh.threading.Timer")
+    @patch("zac.elasticsearch.refresh.connections")
+    def test_batched_refresh(self, mock_connections, mock_timer):
+        self.assertIs(get_refresh("zaken"), False)
+        self.assertIs(get_refresh("zaken"), False)
+        self.assertIs(get_refresh("objecten"), False)
+
+        # one refresh per index is scheduled
+        self.assertEqual(mock_timer.call_count, 2)
+        interval, refresh_index = mock_timer.call_args_list[0][0]
+        self.assertEqual(interval, 0.1)
+
+        refresh_index(*mock_timer.call_args_list[0][1]["args"])
+
+        mock_connections.get_connection.return_value.indices.refresh.assert_called_once_with(
+            index="zaken"
+        )
+        # the next write schedules a new refresh
+        get_refresh("zaken")
+        self.assertEqual(mock_timer.call_count, 3)
+
+
+class RefreshPolicySettingTests(SimpleTestCase):
+    @override_settings(ES_REFRESH_POLICY="wait-for")
+    def test_invalid_policy(self):
+        app_config = apps.get_app_config("elasticsearch")
+
+        with self.assertRaises(ImproperlyConfigured):
+            app_config.ready()
+
+    @override_settings(ES_REFRESH_POLICY=RefreshPolicies.batched)
+    @patch("zac.elasticsearch.apps.connections")
+    def test_valid_policy(self, mock_connections):
+        apps.get_app_config("elasticsearch").ready()
+
+        mock_connections.configure.assert_called_once()
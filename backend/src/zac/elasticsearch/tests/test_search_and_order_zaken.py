@@ -16,7 +16,13 @@ from zac.camunda.constants import AssigneeTypeChoices
 from zac.core.permissions import zaken_inzien
 
 from ..documents import ZaakDocument, ZaakTypeDocument
-from ..searches import search_zaken
+from ..searches import (
+    autocomplete_zaak_search,
+    get_zaken_clusters,
+    get_zaken_facets,
+    get_zaken_search,
+    search_zaken,
+)
 from .utils import ESMixin
 
 CATALOGI_ROOT = "https://api.catalogi.nl/api/v1/"
@@ -38,6 +44,7 @@ class SearchZakenTests(ESMixin, TestCase):
             identificatie="ZAAK1",
             bronorganisatie="123456",
             omschrijving="Some zaak description",
+            toelichting="Aanvraag van een vergunning",
             vertrouwelijkheidaanduiding="beperkt_openbaar",
             va_order=16,
             rollen=[
@@ -64,6 +71,8 @@ class SearchZakenTests(ESMixin, TestCase):
                 }
             },
             deadline="2021-12-31",
+            zaakgeometrie={"type": "Point", "coordinates": [4.9, 52.37]},
+            zaakgeometrie_punt={"lon": 4.9, "lat": 52.37},
         )
         self.zaak_document1.save()
 
@@ -165,6 +174,32 @@ class SearchZakenTests(ESMixin, TestCase):
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0].url, self.zaak_document1.url)
 
+    def test_search_omschrijving_words(self):
+        result = search_zaken(omschrijving="zaak descr", only_allowed=False)
+
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].url, self.zaak_document1.url)
+
+    def test_search_omschrijving_short_word(self):
+        result = search_zaken(omschrijving="ak", only_allowed=False)
+
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].url, self.zaak_document1.url)
+
+    def test_search_stop_words(self):
+        for toelichting in ["van", "Van een", "aanvraag van", "aan"]:
+            with self.subTest(toelichting=toelichting):
+                result = search_zaken(toelichting=toelichting, only_allowed=False)
+
+                self.assertEqual(len(result), 1)
+                self.assertEqual(result[0].url, self.zaak_document1.url)
+
+    def test_search_toelichting_part(self):
+        result = search_zaken(toelichting="vergun", only_allowed=False)
+
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].url, self.zaak_document1.url)
+
     def test_search_eigenschappen(self):
         result = search_zaken(
             eigenschappen={"Beleidsveld": "Asiel\ en\ Integratie"}, only_allowed=False
@@ -179,6 +214,13 @@ class SearchZakenTests(ESMixin, TestCase):
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0].url, self.zaak_document1.url)
 
+    def test_search_eigenschappen_escaped_wildcard(self):
+        result = search_zaken(
+            eigenschappen={"Beleidsveld": "Asiel\\*"}, only_allowed=False
+        )
+
+        self.assertEqual(len(result), 0)
+
     def test_search_eigenschappen_with_point(self):
         result = search_zaken(
             eigenschappen={"Bedrag incl. BTW": "aaa"}, only_allowed=False
@@ -187,6 +229,74 @@ class SearchZakenTests(ESMixin, TestCase):
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0].url, self.zaak_document1.url)
 
+    def test_autocomplete_identificatie(self):
+        result = autocomplete_zaak_search("zaak1", only_allowed=False)
+
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].url, self.zaak_document1.url)
+        # only the fields of the suggestions are retrieved
+        self.assertIsNone(result[0].omschrijving)
+
+    def test_autocomplete_omschrijving(self):
+        result = autocomplete_zaak_search("oth desc", only_allowed=False)
+
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].url, self.zaak_document2.url)
+
+    def test_facets(self):
+        facets = get_zaken_facets(get_zaken_search(only_allowed=False, ordering=None))
+
+        self.assertEqual(facets["count"], 2)
+        self.assertEqual(
+            facets["zaaktypen"],
+            [{"value": "zaaktype1", "count": 1}, {"value": "zaaktype2", "count": 1}],
+        )
+        self.assertEqual(
+            facets["vertrouwelijkheidaanduidingen"],
+            [
+                {"value": "beperkt_openbaar", "count": 1},
+                {"value": "confidentieel", "count": 1},
+            ],
+        )
+        self.assertEqual(
+            facets["afgesloten"],
+            [{"value": "open", "count": 2}, {"value": "closed", "count": 0}],
+        )
+        self.assertEqual(
+            facets["behandelaars"], [{"value": "some_username", "count": 1}]
+        )
+        self.assertEqual(facets["deadline"], [{"value": "2021-12", "count": 2}])
+        self.assertEqual(facets["startdatum"], [])
+
+    def test_search_bbox(self):
+        result = search_zaken(bbox=[4.8, 52.3, 5.0, 52.4], only_allowed=False)
+
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].url, self.zaak_document1.url)
+
+        result = search_zaken(bbox=[5.0, 52.3, 5.1, 52.4], only_allowed=False)
+
+        self.assertEqual(len(result), 0)
+
+    def test_search_polygon(self):
+        result = search_zaken(
+            polygon=[[4.8, 52.3], [5.0, 52.3], [5.0, 52.4]], only_allowed=False
+        )
+
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].url, self.zaak_document1.url)
+
+    def test_clusters(self):
+        clusters = get_zaken_clusters(
+            get_zaken_search(only_allowed=False, ordering=None), precision=0
+        )
+
+        self.assertEqual(len(clusters), 1)
+        self.assertEqual(clusters[0]["tile"], "0/0/0")
+        self.assertEqual(clusters[0]["count"], 1)
+        self.assertAlmostEqual(clusters[0]["centroid"]["lon"], 4.9, places=5)
+        self.assertAlmostEqual(clusters[0]["centroid"]["lat"], 52.37, places=5)
+
     def test_combined(self):
         user = UserFactory.create()
         BlueprintPermissionFactory.create(
@@ -0,0 +1,67 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from elasticsearch_dsl import Search
+from elasticsearch_dsl.response import Response
+
+from ..utils import get_geometry_center, iter_search_after
+
+
+class GeometryCenterTests(SimpleTestCase):
+    def test_point(self):
+        center = get_geometry_center({"type": "Point", "coordinates": [4.9, 52.37]})
+
+        self.assertEqual(center, {"lon": 4.9, "lat": 52.37})
+
+    def test_polygon(self):
+        center = get_geometry_center(
+            {
+                "type": "Polygon",
+                "coordinates": [[[4.0, 52.0], [5.0, 52.0], [5.0, 53.0], [4.0, 52.0]]],
+            }
+        )
+
+        self.assertEqual(center, {"lon": 4.5, "lat": 52.5})
+
+    def test_geometry_collection(self):
+        center = get_geometry_center(
+            {
+                "type": "GeometryCollection",
+                "geometries": [
+                    {"type": "Point", "coordinates": [4.0, 52.0]},
+                    {"type": "LineString", "coordinates": [[5.0, 53.0], [6.0, 54.0]]},
+                ],
+            }
+        )
+
+        self.assertEqual(center, {"lon": 5.0, "lat": 53.0})
+
+    def test_no_geometry(self):
+        self.assertIsNone(get_geometry_center(None))
+        self.assertIsNone(get_geometry_center({"type": "Point", "coordinates": []}))
+
+
+class SearchAfterTests(SimpleTestCase):
+    def test_iter_search_after(self):
+        search = Search(index="zaken").sort("-deadline")
+        bodies = []
+
+        def execute(batch):
+            bodies.append(batch.to_dict())
+            start = len(bodies) * 2 - 2
+            hits = [
+                {"_id": str(i), "_source": {}, "sort": [i, f"url-{i}"]}
+                for i in range(start, min(start + 2, 3))
+            ]
+            return Response(batch, {"hits": {"hits": hits}})
+
+        with patch.object(Search, "execute", execute):
+            responses = list(iter_search_after(search, [2, 2, 2]))
+
+        # the third batch isn't retrieved, the hits ran out
+        self.assertEqual([len(response.hits) for response in responses], [2, 1])
+        self.assertEqual(bodies[0]["sort"], [{"deadline": {"order": "desc"}}, "url"])
+        self.assertEqual(bodies[0]["size"], 2)
+        self.assertNotIn("search_after", bodies[0])
+        self.assertEqual(bodies[1]["search_after"], [1, "url-1"])
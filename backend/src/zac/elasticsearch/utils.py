@@ -1,7 +1,10 @@
+from typing import Iterable, Iterator, List, Optional
+
 from django.conf import settings
 
 from elasticsearch.exceptions import NotFoundError
-from elasticsearch_dsl import Index
+from elasticsearch_dsl import Index, Search
+from elasticsearch_dsl.response import Response
 
 
 def check_if_index_exists(index=settings.ES_INDEX_ZAKEN):
@@ -12,3 +15,61 @@ def check_if_index_exists(index=settings.ES_INDEX_ZAKEN):
             "Couldn't find index: %s. Please try to create the index through a command first."
             % index,
         )
+
+
+def iter_search_after(
+    search: Search, sizes: Iterable[int], search_after: Optional[list] = None
+) -> Iterator[Response]:
+    """
+    Execute the search in consecutive batches of the given sizes with ``search_after``.
+
+    Stops early when the hits run out. The hits are sorted on their URL after the
+    sort of the search, since ``search_after`` needs a unique sort order.
+    """
+    sort = search.to_dict().get("sort") or ["_score"]
+    search = search.sort(*sort, "url")
+
+    for size in sizes:
+        batch = search[:size]
+        if search_after:
+            batch = batch.extra(search_after=search_after)
+        response = batch.execute()
+        yield response
+        if len(response.hits) < size:
+            return
+        search_after = list(response.hits[-1].meta.sort)
+
+
+def _iter_positions(coordinates: list) -> Iterator[List[float]]:
+    if coordinates and isinstance(coordinates[0], (int, float)):
+        yield coordinates
+        return
+    for nested_coordinates in coordinates:
+        yield from _iter_positions(nested_coordinates)
+
+
+def get_geometry_center(geometry: Optional[dict]) -> Optional[dict]:
+    """
+    Return the center of the bounding box of a GeoJSON geometry as ES geo point.
+    """
+    if not geometry:
+        return None
+
+    if geometry.get("type") == "GeometryCollection":
+        geometries = geometry.get("geometries", [])
+    else:
+        geometries = [geometry]
+    positions = [
+        position
+        for geometry in geometries
+        for position in _iter_positions(geometry.get("coordinates") or [])
+    ]
+    if not positions:
+        return None
+
+    longitudes = [position[0] for position in positions]
+    latitudes = [position[1] for position in positions]
+    return {
+        "lon": (min(longitudes) + max(longitudes)) / 2,
+        "lat": (min(latitudes) + max(latitudes)) / 2,
+    }
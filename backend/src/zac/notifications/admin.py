@@ -1,8 +1,26 @@
 from django.contrib import admin
+from django.utils.translation import gettext_lazy as _
 
-from .models import Subscription
+from .models import QueuedNotification, Subscription
+from .queue import requeue_notifications
 
 
 @admin.register(Subscription)
 class SubscriptionAdmin(admin.ModelAdmin):
     list_display = ("created", "url")
+
+
+@admin.register(QueuedNotification)
+class QueuedNotificationAdmin(admin.ModelAdmin):
+    list_display = ("__str__", "status", "attempts", "available_at", "created")
+    list_filter = ("status",)
+    readonly_fields = ("message", "attempts", "last_error", "created")
+    actions = ["requeue"]
+
+    def requeue(self, request, queryset):
+        count = requeue_notifications(queryset)
+        self.message_user(
+            request, _("{count} notification(s) re-queued.").format(count=count)
+        )
+
+    requeue.short_description = _("Re-queue selected notifications")
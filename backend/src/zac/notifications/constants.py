@@ -0,0 +1,8 @@
+from django.utils.translation import gettext_lazy as _
+
+from djchoices import ChoiceItem, DjangoChoices
+
+
+class QueuedNotificationStatus(DjangoChoices):
+    pending = ChoiceItem("pending", _("pending"))
+    failed = ChoiceItem("failed", _("failed"))
@@ -1,10 +1,12 @@
 import logging
+from collections import defaultdict
+from typing import List
+
+from django.conf import settings
 
 from elasticsearch.exceptions import NotFoundError
 from zgw_consumers.api_models.base import factory
-from zgw_consumers.api_models.catalogi import ZaakType
 from zgw_consumers.api_models.constants import RolOmschrijving
-from zgw_consumers.api_models.zaken import Status
 from zgw_consumers.concurrent import parallel
 
 from zac.accounts.models import AccessRequest
@@ -30,10 +32,13 @@ from zac.core.services import (
     fetch_rol,
     fetch_zaak_informatieobject,
     fetch_zaak_object,
+    fetch_zaaktype,
     get_document,
+    get_status,
     update_medewerker_identificatie_rol,
 )
 from zac.elasticsearch.api import (
+    bulk_zaak_document_updates,
     create_status_document,
     create_zaak_document,
     create_zaaktype_document,
@@ -48,6 +53,7 @@ from zac.elasticsearch.api import (
     update_related_zaak_in_object_documents,
     update_related_zaken_in_informatieobject_document,
     update_related_zaken_in_object_document,
+    update_resultaat_in_zaak_document,
     update_rollen_in_zaak_document,
     update_status_in_zaak_document,
     update_zaak_document,
@@ -55,6 +61,8 @@ from zac.elasticsearch.api import (
     update_zaakobjecten_in_zaak_document,
 )
 from zac.elasticsearch.documents import ZaakDocument
+from zac.elasticsearch.read_model import READ_MODEL_VERSION
+from zac.elasticsearch.refresh import get_refresh
 from zgw.models.zrc import Zaak
 
 logger = logging.getLogger(__name__)
@@ -110,30 +118,97 @@ class ZakenHandler:
 
     @staticmethod
     def _retrieve_zaak(zaak_url) -> Zaak:
+        """
+        Retrieve the (uncached) zaak with its zaaktype.
+
+        The zaaktype is immutable and resolved through the cache. The status is left
+        unresolved - only the handlers that index the status need it, and they
+        resolve it themselves.
+        """
         client = _client_from_url(zaak_url)
-        zaak = client.retrieve("zaak", url=zaak_url)
+        zaak = factory(Zaak, client.retrieve("zaak", url=zaak_url))
+        if isinstance(zaak.zaaktype, str):
+            zaak.zaaktype = fetch_zaaktype(zaak.zaaktype)
+        return zaak
 
-        if isinstance(zaak["zaaktype"], str):
-            zrc_client = _client_from_url(zaak["zaaktype"])
-            zaaktype = zrc_client.retrieve("zaaktype", url=zaak["zaaktype"])
-            zaak["zaaktype"] = factory(ZaakType, zaaktype)
+    def handle_coalesced(self, messages: List[dict]) -> None:
+        """
+        Handle a burst of notifications about the same zaak at once.
+
+        Duplicate deliveries are dropped, the zaak is retrieved once and every aspect
+        of the zaak that changed is refreshed once.
+        """
+        zaak_url = messages[0]["hoofd_object"]
+        # resource -> actie -> resource URLs, without duplicates
+        changes = defaultdict(lambda: defaultdict(dict))
+        for message in messages:
+            actie = (
+                "update" if message["actie"] == "partial_update" else message["actie"]
+            )
+            changes[message["resource"]][actie][message["resource_url"]] = None
+
+        if "destroy" in changes["zaak"]:
+            self._handle_zaak_destroy(zaak_url)
+            return
 
-        zaak = factory(Zaak, zaak)
-        if zaak.status and isinstance(zaak.status, str):
-            zrc_client = _client_from_url(zaak.status)
-            status = zrc_client.retrieve("status", url=zaak.status)
-            zaak.status = factory(Status, status)
+        zaak = self._retrieve_zaak(zaak_url)
+        # send all the updates of the zaak document in one bulk request
+        with bulk_zaak_document_updates():
+            if "create" in changes["zaak"]:
+                self._create_zaak_document(zaak)
 
-        return zaak
+            if "update" in changes["zaak"]:
+                self._update_zaak(zaak)
+
+            if "create" in changes["status"]:
+                update_status_in_zaak_document(zaak)
+
+            if "create" in changes["resultaat"]:
+                update_resultaat_in_zaak_document(zaak)
+
+            if "create" in changes["rol"] or "destroy" in changes["rol"]:
+                self._update_rollen(zaak, created=list(changes["rol"]["create"]))
+
+            if changes["zaakeigenschap"]:
+                update_eigenschappen_in_zaak_document(zaak)
+
+            if "create" in changes["zaakobject"] or "destroy" in changes["zaakobject"]:
+                self._update_zaakobjecten(
+                    zaak,
+                    created=list(changes["zaakobject"]["create"]),
+                    destroyed=list(changes["zaakobject"]["destroy"]),
+                )
+
+            if (
+                "create" in changes["zaakinformatieobject"]
+                or "destroy" in changes["zaakinformatieobject"]
+            ):
+                self._update_zaakinformatieobjecten(
+                    zaak,
+                    created=list(changes["zaakinformatieobject"]["create"]),
+                    destroyed=list(changes["zaakinformatieobject"]["destroy"]),
+                )
+
+        # only invalidate once the bulk request is sent, a zaak read in between would
+        # be cached from the old zaak document otherwise
+        if (
+            "update" in changes["zaak"]
+            or "create" in changes["resultaat"]
+            or "create" in changes["status"]
+            or changes["zaakeigenschap"]
+        ):
+            invalidate_zaak_cache(zaak)
 
     def _handle_zaak_update(self, zaak_url: str):
-        # Invalidate cache
         zaak = self._retrieve_zaak(zaak_url)
+        self._update_zaak(zaak)
+        # Invalidate cache
         invalidate_zaak_cache(zaak)
 
+    def _update_zaak(self, zaak: Zaak):
         # Determine if einddatum is updated.
         if is_closed := zaak.einddatum:
-            zaak_document = get_zaak_document(zaak_url)
+            zaak_document = get_zaak_document(zaak.url)
             was_closed = None if not zaak_document else zaak_document.einddatum
 
             def _lock_review_request(rr: ReviewRequest):
@@ -161,16 +236,22 @@ class ZakenHandler:
             logger.warning("Could not find informatieobjecten index.")
 
     def _handle_zaak_create(self, zaak_url: str):
-        client = _client_from_url(zaak_url)
         zaak = self._retrieve_zaak(zaak_url)
+        self._create_zaak_document(zaak)
+
+    def _create_zaak_document(self, zaak: Zaak):
+        client = _client_from_url(zaak.url)
         invalidate_zaak_list_cache(client, zaak)
         # index in ES
         zaak_document = create_zaak_document(zaak)
         zaak_document.zaaktype = create_zaaktype_document(zaak.zaaktype)
         if zaak.status:
+            if isinstance(zaak.status, str):
+                zaak.status = get_status(zaak)
             zaak_document.status = create_status_document(zaak.status)
+        zaak_document.read_model_version = READ_MODEL_VERSION
 
-        zaak_document.save()
+        zaak_document.save(refresh=get_refresh(settings.ES_INDEX_ZAKEN))
 
     def _handle_zaak_destroy(self, zaak_url: str):
         Activity.objects.filter(zaak=zaak_url).delete()
@@ -182,105 +263,119 @@ class ZakenHandler:
 
     def _handle_related_create(self, zaak_url: str):
         zaak = self._retrieve_zaak(zaak_url)
+
+        # index in ES
+        update_resultaat_in_zaak_document(zaak)
         invalidate_zaak_cache(zaak)
 
     def _handle_status_create(self, zaak_url: str):
         zaak = self._retrieve_zaak(zaak_url)
-        invalidate_zaak_cache(zaak)
 
         # index in ES
         update_status_in_zaak_document(zaak)
+        invalidate_zaak_cache(zaak)
 
     def _handle_rol_create(self, zaak_url: str, rol_url: str):
         zaak = self._retrieve_zaak(zaak_url)
-        invalidate_rollen_cache(zaak, rol_urls=[rol_url])
-        updated = update_medewerker_identificatie_rol(rol_url)
-
-        rol = fetch_rol(rol_url=rol_url)
-        if not updated and (
-            rol.omschrijving_generiek.lower() == RolOmschrijving.behandelaar.lower()
-        ):
-            add_permission_for_behandelaar(rol_url)
-
-        update_rollen_in_zaak_document(zaak)
+        self._update_rollen(zaak, created=[rol_url])
 
     def _handle_rol_destroy(self, zaak_url: str):
         zaak = self._retrieve_zaak(zaak_url)
-        invalidate_rollen_cache(zaak)
+        self._update_rollen(zaak)
+
+    def _update_rollen(self, zaak: Zaak, created: List[str] = None):
+        invalidate_rollen_cache(zaak, rol_urls=created)
+        for rol_url in created or []:
+            updated = update_medewerker_identificatie_rol(rol_url)
+
+            rol = fetch_rol(rol_url=rol_url)
+            if not updated and (
+                rol.omschrijving_generiek.lower() == RolOmschrijving.behandelaar.lower()
+            ):
+                add_permission_for_behandelaar(rol_url)
 
         # index in ES
         update_rollen_in_zaak_document(zaak)
 
     def _handle_zaakeigenschap_change(self, zaak_url: str):
         zaak = self._retrieve_zaak(zaak_url)
-        invalidate_zaak_cache(zaak)
 
         # index in ES
         update_eigenschappen_in_zaak_document(zaak)
+        invalidate_zaak_cache(zaak)
 
     def _handle_zaakobject_create(self, zaak_url: str, zaakobject_url: str):
-        # Invalidate zaakobjecten cache with zaak
         zaak = self._retrieve_zaak(zaak_url)
-        invalidate_zaakobjecten_cache(zaak)
-
-        # index in zaken
-        update_zaakobjecten_in_zaak_document(zaak)
-
-        # index in objecten
-        zaakobject = fetch_zaak_object(zaakobject_url)
-        update_related_zaken_in_object_document(zaakobject.object)
+        self._update_zaakobjecten(zaak, created=[zaakobject_url])
 
     def _handle_zaakobject_destroy(self, zaak_url: str, zaakobject_url: str):
-        # Invalidate zaakobjecten cache with zaak
         zaak = self._retrieve_zaak(zaak_url)
+        self._update_zaakobjecten(zaak, destroyed=[zaakobject_url])
+
+    def _update_zaakobjecten(
+        self, zaak: Zaak, created: List[str] = None, destroyed: List[str] = None
+    ):
+        # Invalidate zaakobjecten cache with zaak
         invalidate_zaakobjecten_cache(zaak)
 
-        # Get zaakobject from ZaakDocument
-        zaakdocument = ZaakDocument.get(id=zaak.uuid)
-        object_url = None
-        for zo in zaakdocument.zaakobjecten:
-            if zo.url == zaakobject_url:
-                object_url = zo.object
+        # Get the objecten of the destroyed zaakobjecten from ZaakDocument
+        object_urls = []
+        if destroyed:
+            zaakdocument = ZaakDocument.get(id=zaak.uuid)
+            object_urls += [
+                zo.object for zo in zaakdocument.zaakobjecten if zo.url in destroyed
+            ]
 
         # update zaken index
         update_zaakobjecten_in_zaak_document(zaak)
 
+        object_urls += [
+            fetch_zaak_object(zaakobject_url).object for zaakobject_url in created or []
+        ]
+
         # update related_zaken in objecten index
-        update_related_zaken_in_object_document(object_url)
+        for object_url in dict.fromkeys(object_urls):
+            update_related_zaken_in_object_document(object_url)
 
     def _handle_zaakinformatieobject_create(
         self, zaak_url: str, zaakinformatieobject_url: str
     ):
         zaak = self._retrieve_zaak(zaak_url)
-        # No need to invalidate cache as zaakinformatieobjecten aren't cached?
-
-        # update zaken index
-        update_zaakinformatieobjecten_in_zaak_document(zaak)
-
-        # update related_zaken in informatieobjecten index
-        zaakinformatieobject = fetch_zaak_informatieobject(zaakinformatieobject_url)
-        update_related_zaken_in_informatieobject_document(
-            zaakinformatieobject.informatieobject
-        )
+        self._update_zaakinformatieobjecten(zaak, created=[zaakinformatieobject_url])
 
     def _handle_zaakinformatieobject_destroy(
         self, zaak_url: str, zaakinformatieobject_url: str
     ):
         zaak = self._retrieve_zaak(zaak_url)
+        self._update_zaakinformatieobjecten(zaak, destroyed=[zaakinformatieobject_url])
+
+    def _update_zaakinformatieobjecten(
+        self, zaak: Zaak, created: List[str] = None, destroyed: List[str] = None
+    ):
         # No need to invalidate cache as zaakinformatieobjecten aren't cached?
 
-        # Get zaakobject from ZaakDocument
-        zaakdocument = ZaakDocument.get(id=zaak.uuid)
-        informatieobject_url = None
-        for zio in zaakdocument.zaakinformatieobjecten:
-            if zio.url == zaakinformatieobject_url:
-                informatieobject_url = zio.informatieobject
+        # Get the informatieobjecten of the destroyed zaakinformatieobjecten from
+        # ZaakDocument
+        informatieobject_urls = []
+        if destroyed:
+            zaakdocument = ZaakDocument.get(id=zaak.uuid)
+            informatieobject_urls += [
+                zio.informatieobject
+                for zio in zaakdocument.zaakinformatieobjecten
+                if zio.url in destroyed
+            ]
 
         # update zaken index
         update_zaakinformatieobjecten_in_zaak_document(zaak)
 
+        informatieobject_urls += [
+            fetch_zaak_informatieobject(zio_url).informatieobject
+            for zio_url in created or []
+        ]
+
         # update related_zaken in informatieobjecten index
-        update_related_zaken_in_informatieobject_document(informatieobject_url)
+        for informatieobject_url in dict.fromkeys(informatieobject_urls):
+            update_related_zaken_in_informatieobject_document(informatieobject_url)
 
 
 class ZaaktypenHandler:
@@ -341,6 +436,17 @@ class RoutingHandler:
         elif self.default:
             self.default.handle(message)
 
+    def handle_coalesced(self, messages: List[dict]) -> None:
+        """
+        Handle notifications about the same main object of the same channel at once.
+        """
+        handler = self.config.get(messages[0]["kanaal"])
+        if hasattr(handler, "handle_coalesced"):
+            handler.handle_coalesced(messages)
+        else:
+            for message in messages:
+                self.handle(message)
+
 
 handler = RoutingHandler(
     {
@@ -0,0 +1,113 @@
+import time
+from typing import List
+
+from django.core.management import BaseCommand
+from django.db import close_old_connections
+
+from zgw_consumers.concurrent import parallel
+
+from zac.elasticsearch.management.metrics import IndexMetrics
+
+from ...constants import QueuedNotificationStatus
+from ...models import QueuedNotification
+from ...queue import (
+    MAX_ATTEMPTS,
+    claim_notifications,
+    get_queue_stats,
+    process_notifications,
+)
+
+
+class Command(BaseCommand):
+    help = "Process the queued notifications with a pool of workers."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Number of notifications that are handled concurrently. Defaults to 4.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=50,
+            help="Number of notifications claimed from the queue at once. Defaults to 50.",
+        )
+        parser.add_argument(
+            "--max-attempts",
+            type=int,
+            default=MAX_ATTEMPTS,
+            help=f"Number of attempts before a notification is marked as failed. Defaults to {MAX_ATTEMPTS}.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="Seconds to wait before polling an empty queue again. Defaults to 1.",
+        )
+        parser.add_argument(
+            "--report-interval",
+            type=int,
+            default=60,
+            help="Print the queue metrics every REPORT_INTERVAL seconds. Defaults to 60.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit as soon as there are no notifications left that are due.",
+        )
+
+    def handle(self, **options):
+        self.max_attempts = options["max_attempts"]
+        self.metrics = IndexMetrics(report_interval=options["report_interval"])
+
+        try:
+            with parallel(max_workers=options["workers"]) as executor:
+                while True:
+                    # the command runs for a long time - drop the connection of the
+                    # polling thread when it's broken or past CONN_MAX_AGE, like a
+                    # request would. The workers close theirs after every task.
+                    close_old_connections()
+                    groups = claim_notifications(options["batch_size"])
+                    if groups:
+                        list(executor.map(self.process, groups))
+                    elif options["once"]:
+                        break
+                    else:
+                        time.sleep(options["poll_interval"])
+
+                    if self.metrics.report_due():
+                        self.report()
+        except KeyboardInterrupt:
+            # claimed notifications that weren't handled are picked up again after
+            # their lease expired
+            self.stdout.write("Stopping...")
+
+        self.report()
+
+    def process(self, notifications: List[QueuedNotification]) -> None:
+        message = notifications[0].message
+        resource = message.get("resource") if len(notifications) == 1 else "coalesced"
+        with self.metrics.stage(
+            f"{message.get('kanaal')}.{resource}", items=len(notifications)
+        ):
+            handled = process_notifications(notifications, self.max_attempts)
+
+        if len(notifications) > 1:
+            self.metrics.increment("coalesced", len(notifications))
+        if handled:
+            self.metrics.increment("handled", len(notifications))
+        elif notifications[0].status == QueuedNotificationStatus.failed:
+            self.metrics.increment("dead_lettered", len(notifications))
+        else:
+            self.metrics.increment("retried", len(notifications))
+
+    def report(self) -> None:
+        self.stdout.write(self.metrics.format_table())
+        stats = get_queue_stats()
+        self.stdout.write(
+            "Queue: {pending} pending, {failed} failed, lag {lag_seconds}s".format(
+                **stats
+            )
+        )
@@ -0,0 +1,127 @@
+import logging
+import time
+from concurrent.futures import wait
+
+from django.core.management import BaseCommand, CommandError
+
+from zgw_consumers.concurrent import parallel
+
+from zac.elasticsearch.management.metrics import IndexMetrics
+
+from ...handlers import handler
+from ...replay import count_requests, get_live_targets, read_notifications
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Replay captured notifications through the notification handlers and report "
+        "the handler latencies, upstream API calls and ES writes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "file",
+            help="JSON lines file with the notifications, see NOTIFICATIONS_CAPTURE_FILE.",
+        )
+        parser.add_argument(
+            "--rate",
+            type=float,
+            help=(
+                "Number of notifications replayed per second. Defaults to the "
+                "timing of the capture, scaled with --speed."
+            ),
+        )
+        parser.add_argument(
+            "--speed",
+            type=float,
+            default=1.0,
+            help="Speed up factor of the captured timing. Defaults to 1.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Number of notifications that are handled concurrently. Defaults to 4.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=1,
+            help="Number of times the file is replayed. Defaults to 1.",
+        )
+        parser.add_argument(
+            "--report-interval",
+            type=int,
+            help="Print the metrics every REPORT_INTERVAL seconds.",
+        )
+        parser.add_argument(
+            "--metrics-report",
+            help="Write the metrics as JSON to this file.",
+        )
+        parser.add_argument(
+            "--against-live-services",
+            action="store_true",
+            help=(
+                "Replay even though ES, the ZGW API services or the database are not "
+                "on the local machine."
+            ),
+        )
+
+    def handle(self, **options):
+        live_targets = get_live_targets()
+        if live_targets and not options["against_live_services"]:
+            raise CommandError(
+                "Replaying notifications writes to ES and deletes database rows, but "
+                f"these targets aren't local stand-ins: {', '.join(live_targets)}. "
+                "Pass --against-live-services to replay against them anyway."
+            )
+
+        self.metrics = IndexMetrics(report_interval=options["report_interval"])
+
+        with count_requests(self.metrics), parallel(
+            max_workers=options["workers"]
+        ) as executor:
+            futures = []
+            for _ in range(options["repeat"]):
+                for delay, message in self.schedule(options):
+                    if delay > 0:
+                        time.sleep(delay)
+                    futures.append(executor.submit(self.replay, message))
+
+                    if self.metrics.report_due():
+                        self.stdout.write(self.metrics.format_table())
+            wait(futures)
+
+        self.stdout.write(self.metrics.format_table())
+        if options["metrics_report"]:
+            self.metrics.write_report(options["metrics_report"])
+
+    def schedule(self, options):
+        """
+        Yield the notifications with the time to wait before sending them.
+        """
+        start = time.monotonic()
+        first_received = None
+        for i, (received, message) in enumerate(read_notifications(options["file"])):
+            if options["rate"]:
+                offset = i / options["rate"]
+            elif received is not None:
+                if first_received is None:
+                    first_received = received
+                offset = (received - first_received) / options["speed"]
+            else:
+                offset = 0
+            yield offset - (time.monotonic() - start), message
+
+    def replay(self, message: dict) -> None:
+        name = f"{message['kanaal']}.{message['resource']}.{message['actie']}"
+        try:
+            with self.metrics.stage(name, items=1):
+                handler.handle(message)
+        except Exception:
+            logger.warning("Replaying notification %r failed.", message, exc_info=True)
+            self.metrics.increment("failed")
+        else:
+            self.metrics.increment("handled")
@@ -0,0 +1,24 @@
+# Generated by Django 3.2.12 on 2026-10-19 02:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0003_queuednotification"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="queuednotification",
+            name="coalesce_key",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                help_text="Notifications with the same key are handled together.",
+                max_length=1000,
+                verbose_name="coalesce key",
+            ),
+        ),
+    ]
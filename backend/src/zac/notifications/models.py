@@ -1,6 +1,11 @@
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.db.models import JSONField
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from .constants import QueuedNotificationStatus
+
 
 class Subscription(models.Model):
     url = models.URLField()
@@ -12,3 +17,45 @@ class Subscription(models.Model):
 
     def __str__(self):
         return self.url
+
+
+class QueuedNotification(models.Model):
+    """
+    A received notification that still needs to be handled.
+
+    Notifications are removed from the queue once they're handled. Notifications
+    that keep failing end up with the ``failed`` status (the dead letters) and can
+    be re-queued from the admin.
+    """
+
+    message = JSONField(_("message"), encoder=DjangoJSONEncoder)
+    status = models.CharField(
+        _("status"),
+        max_length=50,
+        choices=QueuedNotificationStatus.choices,
+        default=QueuedNotificationStatus.pending,
+    )
+    coalesce_key = models.CharField(
+        _("coalesce key"),
+        max_length=1000,
+        blank=True,
+        db_index=True,
+        help_text=_("Notifications with the same key are handled together."),
+    )
+    attempts = models.PositiveIntegerField(_("attempts"), default=0)
+    available_at = models.DateTimeField(
+        _("available at"),
+        default=timezone.now,
+        help_text=_("The notification is not (re)tried before this moment."),
+    )
+    last_error = models.TextField(_("last error"), blank=True)
+    created = models.DateTimeField(_("created"), auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("queued notification")
+        verbose_name_plural = _("queued notifications")
+        indexes = [models.Index(fields=["status", "available_at"])]
+
+    def __str__(self):
+        message = self.message
+        return f"{message.get('kanaal')} {message.get('resource')} {message.get('actie')}: {message.get('resource_url')}"
@@ -0,0 +1,151 @@
+"""
+Durable queue for the received notifications.
+
+The webhook only stores the notification, the (expensive) handling is done by the
+``process_notifications`` worker(s). Rows are claimed with ``SELECT ... FOR UPDATE
+SKIP LOCKED``, so any number of workers can process the queue concurrently.
+"""
+import logging
+import traceback
+from collections import defaultdict
+from datetime import timedelta
+from typing import List
+
+from django.db import transaction
+from django.db.models import Count, F, Min
+from django.utils import timezone
+
+from .constants import QueuedNotificationStatus
+from .handlers import handler
+from .models import QueuedNotification
+
+logger = logging.getLogger(__name__)
+
+# A claimed notification is handed out again if it's not handled within this time,
+# so notifications of a worker that died are not lost.
+LEASE_TIMEOUT = timedelta(minutes=5)
+
+MAX_ATTEMPTS = 5
+
+# Notifications about the same zaak received within this window are handled at once.
+COALESCE_WINDOW = timedelta(seconds=2)
+
+RETRY_DELAY = timedelta(seconds=10)
+MAX_RETRY_DELAY = timedelta(hours=1)
+
+
+def get_coalesce_key(data: dict) -> str:
+    # notifications about (the related objects of) a zaak are handled together
+    return data["hoofd_object"] if data["kanaal"] == "zaken" else ""
+
+
+def enqueue_notification(data: dict) -> QueuedNotification:
+    coalesce_key = get_coalesce_key(data)
+    return QueuedNotification.objects.create(
+        message=data,
+        coalesce_key=coalesce_key,
+        # give the rest of a burst of notifications the chance to arrive
+        available_at=timezone.now()
+        + (COALESCE_WINDOW if coalesce_key else timedelta()),
+    )
+
+
+def claim_notifications(batch_size: int) -> List[List[QueuedNotification]]:
+    """
+    Claim the next batch of notifications that are due, in order of arrival.
+
+    The notifications are grouped by their coalesce key. Notifications with the same
+    key that haven't been tried yet are claimed along, even if they're not due yet.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        notifications = list(
+            QueuedNotification.objects.select_for_update(skip_locked=True)
+            .filter(status=QueuedNotificationStatus.pending, available_at__lte=now)
+            .order_by("pk")[:batch_size]
+        )
+        if coalesce_keys := {n.coalesce_key for n in notifications if n.coalesce_key}:
+            notifications += list(
+                QueuedNotification.objects.select_for_update(skip_locked=True)
+                .filter(
+                    status=QueuedNotificationStatus.pending,
+                    coalesce_key__in=coalesce_keys,
+                    attempts=0,
+                    available_at__gt=now,
+                )
+                .order_by("pk")
+            )
+        QueuedNotification.objects.filter(
+            pk__in=[notification.pk for notification in notifications]
+        ).update(attempts=F("attempts") + 1, available_at=now + LEASE_TIMEOUT)
+
+    groups = defaultdict(list)
+    for notification in sorted(notifications, key=lambda n: n.pk):
+        notification.attempts += 1
+        groups[notification.coalesce_key or notification.pk].append(notification)
+    return list(groups.values())
+
+
+def get_retry_delay(attempts: int) -> timedelta:
+    return min(RETRY_DELAY * 2 ** (attempts - 1), MAX_RETRY_DELAY)
+
+
+def process_notifications(
+    notifications: List[QueuedNotification], max_attempts: int = MAX_ATTEMPTS
+) -> bool:
+    """
+    Handle a group of claimed notifications.
+
+    On success the notifications are removed from the queue. On failure they're
+    retried with an exponential backoff, until they've failed ``max_attempts`` times.
+    """
+    messages = [notification.message for notification in notifications]
+    try:
+        if len(messages) == 1:
+            handler.handle(messages[0])
+        else:
+            handler.handle_coalesced(messages)
+    except Exception:
+        logger.warning(
+            "Handling notification(s) %s failed.",
+            ", ".join(str(notification.pk) for notification in notifications),
+            exc_info=True,
+        )
+        last_error = traceback.format_exc()
+        for notification in notifications:
+            notification.last_error = last_error
+            if notification.attempts >= max_attempts:
+                notification.status = QueuedNotificationStatus.failed
+            else:
+                notification.available_at = timezone.now() + get_retry_delay(
+                    notification.attempts
+                )
+            notification.save(update_fields=["status", "available_at", "last_error"])
+        return False
+
+    QueuedNotification.objects.filter(
+        pk__in=[notification.pk for notification in notifications]
+    ).delete()
+    return True
+
+
+def requeue_notifications(queryset) -> int:
+    return queryset.update(
+        status=QueuedNotificationStatus.pending,
+        attempts=0,
+        available_at=timezone.now(),
+    )
+
+
+def get_queue_stats() -> dict:
+    stats = {status: 0 for status in QueuedNotificationStatus.values}
+    for row in QueuedNotification.objects.values("status").annotate(count=Count("pk")):
+        stats[row["status"]] = row["count"]
+
+    oldest = QueuedNotification.objects.filter(
+        status=QueuedNotificationStatus.pending
+    ).aggregate(oldest=Min("created"))["oldest"]
+    stats["lag_seconds"] = (
+        round((timezone.now() - oldest).total_seconds(), 1) if oldest else 0
+    )
+    return stats
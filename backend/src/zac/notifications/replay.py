@@ -0,0 +1,116 @@
+"""
+Capture and replay notifications to benchmark the notification handling.
+
+Received notifications are appended to ``NOTIFICATIONS_CAPTURE_FILE`` as JSON lines,
+which the ``replay_notifications`` command sends through the handlers again. Point
+the ZGW API services, ``ES_HOST`` and the database to local stand-ins before
+replaying - the handlers write to the index and delete database rows.
+"""
+import ipaddress
+import json
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+import requests
+from dateutil.parser import parse
+from elasticsearch.transport import Transport
+from zgw_consumers.models import Service
+
+from zac.elasticsearch.management.metrics import IndexMetrics
+
+_capture_lock = threading.Lock()
+
+ES_READ_ENDPOINTS = ("_search", "_msearch", "_mget", "_count")
+
+
+def capture_notification(data: dict, path: str) -> None:
+    line = json.dumps(
+        {"received": timezone.now(), "notification": data}, cls=DjangoJSONEncoder
+    )
+    with _capture_lock:
+        with open(path, "a") as outfile:
+            outfile.write(f"{line}\n")
+
+
+def read_notifications(path: str) -> Iterator[Tuple[Optional[float], dict]]:
+    """
+    Yield the captured notifications with the time they were received (as a
+    timestamp).
+
+    Lines with a bare notification payload are accepted too, they're yielded without
+    a receive time.
+    """
+    with open(path) as infile:
+        for line in infile:
+            if not line.strip():
+                continue
+            data = json.loads(line)
+            if "notification" not in data:
+                yield None, data
+                continue
+            yield parse(data["received"]).timestamp(), data["notification"]
+
+
+def is_local_host(host: str) -> bool:
+    """
+    Check if the host (a URL or ``host:port``) is the local machine.
+    """
+    hostname = urlparse(host if "//" in host else f"//{host}").hostname
+    # no host means a unix socket for the database
+    if not hostname or hostname == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(hostname).is_loopback
+    except ValueError:
+        return False
+
+
+def get_live_targets() -> List[str]:
+    """
+    Return the ES hosts, ZGW API services and database that aren't local stand-ins.
+    """
+    targets = []
+    for connection in settings.ELASTICSEARCH_DSL.values():
+        hosts = connection["hosts"]
+        targets += [hosts] if isinstance(hosts, str) else hosts
+    targets += Service.objects.values_list("api_root", flat=True)
+    targets.append(settings.DATABASES["default"].get("HOST") or "")
+    return [target for target in targets if not is_local_host(target)]
+
+
+def is_es_write(method: str, url: str) -> bool:
+    if method in ("GET", "HEAD"):
+        return False
+    return not url.rstrip("/").endswith(ES_READ_ENDPOINTS)
+
+
+@contextmanager
+def count_requests(metrics: IndexMetrics) -> Iterator[None]:
+    """
+    Count the upstream API calls (per host) and the ES reads and writes.
+    """
+    send = requests.Session.send
+    perform_request = Transport.perform_request
+
+    def counting_send(session, request, **kwargs):
+        metrics.increment(f"upstream.{urlparse(request.url).netloc}")
+        return send(session, request, **kwargs)
+
+    def counting_perform_request(transport, method, url, *args, **kwargs):
+        kind = "writes" if is_es_write(method, url) else "reads"
+        metrics.increment(f"es.{kind}")
+        return perform_request(transport, method, url, *args, **kwargs)
+
+    requests.Session.send = counting_send
+    Transport.perform_request = counting_perform_request
+    try:
+        yield
+    finally:
+        requests.Session.send = send
+        Transport.perform_request = perform_request
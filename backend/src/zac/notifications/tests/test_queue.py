@@ -0,0 +1,266 @@
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.timezone import utc
+
+from freezegun import freeze_time
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from zac.accounts.tests.factories import UserFactory
+
+from ..constants import QueuedNotificationStatus
+from ..handlers import handler
+from ..models import QueuedNotification
+from ..queue import (
+    COALESCE_WINDOW,
+    claim_notifications,
+    enqueue_notification,
+    get_queue_stats,
+    requeue_notifications,
+)
+from .utils import BRONORGANISATIE, ZAAK, ZAAKTYPE, ZAKEN_ROOT
+
+NOTIFICATION = {
+    "kanaal": "zaken",
+    "hoofdObject": ZAAK,
+    "resource": "status",
+    "resourceUrl": f"{ZAAK}/statussen/1",
+    "actie": "create",
+    "aanmaakdatum": timezone.now().isoformat(),
+    "kenmerken": {
+        "bronorganisatie": BRONORGANISATIE,
+        "zaaktype": ZAAKTYPE,
+        "vertrouwelijkheidaanduiding": "geheim",
+    },
+}
+
+MESSAGE = {
+    "kanaal": "zaken",
+    "hoofd_object": ZAAK,
+    "resource": "status",
+    "resource_url": f"{ZAAK}/statussen/1",
+    "actie": "create",
+}
+
+
+@override_settings(NOTIFICATIONS_QUEUE=True)
+class NotificationCallbackQueueTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory.create(username="notifs")
+
+    def setUp(self):
+        super().setUp()
+
+        self.client.force_authenticate(user=self.user)
+
+    @patch("zac.notifications.views.handler.handle")
+    def test_notification_is_queued(self, mock_handle):
+        path = reverse("notifications:callback")
+
+        response = self.client.post(path, NOTIFICATION)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        mock_handle.assert_not_called()
+        notification = QueuedNotification.objects.get()
+        self.assertEqual(notification.status, QueuedNotificationStatus.pending)
+        self.assertEqual(notification.message["hoofd_object"], ZAAK)
+        self.assertEqual(notification.message["resource"], "status")
+        self.assertEqual(notification.coalesce_key, ZAAK)
+
+
+class ProcessNotificationsTests(TransactionTestCase):
+    @patch("zac.notifications.queue.handler.handle")
+    def test_process_notifications(self, mock_handle):
+        QueuedNotification.objects.create(message=MESSAGE)
+        QueuedNotification.objects.create(message={**MESSAGE, "actie": "update"})
+
+        call_command("process_notifications", once=True, stdout=StringIO())
+
+        self.assertEqual(mock_handle.call_count, 2)
+        self.assertFalse(QueuedNotification.objects.exists())
+
+    @patch("zac.notifications.queue.handler.handle")
+    @patch(
+        "zac.notifications.management.commands.process_notifications"
+        ".close_old_connections"
+    )
+    def test_old_connections_closed_every_poll(
+        self, mock_close_old_connections, mock_handle
+    ):
+        QueuedNotification.objects.create(message=MESSAGE)
+
+        call_command("process_notifications", once=True, stdout=StringIO())
+
+        # one poll that claims the notification, one that finds the queue empty
+        self.assertEqual(mock_close_old_connections.call_count, 2)
+
+    @patch("zac.notifications.queue.handler.handle_coalesced")
+    def test_process_coalesced_notifications(self, mock_handle_coalesced):
+        QueuedNotification.objects.create(message=MESSAGE, coalesce_key=ZAAK)
+        QueuedNotification.objects.create(
+            message={**MESSAGE, "resource": "rol"}, coalesce_key=ZAAK
+        )
+
+        call_command("process_notifications", once=True, stdout=StringIO())
+
+        mock_handle_coalesced.assert_called_once_with(
+            [MESSAGE, {**MESSAGE, "resource": "rol"}]
+        )
+        self.assertFalse(QueuedNotification.objects.exists())
+
+    @patch("zac.notifications.queue.handler.handle", side_effect=Exception("boom"))
+    def test_failing_notification_is_retried(self, mock_handle):
+        notification = QueuedNotification.objects.create(
+            message=MESSAGE, available_at=datetime(2022, 8, 1, 11, 0, tzinfo=utc)
+        )
+
+        with freeze_time("2022-08-01T12:00:00Z"):
+            call_command("process_notifications", once=True, stdout=StringIO())
+
+        notification.refresh_from_db()
+        self.assertEqual(notification.status, QueuedNotificationStatus.pending)
+        self.assertEqual(notification.attempts, 1)
+        self.assertEqual(
+            notification.available_at,
+            datetime(2022, 8, 1, 12, 0, 10, tzinfo=utc),
+        )
+        self.assertIn("boom", notification.last_error)
+
+    @patch("zac.notifications.queue.handler.handle", side_effect=Exception("boom"))
+    def test_notification_is_dead_lettered(self, mock_handle):
+        notification = QueuedNotification.objects.create(message=MESSAGE, attempts=2)
+
+        call_command(
+            "process_notifications", once=True, max_attempts=3, stdout=StringIO()
+        )
+
+        notification.refresh_from_db()
+        self.assertEqual(notification.status, QueuedNotificationStatus.failed)
+        self.assertEqual(notification.attempts, 3)
+        self.assertEqual(get_queue_stats()["failed"], 1)
+
+        requeue_notifications(QueuedNotification.objects.all())
+
+        notification.refresh_from_db()
+        self.assertEqual(notification.status, QueuedNotificationStatus.pending)
+        self.assertEqual(notification.attempts, 0)
+
+    def test_claimed_notifications_are_leased(self):
+        QueuedNotification.objects.create(message=MESSAGE)
+
+        self.assertEqual(len(claim_notifications(10)), 1)
+        self.assertEqual(claim_notifications(10), [])
+
+        with freeze_time(timezone.now() + timedelta(minutes=6)):
+            claimed = claim_notifications(10)
+
+        self.assertEqual(len(claimed), 1)
+        self.assertEqual(claimed[0][0].attempts, 2)
+
+    def test_claim_coalesces_notifications_per_zaak(self):
+        other_zaak = f"{ZAKEN_ROOT}zaken/0c79c41d-72ef-4ea2-8c4c-03c9945da2a2"
+        first = enqueue_notification(MESSAGE)
+        other = enqueue_notification({**MESSAGE, "hoofd_object": other_zaak})
+        objecten = enqueue_notification({**MESSAGE, "kanaal": "objecten"})
+
+        # nothing is due within the coalesce window, except for other channels
+        self.assertEqual(claim_notifications(10), [[objecten]])
+
+        with freeze_time(timezone.now() + COALESCE_WINDOW):
+            rol = enqueue_notification({**MESSAGE, "resource": "rol"})
+            claimed = claim_notifications(1)
+
+        # the notifications about the same zaak are claimed along
+        self.assertEqual(claimed, [[first, rol]])
+        self.assertEqual(QueuedNotification.objects.get(pk=other.pk).attempts, 0)
+
+
+@patch("zac.notifications.handlers.update_eigenschappen_in_zaak_document")
+@patch("zac.notifications.handlers.update_rollen_in_zaak_document")
+@patch("zac.notifications.handlers.update_status_in_zaak_document")
+@patch("zac.notifications.handlers.add_permission_for_behandelaar")
+@patch("zac.notifications.handlers.fetch_rol")
+@patch(
+    "zac.notifications.handlers.update_medewerker_identificatie_rol",
+    return_value=True,
+)
+@patch("zac.notifications.handlers.invalidate_rollen_cache")
+@patch("zac.notifications.handlers.invalidate_zaak_cache")
+@patch("zac.notifications.handlers.ZakenHandler._retrieve_zaak")
+class ZakenHandlerCoalescedTests(SimpleTestCase):
+    def test_burst_is_handled_at_once(
+        self,
+        mock_retrieve_zaak,
+        mock_invalidate_zaak_cache,
+        mock_invalidate_rollen_cache,
+        mock_update_medewerker,
+        mock_fetch_rol,
+        mock_add_permission,
+        mock_update_status,
+        mock_update_rollen,
+        mock_update_eigenschappen,
+    ):
+        rol_1 = {**MESSAGE, "resource": "rol", "resource_url": f"{ZAAK}/rollen/1"}
+        rol_2 = {**MESSAGE, "resource": "rol", "resource_url": f"{ZAAK}/rollen/2"}
+        eigenschap = {
+            **MESSAGE,
+            "resource": "zaakeigenschap",
+            "resource_url": f"{ZAAK}/zaakeigenschappen/1",
+            "actie": "update",
+        }
+
+        # rol_1 is delivered twice
+        handler.handle_coalesced([rol_1, MESSAGE, rol_1, eigenschap, rol_2])
+
+        zaak = mock_retrieve_zaak.return_value
+        mock_retrieve_zaak.assert_called_once_with(ZAAK)
+        mock_invalidate_zaak_cache.assert_called_once_with(zaak)
+        mock_invalidate_rollen_cache.assert_called_once_with(
+            zaak, rol_urls=[rol_1["resource_url"], rol_2["resource_url"]]
+        )
+        self.assertEqual(mock_update_medewerker.call_count, 2)
+        mock_update_status.assert_called_once_with(zaak)
+        mock_update_rollen.assert_called_once_with(zaak)
+        mock_update_eigenschappen.assert_called_once_with(zaak)
+
+    def test_zaak_cache_is_invalidated_after_the_bulk_request(
+        self, mock_retrieve_zaak, mock_invalidate_zaak_cache, *mocks
+    ):
+        calls = []
+
+        @contextmanager
+        def bulk_zaak_document_updates():
+            yield
+            calls.append("bulk")
+
+        mock_invalidate_zaak_cache.side_effect = lambda zaak: calls.append("invalidate")
+
+        with patch(
+            "zac.notifications.handlers.bulk_zaak_document_updates",
+            bulk_zaak_document_updates,
+        ):
+            handler.handle_coalesced([MESSAGE, MESSAGE])
+
+        self.assertEqual(calls, ["bulk", "invalidate"])
+
+    @patch("zac.notifications.handlers.ZakenHandler._handle_zaak_destroy")
+    def test_destroyed_zaak_is_not_refreshed(
+        self, mock_handle_zaak_destroy, mock_retrieve_zaak, *mocks
+    ):
+        handler.handle_coalesced(
+            [
+                {**MESSAGE, "resource": "rol"},
+                {**MESSAGE, "resource": "zaak", "actie": "destroy"},
+            ]
+        )
+
+        mock_handle_zaak_destroy.assert_called_once_with(ZAAK)
+        mock_retrieve_zaak.assert_not_called()
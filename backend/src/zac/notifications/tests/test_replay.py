@@ -0,0 +1,119 @@
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase
+
+import requests
+import requests_mock
+
+from zac.elasticsearch.management.metrics import IndexMetrics
+
+from ..replay import capture_notification, count_requests, is_es_write, is_local_host
+from .utils import ZAAK
+
+MESSAGE = {
+    "kanaal": "zaken",
+    "hoofd_object": ZAAK,
+    "resource": "rol",
+    "resource_url": f"{ZAAK}/rollen/1",
+    "actie": "create",
+}
+
+
+class ReplayNotificationsTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = os.path.join(tmpdir.name, "notifications.jsonl")
+
+    def test_capture_notification(self):
+        capture_notification(MESSAGE, self.path)
+        capture_notification({**MESSAGE, "actie": "destroy"}, self.path)
+
+        with open(self.path) as infile:
+            lines = [json.loads(line) for line in infile]
+
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(lines[0]["notification"], MESSAGE)
+        self.assertIn("received", lines[0])
+
+    @patch(
+        "zac.notifications.management.commands.replay_notifications.get_live_targets",
+        return_value=[],
+    )
+    @patch("zac.notifications.management.commands.replay_notifications.handler")
+    def test_replay_notifications(self, mock_handler, mock_get_live_targets):
+        capture_notification(MESSAGE, self.path)
+        # bare payloads are accepted too
+        with open(self.path, "a") as outfile:
+            outfile.write(json.dumps({**MESSAGE, "actie": "destroy"}) + "\n")
+        metrics_report = os.path.join(os.path.dirname(self.path), "metrics.json")
+
+        call_command(
+            "replay_notifications",
+            self.path,
+            rate=1000,
+            repeat=2,
+            metrics_report=metrics_report,
+            stdout=StringIO(),
+        )
+
+        self.assertEqual(mock_handler.handle.call_count, 4)
+        with open(metrics_report) as infile:
+            report = json.load(infile)
+        self.assertEqual(report["stages"]["zaken.rol.create"]["calls"], 2)
+        self.assertEqual(report["stages"]["zaken.rol.destroy"]["calls"], 2)
+        self.assertEqual(report["counters"]["handled"], 4)
+
+    @patch(
+        "zac.notifications.management.commands.replay_notifications.get_live_targets",
+        return_value=["https://es.example.nl:9200"],
+    )
+    @patch("zac.notifications.management.commands.replay_notifications.handler")
+    def test_replay_refuses_live_services(self, mock_handler, mock_get_live_targets):
+        capture_notification(MESSAGE, self.path)
+
+        with self.assertRaisesMessage(CommandError, "https://es.example.nl:9200"):
+            call_command("replay_notifications", self.path, stdout=StringIO())
+
+        mock_handler.handle.assert_not_called()
+
+        call_command(
+            "replay_notifications",
+            self.path,
+            rate=1000,
+            against_live_services=True,
+            stdout=StringIO(),
+        )
+
+        mock_handler.handle.assert_called_once_with(MESSAGE)
+
+    def test_is_local_host(self):
+        self.assertTrue(is_local_host("localhost:9200"))
+        self.assertTrue(is_local_host("http://127.0.0.1:8000/zaken/api/v1/"))
+        self.assertTrue(is_local_host("[::1]:9200"))
+        self.assertTrue(is_local_host(""))
+        self.assertFalse(is_local_host("es.example.nl:9200"))
+        self.assertFalse(is_local_host("https://open-zaak.example.nl/zaken/api/v1/"))
+
+    def test_count_requests(self):
+        metrics = IndexMetrics()
+
+        with requests_mock.Mocker() as m, count_requests(metrics):
+            m.get(ZAAK, json={})
+            requests.get(ZAAK)
+            requests.get(ZAAK)
+
+        self.assertEqual(metrics.counters, {"upstream.some.zrc.nl": 2})
+
+    def test_is_es_write(self):
+        self.assertTrue(is_es_write("POST", "/_bulk"))
+        self.assertTrue(is_es_write("POST", "/zaken/_update/1"))
+        self.assertFalse(is_es_write("POST", "/zaken/_search"))
+        self.assertFalse(is_es_write("GET", "/zaken/_doc/1"))
@@ -0,0 +1,43 @@
+from django.test import TestCase
+
+import requests_mock
+from zgw_consumers.api_models.catalogi import ZaakType
+from zgw_consumers.models import APITypes, Service
+
+from zac.core.tests.utils import ClearCachesMixin
+from zac.tests.utils import mock_resource_get
+
+from ..handlers import ZakenHandler
+from .utils import (
+    CATALOGI_ROOT,
+    STATUS,
+    ZAAK,
+    ZAAK_RESPONSE,
+    ZAAKTYPE_RESPONSE,
+    ZAKEN_ROOT,
+    mock_service_oas_get,
+)
+
+
+@requests_mock.Mocker()
+class RetrieveZaakTests(ClearCachesMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Service.objects.create(api_root=ZAKEN_ROOT, api_type=APITypes.zrc)
+        Service.objects.create(api_root=CATALOGI_ROOT, api_type=APITypes.ztc)
+
+    def test_one_upstream_call_per_zaak(self, m):
+        mock_service_oas_get(m, ZAKEN_ROOT, "zrc")
+        mock_service_oas_get(m, CATALOGI_ROOT, "ztc")
+        mock_resource_get(m, {**ZAAK_RESPONSE, "status": STATUS})
+        mock_resource_get(m, ZAAKTYPE_RESPONSE)
+
+        ZakenHandler._retrieve_zaak(ZAAK)
+        num_calls = len(m.request_history)
+        zaak = ZakenHandler._retrieve_zaak(ZAAK)
+
+        # the zaaktype comes from the cache and the status isn't retrieved
+        self.assertEqual(len(m.request_history), num_calls + 1)
+        self.assertEqual(m.last_request.url, ZAAK)
+        self.assertIsInstance(zaak.zaaktype, ZaakType)
+        self.assertEqual(zaak.status, STATUS)
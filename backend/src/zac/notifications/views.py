@@ -1,8 +1,12 @@
+from django.conf import settings
+
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from .handlers import handler
+from .queue import enqueue_notification
+from .replay import capture_notification
 from .serializers import NotificatieSerializer
 
 
@@ -21,4 +25,10 @@ class BaseNotificationCallbackView(APIView):
 
 class NotificationCallbackView(BaseNotificationCallbackView):
     def handle_notification(self, data: dict) -> None:
-        handler.handle(data)
+        if settings.NOTIFICATIONS_CAPTURE_FILE:
+            capture_notification(data, settings.NOTIFICATIONS_CAPTURE_FILE)
+
+        if settings.NOTIFICATIONS_QUEUE:
+            enqueue_notification(data)
+        else:
+            handler.handle(data)
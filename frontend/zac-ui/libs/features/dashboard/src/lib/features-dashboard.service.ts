@@ -1,7 +1,8 @@
 import { Injectable } from '@angular/core';
 import { ApplicationHttpClient } from '@gu/services';
-import { Observable } from 'rxjs';
-import { BoardItem, Dashboard } from '@gu/models';
+import { EMPTY, Observable } from 'rxjs';
+import { expand, reduce } from 'rxjs/operators';
+import { BoardItem, BoardItemList, Dashboard } from '@gu/models';
 
 @Injectable({
   providedIn: 'root',
@@ -16,7 +17,11 @@ export class FeaturesDashboardService {
 
   getBoardItems(slug): Observable<BoardItem[]> {
     const endpoint = `/api/dashboard/items?board_slug=${slug}`;
-    return this.http.Get<BoardItem[]>(endpoint);
+    // the board items are paginated, retrieve all pages
+    return this.http.Get<BoardItemList>(endpoint).pipe(
+      expand(page => page.next ? this.http.Get<BoardItemList>(page.next) : EMPTY),
+      reduce((items: BoardItem[], page) => items.concat(page.results), []),
+    );
   }
 
 
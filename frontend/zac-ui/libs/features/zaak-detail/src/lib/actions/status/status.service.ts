@@ -1,8 +1,9 @@
 import {Injectable} from '@angular/core';
 import {ApplicationHttpClient} from '@gu/services';
 import {Observable} from 'rxjs';
+import {map} from 'rxjs/operators';
 import { HttpResponse } from '@angular/common/http';
-import { BoardItem } from '@gu/models';
+import { BoardItem, BoardItemList } from '@gu/models';
 
 
 @Injectable({
@@ -30,7 +31,10 @@ export class StatusService {
    */
   getDashboardStatus(zaakUrl): Observable<BoardItem[]>  {
     const endpoint = encodeURI(`/api/dashboard/items?zaak=${zaakUrl}`);
-    return this.http.Get<BoardItem[]>(endpoint);
+    // a zaak has one item per board, these fit on the first page
+    return this.http.Get<BoardItemList>(endpoint).pipe(
+      map(page => page.results),
+    );
   }
 
   /**
@@ -64,3 +64,9 @@ export interface BoardItem {
   column: DashboardColumn;
   zaak: Zaak;
 }
+
+export interface BoardItemList {
+  next: string | null;
+  previous: string | null;
+  results: BoardItem[];
+}